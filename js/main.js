@@ -3,17 +3,114 @@
 const state = {
     games: [],
     updates: [],
+    manifest: null, // data/manifest.json (없으면 updates.json 전체 로드 후 브라우저에서 이벤트 변환)
+    shards: new Map(), // 받은 shard 파일 -> { group, events } (빌드 시 만든 FullCalendar 이벤트)
+    refresh: null, // 달력 날짜 범위가 바뀌면 호출 (필요한 shard 로드 후 이벤트 소스 갱신)
     calendar: null,
     selectedGames: new Set(), // 선택된 게임 ID들을 저장
     eventLimit: 10, // 하루 최대 이벤트 수
 };
 
-async function fetchJson(path) {
-    const res = await fetch(path, { cache: "no-store" });
+async function fetchJson(path, cache = "no-store") {
+    const res = await fetch(path, { cache });
     if (!res.ok) throw new Error(`Failed to load ${path}`);
     return await res.json();
 }
 
+// 달력에 보이는 달 목록 (YYYY-MM, 앞뒤 달의 일부 날짜 포함)
+function visibleMonths() {
+    const view = state.calendar?.view;
+    const start = dayjs(view ? view.activeStart : undefined).startOf('month');
+    const end = view ? dayjs(view.activeEnd) : start.add(1, 'month');
+    const months = [];
+    for (let m = start; m.isBefore(end); m = m.add(1, 'month')) {
+        months.push(m.format('YYYY-MM'));
+    }
+    return months;
+}
+
+// 게임 그룹 표시 여부 (선택이 없으면 filterUpdates와 같이 전체 표시)
+function groupEnabled(group) {
+    return state.selectedGames.size === 0 || state.selectedGames.has(group);
+}
+
+// 보이는 달 + 선택한 게임의 shard 파일 -> 그룹
+function neededShards() {
+    const needed = new Map();
+    for (const month of visibleMonths()) {
+        const groups = state.manifest.months[month] || {};
+        for (const [group, info] of Object.entries(groups)) {
+            if (groupEnabled(group)) needed.set(info.file, group);
+        }
+    }
+    return needed;
+}
+
+// 필요한 shard 중 아직 받지 않은 것만 로드. 새로 받은 게 있으면 true
+// shard 파일명에 내용 해시가 들어 있어 브라우저 캐시를 그대로 사용
+async function loadShards() {
+    if (!state.manifest) return false;
+    const missing = [...neededShards()].filter(([file]) => !state.shards.has(file));
+    if (!missing.length) return false;
+    const loaded = await Promise.all(missing.map(([file]) => fetchJson(`data/${file}`, "force-cache")));
+    // 3개월 지난 항목 제외 (filterUpdates와 같은 기준, 받을 때 한 번만)
+    const cutoff = dayjs().subtract(3, 'month').format('YYYY-MM-DD');
+    missing.forEach(([file, group], i) => {
+        const events = loaded[i].filter(ev => !ev.extendedProps.lastDate || ev.extendedProps.lastDate >= cutoff);
+        state.shards.set(file, { group, events });
+    });
+    return true;
+}
+
+// 받은 shard를 이벤트 소스로: 선택된 그룹은 추가, 해제된 그룹은 제거 (다른 이벤트는 그대로)
+function syncEventSources() {
+    if (!state.calendar) return;
+    for (const [file, shard] of state.shards) {
+        const source = state.calendar.getEventSourceById(file);
+        if (groupEnabled(shard.group)) {
+            if (!source && shard.events.length) state.calendar.addEventSource({ id: file, events: shard.events });
+        } else if (source) {
+            source.remove();
+        }
+    }
+}
+
+// 표시 중인 항목 수 (종료일 이벤트는 시작 이벤트와 같은 항목이므로 제외)
+function renderShardStats() {
+    const statsEl = document.getElementById("stats");
+    if (!statsEl) return;
+    let shown = 0;
+    for (const shard of state.shards.values()) {
+        if (!groupEnabled(shard.group)) continue;
+        shown += shard.events.filter(ev => ev.extendedProps.milestone !== 'end').length;
+    }
+    statsEl.textContent = `표시: ${shown} / 전체: ${state.manifest.total}`;
+}
+
+// Steam 헤더 이미지 CDN 후보 (headerImage 제외)
+function steamHeaderCandidates(gameId, headerImage) {
+    const appid = String(gameId).replace('steam_', '');
+    return [
+        `https://shared.fastly.steamstatic.com/store_item_assets/steam/apps/${appid}/header.jpg`,
+        `https://cdn.akamai.steamstatic.com/steam/apps/${appid}/header.jpg`,
+        `https://cdn.cloudflare.steamstatic.com/steam/apps/${appid}/header.jpg`,
+        `https://cdn.akamai.steamstatic.com/steam/apps/${appid}/capsule_616x353.jpg`,
+        `https://cdn.cloudflare.steamstatic.com/steam/apps/${appid}/capsule_616x353.jpg`
+    ].filter(u => u !== headerImage);
+}
+
+// 데이터에 있는 필터 그룹 (steam_all, switch_all, game_id)
+function availableGroups() {
+    if (state.manifest) return new Set(state.manifest.groups);
+    const groups = new Set();
+    state.updates.forEach(u => {
+        if (String(u.game_id).startsWith('steam_')) groups.add('steam_all');
+        else if (u.platform === 'switch') groups.add('switch_all');
+        else groups.add(u.game_id);
+    });
+    return groups;
+}
+
 function buildGameMap(games) {
     const map = new Map();
     for (const game of games) {
@@ -167,14 +264,8 @@ function populateGameFilter(games) {
     subEl.innerHTML = '';
     conEl.innerHTML = '';
     
-    // 고유한 게임 ID들
-    const gameIds = new Set();
-    state.updates.forEach(u => gameIds.add(u.game_id));
-    const steamGames = Array.from(gameIds).filter(id => id.startsWith('steam_'));
-    const switchGames = Array.from(gameIds).filter(id => {
-        const u = state.updates.find(x => x.game_id === id);
-        return u && u.platform === 'switch';
-    });
+    // 데이터에 있는 게임 그룹 (manifest 또는 전체 데이터 기준)
+    const groups = availableGroups();
     
     // 서브컬쳐 그룹
     const subcultureIds = ['nikke','ww','genshin','star_rail','zzz'];
@@ -184,10 +275,10 @@ function populateGameFilter(games) {
     });
     
     // 콘솔 그룹 (같은 줄에 Switch, Steam)
-    if (switchGames.length > 0) {
+    if (groups.has('switch_all')) {
         conEl.appendChild(createGameCheckbox('switch_all', '닌텐도 스위치', 'assets/switch.png'));
     }
-    if (steamGames.length > 0) {
+    if (groups.has('steam_all')) {
         conEl.appendChild(createGameCheckbox('steam_all', 'Steam(인기발매예정)', 'assets/steam.png'));
     }
 }
@@ -335,14 +426,18 @@ async function init() {
     console.log('=== INIT START ===');
     try {
         console.log('Loading data...');
-        const [games, updates] = await Promise.all([
+        const [games, manifest] = await Promise.all([
             fetchJson("data/games.json"),
-            fetchJson("data/updates.json"),
+            fetchJson("data/manifest.json").catch(() => null),
         ]);
-        console.log('Data loaded:', { games: games.length, updates: updates.length });
-        
         state.games = games;
-        state.updates = updates;
+        if (manifest && manifest.months) {
+            // 달력에 보이는 달의 shard만 로드 (setupCalendar 이후 loadShards)
+            state.manifest = manifest;
+        } else {
+            state.updates = await fetchJson("data/updates.json");
+        }
+        console.log('Data loaded:', { games: games.length, updates: state.manifest ? state.manifest.total : state.updates.length });
 
         const gameMap = buildGameMap(games);
         
@@ -367,19 +462,36 @@ async function init() {
         populateGameFilter(games);
         
         // updateView 함수를 먼저 정의 (bindControls에서 사용)
-        const updateView = () => {
+        // manifest가 있으면 빌드 시 만든 이벤트 shard의 이벤트 소스만 추가/제거, 없으면 전체 데이터를 변환해 다시 그리기
+        const updateView = state.manifest ? () => {
+            syncEventSources();
+            renderShardStats();
+        } : () => {
             const filtered = filterUpdates(state.updates);
             render(filtered, gameMap);
         };
+        // 필요한 shard를 받은 뒤 갱신 (게임 선택 변경, 달 이동)
+        const refreshView = async () => {
+            try {
+                await loadShards();
+            } catch (e) {
+                console.error('shard 로딩 실패:', e);
+            }
+            updateView();
+        };
         
         // 달력 설정
         setupCalendar(gameMap);
+        await loadShards();
+        state.refresh = async () => {
+            if (await loadShards()) updateView();
+        };
         
         // 초기 렌더링 (먼저 실행)
         updateView();
         
-        // 컨트롤 바인딩 (updateView를 사용)
-        bindControls(updateView);
+        // 컨트롤 바인딩 (게임 선택이 바뀌면 필요한 shard를 받은 뒤 다시 그리기)
+        bindControls(refreshView);
         
         // 체크박스들을 모두 선택된 상태로 설정하고 화면 업데이트 (시각적 동기화)
         setTimeout(() => {
@@ -422,19 +534,10 @@ function toCalendarEvents(updates, gameMap) {
                let headerCandidates = [];
                
                if (typeof u.game_id === 'string' && u.game_id.startsWith('steam_')) {
-                   // Steam 게임: CDN 후보들을 폴백으로 제공
-                   const appid = u.game_id.replace('steam_', '');
-                   const cdnCandidates = [
-                       `https://shared.fastly.steamstatic.com/store_item_assets/steam/apps/${appid}/header.jpg`,
-                       `https://cdn.akamai.steamstatic.com/steam/apps/${appid}/header.jpg`,
-                       `https://cdn.cloudflare.steamstatic.com/steam/apps/${appid}/header.jpg`,
-                       `https://cdn.akamai.steamstatic.com/steam/apps/${appid}/capsule_616x353.jpg`,
-                       `https://cdn.cloudflare.steamstatic.com/steam/apps/${appid}/capsule_616x353.jpg`
-                   ];
-                   // 현재 선택된 headerImage를 제외하고 폴백 목록 구성
-                   headerCandidates = cdnCandidates.filter(u => u !== headerImage);
+                   // Steam 게임: CDN 후보들을 폴백으로 제공 (현재 선택된 headerImage 제외)
+                   headerCandidates = steamHeaderCandidates(u.game_id, headerImage);
                    if (!headerImage) {
-                       headerImage = cdnCandidates[0];
+                       headerImage = headerCandidates[0];
                    }
                } else if (u.platform === 'switch' && headerImage) {
                    // Switch 게임: HTML 태그에서 src 추출
@@ -595,6 +698,10 @@ function setupCalendar(gameMap) {
                 // 버튼 그룹 앞에 삽입하여 겹침 방지
                 rightChunk.insertBefore(legend, rightChunk.firstChild);
             }
+            // 다른 달로 이동하면 그 달의 shard 로드
+            if (state.refresh) {
+                state.refresh().catch(e => console.error('shard 로딩 실패:', e));
+            }
         },
         eventDisplay: 'block', // 이벤트를 블록으로 표시
         showNonCurrentDates: true, // 이전/다음 달 날짜들도 표시
@@ -695,8 +802,11 @@ function setupCalendar(gameMap) {
                     };
                     // 메인 이미지 + 후보들을 모두 프록시 변형 포함으로 전개
                     let candidates = buildProxyVariants(ex.headerImage);
-                    if (Array.isArray(ex.headerCandidates)) {
-                        for (const c of ex.headerCandidates) {
+                    // 빌드 시 만든 이벤트에는 후보 목록이 없으므로 game_id로 계산
+                    const fallbacks = Array.isArray(ex.headerCandidates) ? ex.headerCandidates
+                        : (String(ex.gameId || '').startsWith('steam_') ? steamHeaderCandidates(ex.gameId, ex.headerImage) : []);
+                    if (fallbacks.length) {
+                        for (const c of fallbacks) {
                             candidates = candidates.concat(buildProxyVariants(c));
                         }
                     }
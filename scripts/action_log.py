@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+워크플로 실행 로그 (data/logs/)
+- actions-YYYY-MM.ndjson: 한 줄에 한 실행 (추가만 하고 다시 쓰지 않음)
+  월이 바뀌거나 파일이 ACTION_LOG_MAX_KB(기본 256)를 넘으면 새 파일 (actions-YYYY-MM-2.ndjson, ...)
+- summary.json: 로그 페이지용 요약 (기록할 때마다 갱신, 전체 로그를 다시 읽지 않음)
+  액션별 실행/성공 횟수와 성공률, 마지막 실행, 일별 실행/변경 건수(최근 ACTION_LOG_SUMMARY_DAYS일, 기본 90),
+  최근 실행 ACTION_LOG_RECENT(기본 30)개, 로그 파일 목록 (이전 기록은 페이지가 필요할 때 파일 단위로 받음)
+
+사용:
+  python scripts/action_log.py append --action hoyolab_events --message "..." [--status success]
+      변경 건수는 --merge-stats(기본 MERGE_STATS_PATH) 파일, 없으면 git diff 줄 수. 커밋은 git rev-parse HEAD
+  python scripts/action_log.py rebuild    # 로그 파일 전체에서 summary.json 다시 계산
+  python scripts/action_log.py migrate    # 예전 data/action_logs.json(JSON 배열)을 로그 파일로 옮기고 삭제
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional
+
+from atomic_io import atomic_write, dumps_json, file_lock, read_json
+from merge_engine import format_changes
+
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+LOG_DIR = os.path.join(ROOT, "data", "logs")
+SUMMARY_NAME = "summary.json"
+LEGACY_PATH = os.path.join(ROOT, "data", "action_logs.json")
+SUMMARY_VERSION = 1
+
+_SEGMENT = re.compile(r"^actions-(\d{4}-\d{2})(?:-(\d+))?\.ndjson$")
+_CHANGES = re.compile(r"^(\d+)\+(\d+)-(?: (\d+)~)?")
+
+
+def max_segment_bytes() -> int:
+    return int(float(os.getenv("ACTION_LOG_MAX_KB", "256")) * 1024)
+
+
+def summary_days() -> int:
+    return int(os.getenv("ACTION_LOG_SUMMARY_DAYS", "90"))
+
+
+def recent_count() -> int:
+    return int(os.getenv("ACTION_LOG_RECENT", "30"))
+
+
+def segment_name(month: str, part: int) -> str:
+    return f"actions-{month}.ndjson" if part <= 1 else f"actions-{month}-{part}.ndjson"
+
+
+def list_segments(log_dir: str = LOG_DIR) -> List[str]:
+    """로그 파일 이름 (오래된 순)"""
+    if not os.path.isdir(log_dir):
+        return []
+    found = []
+    for name in os.listdir(log_dir):
+        m = _SEGMENT.match(name)
+        if m:
+            found.append((m.group(1), int(m.group(2) or 1), name))
+    return [name for _, _, name in sorted(found)]
+
+
+def entry_counts(entry: Dict) -> Dict[str, int]:
+    """추가/갱신/삭제 건수 (merge 필드 우선, 없으면 changes 문자열 "추가+삭제-[ 갱신~]")"""
+    merge = entry.get("merge")
+    if isinstance(merge, dict):
+        return {k: int(merge.get(k) or 0) for k in ("added", "updated", "removed")}
+    m = _CHANGES.match(str(entry.get("changes") or ""))
+    if not m:
+        return {"added": 0, "updated": 0, "removed": 0}
+    return {"added": int(m.group(1)), "updated": int(m.group(3) or 0), "removed": int(m.group(2))}
+
+
+def new_summary() -> Dict:
+    return {"version": SUMMARY_VERSION, "updated": "", "total": 0, "actions": {}, "daily": {}, "recent": [],
+            "segments": []}
+
+
+def add_to_summary(summary: Dict, entry: Dict, segment: str) -> None:
+    """entry 하나를 요약에 반영 (segment: entry가 기록된 로그 파일 이름)"""
+    ts = str(entry.get("timestamp") or "")
+    ok = entry.get("status") == "success"
+    summary["total"] += 1
+    summary["updated"] = max(summary["updated"], ts)
+
+    action = summary["actions"].setdefault(str(entry.get("action") or ""), {"runs": 0, "success": 0})
+    action["runs"] += 1
+    action["success"] += 1 if ok else 0
+    action["success_rate"] = round(action["success"] / action["runs"], 4)
+    if ts >= action.get("last_run", {}).get("timestamp", ""):
+        action["last_run"] = entry
+    if ok and ts >= action.get("last_success", ""):
+        action["last_success"] = ts
+
+    day = summary["daily"].setdefault(ts[:10], {"runs": 0, "failed": 0, "added": 0, "updated": 0, "removed": 0})
+    day["runs"] += 1
+    day["failed"] += 0 if ok else 1
+    for name, n in entry_counts(entry).items():
+        day[name] += n
+
+    summary["recent"].append(entry)
+
+    rel = f"logs/{segment}"
+    segments = summary["segments"]
+    if not segments or segments[-1]["file"] != rel:
+        segments.append({"file": rel, "count": 0, "first": ts, "last": ts})
+    info = segments[-1]
+    info["count"] += 1
+    info["first"] = min(info["first"], ts) if info["first"] else ts
+    info["last"] = max(info["last"], ts)
+
+
+def trim_summary(summary: Dict) -> Dict:
+    """일별 건수는 최근 summary_days()일, 최근 실행은 recent_count()개만 유지 (요약 크기 고정)"""
+    if summary["updated"]:
+        latest = datetime.strptime(summary["updated"][:10], "%Y-%m-%d")
+        oldest = (latest - timedelta(days=summary_days() - 1)).strftime("%Y-%m-%d")
+        summary["daily"] = {day: v for day, v in sorted(summary["daily"].items()) if day >= oldest}
+    summary["recent"] = sorted(summary["recent"], key=lambda e: e.get("timestamp", ""))[-recent_count():]
+    summary["actions"] = dict(sorted(summary["actions"].items()))
+    return summary
+
+
+def read_segment(path: str) -> List[Dict]:
+    entries = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                entries.append(json.loads(line))
+    return entries
+
+
+def build_summary(log_dir: str = LOG_DIR) -> Dict:
+    """로그 파일 전체에서 요약 계산"""
+    summary = new_summary()
+    for name in list_segments(log_dir):
+        for entry in read_segment(os.path.join(log_dir, name)):
+            add_to_summary(summary, entry, name)
+    return trim_summary(summary)
+
+
+def _target_segment(log_dir: str, month: str, size: int) -> str:
+    """month의 마지막 로그 파일, 이번 줄을 더하면 최대 크기를 넘으면 다음 번호"""
+    parts = [int(_SEGMENT.match(name).group(2) or 1) for name in list_segments(log_dir)
+             if _SEGMENT.match(name).group(1) == month]
+    part = max(parts, default=1)
+    path = os.path.join(log_dir, segment_name(month, part))
+    if os.path.exists(path) and os.path.getsize(path) > 0 and os.path.getsize(path) + size > max_segment_bytes():
+        part += 1
+    return segment_name(month, part)
+
+
+def _append_lines(path: str, lines: Iterable[str]) -> None:
+    with open(path, "a", encoding="utf-8", newline="\n") as f:
+        for line in lines:
+            f.write(line + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def _line(entry: Dict) -> str:
+    return json.dumps(entry, ensure_ascii=False, separators=(",", ":"))
+
+
+def append(entry: Dict, log_dir: str = LOG_DIR) -> str:
+    """entry를 로그 파일 끝에 한 줄로 추가하고 summary.json 갱신, 기록한 파일 이름 반환"""
+    os.makedirs(log_dir, exist_ok=True)
+    summary_path = os.path.join(log_dir, SUMMARY_NAME)
+    line = _line(entry)
+    with file_lock(summary_path):
+        name = _target_segment(log_dir, str(entry["timestamp"])[:7], len(line.encode("utf-8")) + 1)
+        _append_lines(os.path.join(log_dir, name), [line])
+        summary, _ = read_json(summary_path, None)
+        if not isinstance(summary, dict) or summary.get("version") != SUMMARY_VERSION:
+            summary = build_summary(log_dir)
+        else:
+            add_to_summary(summary, entry, name)
+            trim_summary(summary)
+        atomic_write(summary_path, dumps_json(summary))
+    return name
+
+
+def migrate(legacy_path: str = LEGACY_PATH, log_dir: str = LOG_DIR) -> int:
+    """JSON 배열 로그를 월별 로그 파일로 옮기고 원본 삭제, 옮긴 건수 반환 (로그 파일이 이미 있으면 중단)"""
+    if list_segments(log_dir):
+        raise SystemExit(f"{log_dir}에 이미 로그 파일이 있어 옮기지 않음")
+    entries, _ = read_json(legacy_path, [])
+    os.makedirs(log_dir, exist_ok=True)
+    limit = max_segment_bytes()
+    name, size = "", 0
+    pending: List[str] = []
+    for entry in sorted(entries, key=lambda e: e.get("timestamp", "")):
+        line = _line(entry)
+        month = str(entry.get("timestamp") or "")[:7]
+        n = len(line.encode("utf-8")) + 1
+        if not name or _SEGMENT.match(name).group(1) != month or (size and size + n > limit):
+            if pending:
+                _append_lines(os.path.join(log_dir, name), pending)
+            same_month = name and _SEGMENT.match(name).group(1) == month
+            part = int(_SEGMENT.match(name).group(2) or 1) + 1 if same_month else 1
+            name, size, pending = segment_name(month, part), 0, []
+        pending.append(line)
+        size += n
+    if pending:
+        _append_lines(os.path.join(log_dir, name), pending)
+    atomic_write(os.path.join(log_dir, SUMMARY_NAME), dumps_json(build_summary(log_dir)))
+    if os.path.exists(legacy_path):
+        os.remove(legacy_path)
+    return len(entries)
+
+
+def _git(*args: str) -> str:
+    try:
+        return subprocess.run(["git", *args], cwd=ROOT, capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def run_entry(action: str, message: str, status: str = "success", merge_stats: Optional[str] = None) -> Dict:
+    """워크플로 실행 로그 항목 (병합 엔진 건수 우선, 없으면 git diff 줄 수)"""
+    entry: Dict = {
+        "timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "action": action,
+        "status": status,
+        "changes": "0+0-",
+    }
+    stats, _ = read_json(merge_stats, None) if merge_stats else (None, "")
+    if isinstance(stats, dict):
+        entry["changes"] = stats.get("changes") or format_changes(stats)
+        entry["merge"] = {k: stats.get(k, 0) for k in ("added", "updated", "removed")}
+    else:
+        numstat = _git("diff", "--numstat", "data/updates.json").splitlines()
+        if numstat:
+            added, removed = numstat[0].split("\t")[:2]
+            entry["changes"] = f"{added}+{removed}-"
+    entry["commit"] = _git("rev-parse", "HEAD")
+    entry["message"] = message
+    return entry
+
+
+def main():
+    parser = argparse.ArgumentParser(description="워크플로 실행 로그 (NDJSON + 요약)")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_append = sub.add_parser("append", help="실행 로그 한 줄 추가")
+    p_append.add_argument("--action", required=True)
+    p_append.add_argument("--message", required=True)
+    p_append.add_argument("--status", default="success")
+    p_append.add_argument("--merge-stats", default=os.getenv("MERGE_STATS_PATH"))
+    sub.add_parser("rebuild", help="summary.json 다시 계산")
+    sub.add_parser("migrate", help="data/action_logs.json을 로그 파일로 옮김")
+    args = parser.parse_args()
+
+    if args.command == "append":
+        entry = run_entry(args.action, args.message, args.status, args.merge_stats)
+        name = append(entry)
+        print(f"[action_log] {name}: {entry['action']} {entry['status']} {entry['changes']}")
+    elif args.command == "rebuild":
+        summary = build_summary()
+        with file_lock(os.path.join(LOG_DIR, SUMMARY_NAME)):
+            atomic_write(os.path.join(LOG_DIR, SUMMARY_NAME), dumps_json(summary))
+        print(f"[action_log] summary.json: {summary['total']}개, 로그 파일 {len(summary['segments'])}개")
+    else:
+        count = migrate()
+        print(f"[action_log] {count}개 이동, 로그 파일 {len(list_segments())}개")
+
+
+if __name__ == "__main__":
+    main()
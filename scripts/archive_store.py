@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+만료 항목 보관소 (data/archive/)
+- <연도>.json: 만료된 항목을 마지막 날짜(end_date, 없으면 update_date)의 연도별로 보관
+  이미 보관된 항목은 다시 쓰지 않고 새 항목만 끝에 추가 (보존 기간이 지난 해의 파일은 더 이상 바뀌지 않음)
+- tombstones.json: 보관한 항목의 키(merge_engine.update_key) -> 연도
+  update_store는 이 키를 upsert에서 건너뛰어, 스크래퍼가 다시 수집해도 새 항목으로 추가하지 않음
+- 만료 기준은 페이지와 같음: 마지막 날짜가 오늘로부터 ARCHIVE_RETENTION_MONTHS(기본 3)개월 전보다 이전
+  연도만("2025년") 있으면 그해 마지막 날, 연월만("2025년 8월", "2025-08") 있으면 그달 마지막 날을 마지막 날짜로 봄
+  날짜를 알 수 없는 항목(출시 예정 등)은 보관하지 않음
+- 툼스톤은 ARCHIVE_TOMBSTONE_YEARS(기본 2)년 지난 연도부터 정리 (그때쯤이면 소스 목록에서도 사라짐)
+
+실행은 scripts/compact_updates.py
+"""
+
+import json
+import os
+import re
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional
+
+from atomic_io import atomic_write, dumps_json, read_json
+from merge_engine import update_key
+
+
+ARCHIVE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data", "archive"))
+TOMBSTONES_NAME = "tombstones.json"
+
+_ISO_DATE = re.compile(r"^(\d{4})-(\d{1,2})-(\d{1,2})")
+# 연도만 또는 연월만: 2025년 / 2025년 8월 / 2025-08 / 2025.8
+_PARTIAL_DATE = re.compile(r"^(\d{4})\s*(?:년)?(?:\s*[-./]?\s*(\d{1,2})\s*월?)?\.?$")
+
+
+def retention_months() -> int:
+    return int(os.getenv("ARCHIVE_RETENTION_MONTHS", "3"))
+
+
+def tombstone_years() -> int:
+    return int(os.getenv("ARCHIVE_TOMBSTONE_YEARS", "2"))
+
+
+def archive_dir(json_path: str) -> str:
+    """updates.json과 같은 data 폴더의 archive/"""
+    return os.path.join(os.path.dirname(os.path.abspath(json_path)), "archive")
+
+
+def last_date(u: Dict) -> Optional[str]:
+    """
+    표시가 끝나는 날짜 YYYY-MM-DD (end_date, 없으면 update_date). 알 수 없으면 None
+    연도/연월만 있으면 그 기간의 마지막 날 (기간이 끝나야 만료 기준에 걸림)
+    """
+    value = str(u.get("end_date") or u.get("update_date") or "").strip()
+    m = _ISO_DATE.match(value)
+    if m:
+        return f"{m.group(1)}-{int(m.group(2)):02d}-{int(m.group(3)):02d}"
+    m = _PARTIAL_DATE.match(value)
+    if not m:
+        return None
+    year, month = int(m.group(1)), int(m.group(2) or 12)
+    if not 1 <= month <= 12:
+        return None
+    next_first = date(year + (month == 12), month % 12 + 1, 1)
+    return (next_first - timedelta(days=1)).isoformat()
+
+
+def cutoff_date(months: int, today: Optional[date] = None) -> str:
+    """today - months개월 (말일은 그 달의 마지막 날로 맞춤, dayjs().subtract(n, 'month')와 같음)"""
+    today = today or date.today()
+    index = today.year * 12 + today.month - 1 - months
+    year, month = divmod(index, 12)
+    month += 1
+    next_first = date(year + (month == 12), month % 12 + 1, 1)
+    last_day = (next_first - date(year, month, 1)).days
+    return date(year, month, min(today.day, last_day)).isoformat()
+
+
+def is_expired(u: Dict, cutoff: str) -> bool:
+    last = last_date(u)
+    return last is not None and last < cutoff
+
+
+def load_tombstones(directory: str = ARCHIVE_DIR) -> Dict[str, str]:
+    """키 -> 보관 연도 (파일이 없으면 빈 dict)"""
+    value, _ = read_json(os.path.join(directory, TOMBSTONES_NAME), {})
+    return value if isinstance(value, dict) else {}
+
+
+def ensure_archive(directory: str = ARCHIVE_DIR) -> None:
+    """보관할 항목이 없어도 tombstones.json을 만들어 둠 (워크플로의 git add data/archive가 실패하지 않도록)"""
+    path = os.path.join(directory, TOMBSTONES_NAME)
+    if not os.path.exists(path):
+        atomic_write(path, dumps_json({}))
+
+
+def archive_items(items: Iterable[Dict], directory: str = ARCHIVE_DIR) -> Dict[str, int]:
+    """
+    항목을 연도별 보관 파일에 추가하고 툼스톤 기록, 연도별 새로 보관한 건수 반환
+    같은 키가 이미 보관돼 있으면 건너뜀 (내보내기 충돌로 다시 호출돼도 중복 없음)
+    """
+    by_year: Dict[str, List[Dict]] = {}
+    for u in items:
+        last = last_date(u)
+        if last:
+            by_year.setdefault(last[:4], []).append(u)
+
+    tombstones = load_tombstones(directory)
+    counts: Dict[str, int] = {}
+    for year, entries in sorted(by_year.items()):
+        path = os.path.join(directory, f"{year}.json")
+        archived, _ = read_json(path, [])
+        known = {update_key(u) for u in archived}
+        new = []
+        for u in entries:
+            key = update_key(u)
+            tombstones[key] = year
+            if key not in known:
+                known.add(key)
+                new.append(u)
+        if new:
+            atomic_write(path, dumps_json(archived + new))
+            counts[year] = len(new)
+
+    oldest = str(date.today().year - tombstone_years())
+    tombstones = {key: year for key, year in sorted(tombstones.items()) if year >= oldest}
+    data = dumps_json(tombstones)
+    path = os.path.join(directory, TOMBSTONES_NAME)
+    try:
+        with open(path, "rb") as f:
+            changed = f.read() != data
+    except FileNotFoundError:
+        changed = True
+    if changed:
+        atomic_write(path, data)
+    return counts
+
+
+def archived_count(directory: str = ARCHIVE_DIR) -> Dict[str, int]:
+    """연도별 보관 건수"""
+    counts: Dict[str, int] = {}
+    if not os.path.isdir(directory):
+        return counts
+    for name in sorted(os.listdir(directory)):
+        if re.fullmatch(r"\d{4}\.json", name):
+            with open(os.path.join(directory, name), "r", encoding="utf-8") as f:
+                counts[name[:4]] = len(json.load(f))
+    return counts
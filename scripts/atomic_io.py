@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+동시 실행에 안전한 파일 쓰기 (data/updates.json 등 여러 스크래퍼가 함께 쓰는 파일)
+- file_lock: <파일>.lock 에 대한 프로세스 간 잠금 (POSIX fcntl / Windows msvcrt), 같은 프로세스 안에서는 재진입 가능
+- atomic_write: 같은 디렉터리 임시 파일에 쓰고 fsync 후 os.replace (중간에 죽어도 반쯤 쓴 파일이 남지 않음)
+- compare_and_swap: 읽을 때의 내용 해시와 현재 파일이 같을 때만 교체, 다르면 ConflictError
+- update_json: 읽기 -> 수정 -> compare_and_swap 을 충돌 시 재시도 (내용이 같으면 쓰지 않음)
+
+잠금 대기 시간은 DATA_LOCK_TIMEOUT(초, 기본 120)으로 변경 가능
+"""
+
+import hashlib
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+
+class ConflictError(RuntimeError):
+    """compare_and_swap 실패 (읽은 뒤 다른 프로세스가 파일을 바꿈)"""
+
+
+_locks_guard = threading.Lock()
+_locks: Dict[str, "_PathLock"] = {}
+
+
+class _PathLock:
+    """경로별 잠금: 스레드 간에는 RLock, 프로세스 간에는 잠금 파일 (첫 진입 때만 획득)"""
+
+    def __init__(self, lock_path: str):
+        self.lock_path = lock_path
+        self.rlock = threading.RLock()
+        self.depth = 0
+        self.fd: Optional[int] = None
+
+    def acquire(self, timeout: float) -> None:
+        if not self.rlock.acquire(timeout=timeout):
+            raise TimeoutError(f"lock timeout: {self.lock_path}")
+        if self.depth == 0:
+            try:
+                self.fd = _os_lock(self.lock_path, timeout)
+            except BaseException:
+                self.rlock.release()
+                raise
+        self.depth += 1
+
+    def release(self) -> None:
+        self.depth -= 1
+        if self.depth == 0 and self.fd is not None:
+            _os_unlock(self.fd)
+            self.fd = None
+        self.rlock.release()
+
+
+def _os_lock(lock_path: str, timeout: float) -> int:
+    os.makedirs(os.path.dirname(lock_path) or ".", exist_ok=True)
+    fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            if sys.platform == "win32":
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            else:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return fd
+        except OSError:
+            if time.monotonic() >= deadline:
+                os.close(fd)
+                raise TimeoutError(f"lock timeout after {timeout:.0f}s: {lock_path}")
+            time.sleep(0.05 + random.random() * 0.1)
+
+
+def _os_unlock(fd: int) -> None:
+    try:
+        if sys.platform == "win32":
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+
+def lock_timeout() -> float:
+    return float(os.getenv("DATA_LOCK_TIMEOUT", "120"))
+
+
+@contextmanager
+def file_lock(path: str, timeout: Optional[float] = None) -> Iterator[None]:
+    """path 에 대한 배타 잠금 (잠금 파일은 path + ".lock", 지우지 않고 재사용)"""
+    lock_path = os.path.abspath(path) + ".lock"
+    with _locks_guard:
+        lock = _locks.setdefault(lock_path, _PathLock(lock_path))
+    lock.acquire(lock_timeout() if timeout is None else timeout)
+    try:
+        yield
+    finally:
+        lock.release()
+
+
+def digest_bytes(data: bytes) -> str:
+    return hashlib.sha1(data).hexdigest()
+
+
+def read_bytes(path: str) -> Tuple[Optional[bytes], str]:
+    """(내용, 해시). 파일이 없으면 (None, "")"""
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except FileNotFoundError:
+        return None, ""
+    return data, digest_bytes(data)
+
+
+def file_digest(path: str) -> str:
+    """파일 내용 SHA-1 (파일이 없으면 빈 문자열)"""
+    return read_bytes(path)[1]
+
+
+def _fsync_dir(directory: str) -> None:
+    if sys.platform == "win32":
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def atomic_write(path: str, data: bytes) -> None:
+    """임시 파일 + fsync + os.replace 로 교체 (기존 파일 권한 유지)"""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    try:
+        mode = os.stat(path).st_mode & 0o777
+    except FileNotFoundError:
+        mode = 0o644
+    fd, tmp = tempfile.mkstemp(prefix="." + os.path.basename(path) + ".", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+    _fsync_dir(directory)
+
+
+def dumps_json(obj: Any) -> bytes:
+    """data/*.json 저장 형식 (ensure_ascii=False, indent=2)"""
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def compact_json(obj: Any) -> bytes:
+    """배포용 JSON (공백 없는 구분자)"""
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def compare_and_swap(path: str, expected: str, data: bytes) -> str:
+    """
+    잠금 안에서 현재 내용 해시가 expected 와 같을 때만 data 로 교체하고 새 해시 반환
+    expected 가 빈 문자열이면 파일이 없어야 함. 다르면 ConflictError
+    """
+    with file_lock(path):
+        current = file_digest(path)
+        if current != expected:
+            raise ConflictError(f"{path} changed since read ({expected[:8] or 'missing'} -> {current[:8] or 'missing'})")
+        atomic_write(path, data)
+    return digest_bytes(data)
+
+
+def read_json(path: str, default: Any = None) -> Tuple[Any, str]:
+    """(JSON 값, 읽은 내용의 해시). 파일이 없으면 (default, "")"""
+    data, digest = read_bytes(path)
+    if data is None:
+        return default, ""
+    return json.loads(data.decode("utf-8")), digest
+
+
+def update_json(path: str, mutate: Callable[[Any], Any], default: Any = None, retries: int = 5) -> Any:
+    """
+    JSON 파일 read-modify-write (낙관적 잠금)
+    mutate(현재 값)의 반환값을 compare_and_swap 으로 기록, 그 사이 파일이 바뀌었으면 다시 읽어 재시도
+    mutate 가 None 을 반환하면 쓰지 않음. 기록한 값(또는 None) 반환
+    직렬화 결과가 현재 파일과 같으면 다시 쓰지 않고 값만 반환
+    """
+    for attempt in range(1, retries + 1):
+        raw, digest = read_bytes(path)
+        value = json.loads(raw.decode("utf-8")) if raw is not None else default
+        result = mutate(value)
+        if result is None:
+            return None
+        data = dumps_json(result)
+        if data == raw:
+            return result
+        try:
+            compare_and_swap(path, digest, data)
+            return result
+        except ConflictError as e:
+            if attempt == retries:
+                raise
+            print(f"[atomic_io] {e}, 재시도 {attempt}/{retries - 1}")
+            time.sleep(random.uniform(0.05, 0.2 * attempt))
+    return None
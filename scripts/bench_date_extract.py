@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+날짜 추출 벤치마크 (ww_board_28.html, nikke_board_11.html 본문)
+- 기존: 스크래퍼 함수마다 패턴을 우선순위대로 re.search (함수마다 본문을 다시 검색)
+- date_extract: 본문당 scan 한 번 + 함수별 first
+- 두 방식의 결과(패턴, 위치, 그룹)가 같은지 확인
+
+사용: python scripts/bench_date_extract.py [--mb 8] [--post-kb 2]
+"""
+
+import argparse
+import os
+import re
+import time
+from typing import List, Optional, Tuple
+
+from date_extract import PATTERNS, first, scan
+
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+FIXTURES = ["ww_board_28.html", "nikke_board_11.html"]
+
+# 스크래퍼 함수 -> 우선순위 순 패턴 (scrape_lounge, scrape_hoyolab, scrape_hoyolab_selenium, scrape_twitter)
+CALL_SITES = {
+    "lounge.kor_dt": ("md_weekday_time", "slash_md_weekday_time", "md_time_st", "md"),
+    "lounge.kor_range": ("range_ymd_time", "range_ymd", "range_md_tight", "until_ymd"),
+    "hoyolab.find_korean_datetime": ("ymd_slash_time_utc8", "ymd_slash_time", "md_time_kst", "md"),
+    "hoyolab.find_korean_daterange": ("until_ymd_slash_time", "range_ymd_slash_time", "range_ymd_time", "range_ymd",
+                                      "range_md_from_to", "range_md"),
+    "hoyolab_selenium.find_korean_datetime": ("ymd_slash_time_kst", "md_time_kst_paren", "md"),
+    "hoyolab_selenium.find_korean_daterange": ("range_md_ascii",),
+    "twitter.extract_date_from_tweet": ("range_slash_md", "range_ymd_slash", "range_md"),
+}
+
+
+def load_posts(post_kb: int) -> List[str]:
+    """fixture HTML에서 태그를 뺀 텍스트를 게시글 크기 단위로 자름"""
+    posts = []
+    size = post_kb * 1024
+    for name in FIXTURES:
+        with open(os.path.join(ROOT, name), "r", encoding="utf-8") as f:
+            text = re.sub(r"\s*\n\s*", "\n", re.sub(r"<[^>]+>", "\n", f.read()))
+        posts += [text[i:i + size] for i in range(0, len(text), size)]
+    return posts
+
+
+def legacy_first(text: str, names: Tuple[str, ...]) -> Optional[Tuple]:
+    """기존 방식: 패턴마다 re.search (re 모듈 캐시로 컴파일 비용은 없음)"""
+    for name in names:
+        m = re.search(PATTERNS[name][0], text)
+        if m:
+            return name, m.span(), m.groups()
+    return None
+
+
+def engine_first(text: str, names: Tuple[str, ...]) -> Optional[Tuple]:
+    c = first(text, *names)
+    if c is None:
+        return None
+    spec = PATTERNS[c.pattern][0]
+    return c.pattern, (c.start, c.end), re.compile(spec).match(text, c.start).groups()
+
+
+def run(posts: List[str], fn) -> Tuple[float, List]:
+    scan.cache_clear()
+    started = time.perf_counter()
+    results = [fn(text, names) for text in posts for names in CALL_SITES.values()]
+    return time.perf_counter() - started, results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--mb", type=float, default=8, help="본문 총 크기 (fixture 반복)")
+    parser.add_argument("--post-kb", type=int, default=2, help="게시글 하나의 크기")
+    args = parser.parse_args()
+
+    base = load_posts(args.post_kb)
+    base_bytes = sum(len(p.encode("utf-8")) for p in base)
+    posts = base * max(1, int(args.mb * 1024 * 1024 / base_bytes))
+    # 같은 본문 반복이 scan 캐시에 걸리지 않도록 게시글마다 내용을 조금씩 다르게
+    posts = [f"{i}\n{p}" for i, p in enumerate(posts)]
+    mb = sum(len(p.encode("utf-8")) for p in posts) / 1024 / 1024
+
+    t_old, old = run(posts, legacy_first)
+    t_new, _ = run(posts, lambda text, names: first(text, *names))
+    _, new = run(posts, engine_first)
+    assert old == new, "결과 불일치"
+
+    hits = sum(r is not None for r in old)
+    candidates = sum(len(scan(p)) for p in base)
+    print(f"게시글 {len(posts)}개, {mb:.1f}MB, 함수 {len(CALL_SITES)}개 x 게시글 (결과 있음 {hits}건)")
+    print(f"  기존 re.search 순차: {t_old:6.2f}s ({mb / t_old:6.1f} MB/s)")
+    print(f"  scan + first:        {t_new:6.2f}s ({mb / t_new:6.1f} MB/s, {t_old / t_new:.1f}배)")
+    print(f"  fixture 원본 후보 {candidates}개")
+
+
+if __name__ == "__main__":
+    main()
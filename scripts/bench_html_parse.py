@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+HTML 파싱 벤치마크 (ww_board_28.html, nikke_board_11.html 게시판 목록 스냅샷)
+- 기존: BeautifulSoup(html, "html.parser") 전체 트리 + select / get_text
+- html_parse: 백엔드(html.parser, lxml) x 전체 트리 / 필요한 부분만(BOARD_LINKS)
+- 제목 링크와 본문 텍스트가 기존과 같은지 확인
+
+사용: python scripts/bench_html_parse.py [--repeat 20]
+"""
+
+import argparse
+import os
+import time
+
+from bs4 import BeautifulSoup
+
+import html_parse
+
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+FIXTURES = ["ww_board_28.html", "nikke_board_11.html"]
+
+
+def board_links(soup: BeautifulSoup):
+    """scrape_lounge.extract_board_posts가 보는 링크"""
+    return ([(a.get_text(strip=True), a.get("href")) for a in soup.select("a[class*='title']")],
+            [a.get("href") for a in soup.select("a[href*='detail']")])
+
+
+def timed(fn, repeat: int):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return (time.perf_counter() - started) / repeat, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    backends = ["html.parser"] + (["lxml"] if html_parse.DEFAULT_FEATURES == "lxml" else [])
+    if len(backends) == 1:
+        print("lxml 미설치: html.parser만 측정 (pip install lxml)")
+
+    for name in FIXTURES:
+        with open(os.path.join(ROOT, name), "r", encoding="utf-8") as f:
+            html = f.read()
+        kb = len(html.encode("utf-8")) / 1024
+        print(f"== {name} ({kb:.0f}KB) ==")
+
+        t_links, links = timed(lambda: board_links(BeautifulSoup(html, "html.parser")), args.repeat)
+        t_text, body = timed(lambda: BeautifulSoup(html, "html.parser").get_text("\n", strip=True), args.repeat)
+        print(f"  기존 html.parser      목록 {t_links * 1000:6.1f}ms | 텍스트 {t_text * 1000:6.1f}ms")
+
+        for backend in backends:
+            os.environ["HTML_PARSER"] = backend
+            t_full, full = timed(lambda: board_links(html_parse.parse(html)), args.repeat)
+            t_only, only = timed(lambda: board_links(html_parse.parse(html, html_parse.BOARD_LINKS)), args.repeat)
+            t_body, text = timed(lambda: html_parse.text(html), args.repeat)
+            assert full == links and only == links, f"{backend}: 링크 불일치"
+            assert text == body, f"{backend}: 텍스트 불일치"
+            print(f"  {backend:<12} 전체 트리 {t_full * 1000:6.1f}ms | <a>만 {t_only * 1000:6.1f}ms "
+                  f"({t_links / t_only:4.1f}배) | 텍스트 {t_body * 1000:6.1f}ms ({t_text / t_body:4.1f}배)")
+        os.environ.pop("HTML_PARSER", None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+병합 엔진 벤치마크 (합성 데이터)
+- 기존 scrape_comingsoon의 O(n²) is_duplicate 대비 merge_engine.dedupe
+- 10만~20만 건 이력에 대한 update_store 병합 (스크래퍼가 쓰는 UpdateStore.upsert / replace_window)
+  변경분 처리 시간이 이력 크기와 무관하게 변경분 크기에 비례하는지 확인
+
+사용: python scripts/bench_merge.py [--sizes 100000,200000] [--delta 1000]
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from typing import Dict, List
+
+from merge_engine import dedupe
+from update_store import UpdateStore
+
+
+def make_updates(n: int, seed: int = 0) -> List[Dict]:
+    rnd = random.Random(seed)
+    games = ["nikke", "ww", "zzz", "star_rail"] + [f"steam_{i}" for i in range(2000)]
+    out = []
+    for i in range(n):
+        game = rnd.choice(games)
+        out.append({
+            "game_id": game,
+            "version": f"{rnd.randint(1, 3)}.{rnd.randint(0, 9)}",
+            "update_date": f"{rnd.randint(2023, 2027)}-{rnd.randint(1, 12):02d}-{rnd.randint(1, 28):02d}",
+            "description": f"이벤트 {i} · {rnd.random():.6f}",
+            "name": f"{game} 이벤트 {i % 5000}",
+            "platform": "steam" if game.startswith("steam_") else "mobile",
+            "url": f"https://example.com/{i}",
+        })
+    return out
+
+
+def legacy_is_duplicate_dedupe(updates: List[Dict]) -> List[Dict]:
+    """scrape_comingsoon.main의 기존 중복 제거 (항목마다 결과 목록 전체 탐색)"""
+    unique: List[Dict] = []
+    for update in updates:
+        if not any(u.get("name") == update.get("name") and u.get("update_date") == update.get("update_date")
+                   and u.get("platform") == update.get("platform") for u in unique):
+            unique.append(update)
+    return unique
+
+
+def timed(fn, *args, **kwargs):
+    started = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return time.perf_counter() - started, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", default="100000,200000")
+    parser.add_argument("--delta", type=int, default=1000)
+    args = parser.parse_args()
+    sizes = [int(x) for x in args.sizes.split(",")]
+
+    print("== 중복 제거 (release 키) ==")
+    for n in (1000, 4000):
+        items = make_updates(n, seed=n)
+        t_old, old = timed(legacy_is_duplicate_dedupe, items)
+        t_new, new = timed(dedupe, items, "release")
+        assert old == new
+        print(f"  n={n:>7}: 기존 O(n²) {t_old * 1000:8.1f}ms | dedupe {t_new * 1000:6.1f}ms")
+    for n in sizes:
+        items = make_updates(n, seed=n)
+        t_new, _ = timed(dedupe, items, "release")
+        print(f"  n={n:>7}: dedupe {t_new * 1000:6.1f}ms")
+
+    print(f"\n== update_store 병합 (SQLite, 이력 n건 + 새 항목 {args.delta}건, 그중 절반은 기존 항목 갱신) ==")
+    window = lambda u: u["game_id"].startswith("steam_") and u["update_date"][5:7] in ("01", "02", "03")
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in sizes:
+            existing = make_updates(n, seed=n)
+            incoming = make_updates(args.delta // 2, seed=n + 1)
+            incoming += [{**u, "url": u["url"] + "?v=2"} for u in random.Random(n).sample(existing, args.delta // 2)]
+            store = UpdateStore(os.path.join(tmp, f"bench_{n}.db"), os.path.join(tmp, "missing.json"))
+            t_load, _ = timed(store.upsert, existing)
+            t_upsert, stats = timed(store.upsert, incoming)
+            # 교체 구간: steam_ 1~3월을 새로 수집한 결과로 교체 (scrape_comingsoon과 같은 방식)
+            fresh = [{**u, "url": u["url"] + "?v=3"} for u in incoming if window(u)]
+            t_window, wstats = timed(store.replace_window, ["steam_"], [1, 2, 3], fresh)
+            t_export, _ = timed(store.export_json, os.path.join(tmp, "out.json"))
+            store.close()
+            print(f"  n={n:>7}: 초기 적재 {t_load:6.2f}s | upsert {t_upsert * 1000:7.1f}ms "
+                  f"(+{stats['added']} ~{stats['updated']}) | replace_window {t_window * 1000:7.1f}ms "
+                  f"(-{wstats['removed']}) | 내보내기 {t_export:5.2f}s")
+
+if __name__ == "__main__":
+    main()
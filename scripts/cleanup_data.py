@@ -3,10 +3,13 @@
 데이터 정리 스크립트: 중복 제거 및 가격 정보 정리
 """
 
-import json
 import os
 from typing import Dict, List
 
+from atomic_io import file_lock, update_json
+from export_shards import export_shards
+from merge_engine import canonical_updates, release_key
+
 
 def clean_description(description: str) -> str:
     """description에서 가격 정보 제거"""
@@ -35,11 +38,7 @@ def remove_duplicates(updates: List[Dict]) -> List[Dict]:
     
     for update in updates:
         # 중복 체크 키: 이름 + 날짜 + 플랫폼
-        key = (
-            update.get("name", ""),
-            update.get("update_date", ""),
-            update.get("platform", "")
-        )
+        key = release_key(update)
         
         if key not in seen:
             seen.add(key)
@@ -50,18 +49,8 @@ def remove_duplicates(updates: List[Dict]) -> List[Dict]:
     return unique_updates
 
 
-def main():
-    """메인 함수"""
-    updates_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data", "updates.json"))
-    
-    # 기존 데이터 로드
-    try:
-        with open(updates_path, "r", encoding="utf-8") as f:
-            updates = json.load(f)
-    except Exception as e:
-        print(f"데이터 로드 실패: {e}")
-        return
-    
+def cleanup(updates: List[Dict]) -> List[Dict]:
+    """가격 정보 제거 + 중복 제거"""
     print(f"원본 데이터: {len(updates)}개 항목")
     
     # 1. description 정리 (가격 정보 제거)
@@ -82,14 +71,28 @@ def main():
     
     print(f"중복 제거: {removed_count}개 항목")
     print(f"정리 후 데이터: {len(updates)}개 항목")
+    return updates
+
+
+def main():
+    """메인 함수"""
+    updates_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data", "updates.json"))
+    
+    def mutate(updates):
+        if updates is None:
+            print("데이터 로드 실패: updates.json 없음")
+            return None
+        return canonical_updates(cleanup(updates))
     
-    # 정리된 데이터 저장
+    # 잠금 + compare-and-swap으로 저장 (정리하는 사이 스크래퍼가 파일을 바꾸면 다시 읽어 재시도)
     try:
-        with open(updates_path, "w", encoding="utf-8") as f:
-            json.dump(updates, f, ensure_ascii=False, indent=2)
-        print("데이터 정리 완료!")
+        with file_lock(updates_path):
+            updates = update_json(updates_path, mutate)
+            if updates is not None:
+                export_shards(updates)
+                print("데이터 정리 완료!")
     except Exception as e:
-        print(f"데이터 저장 실패: {e}")
+        print(f"데이터 정리 실패: {e}")
 
 
 if __name__ == "__main__":
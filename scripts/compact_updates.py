@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+updates.json 정리: 만료 항목을 data/archive/<연도>.json으로 옮기고 툼스톤 기록 (archive_store)
+- 페이지가 보여주지 않는 항목(마지막 날짜가 보존 기간 이전)을 빼서 updates.json / shard / 병합 비용을 일정하게 유지
+- updates.json 잠금 안에서 보관 -> DB에서 삭제 (update_store.apply_to_store, 스크래퍼와 동시에 실행해도 됨)
+- 마지막에 스크래퍼가 DB에만 반영한 변경과 함께 updates.json / shard를 한 번 내보냄 (update_store.export_pending)
+- 보관된 키는 이후 스크래퍼가 다시 수집해도 추가하지 않음
+
+사용: python scripts/compact_updates.py [--months 3] [--dry-run]
+"""
+
+import argparse
+import json
+from collections import Counter
+
+from archive_store import archived_count, cutoff_date, ensure_archive, is_expired, last_date, retention_months
+from update_store import UPDATES_PATH, apply_to_store, export_pending
+
+
+def main():
+    parser = argparse.ArgumentParser(description="만료 항목을 연도별 보관 파일로 옮김")
+    parser.add_argument("--months", type=int, default=retention_months(),
+                        help="보존 기간 (개월, 기본 ARCHIVE_RETENTION_MONTHS 또는 3)")
+    parser.add_argument("--dry-run", action="store_true", help="옮길 항목 수만 출력")
+    args = parser.parse_args()
+    cutoff = cutoff_date(args.months)
+
+    if args.dry_run:
+        with open(UPDATES_PATH, "r", encoding="utf-8") as f:
+            updates = json.load(f)
+        expired = Counter(last_date(u)[:4] for u in updates if is_expired(u, cutoff))
+        print(f"[compact] {len(updates)}개 중 {sum(expired.values())}개 만료 (~{cutoff}): "
+              + (", ".join(f"{year}: {n}" for year, n in sorted(expired.items())) or "없음"))
+        return
+
+    stats = apply_to_store(lambda store: store.archive_expired(cutoff), "archive")
+    export_pending()
+    ensure_archive()
+    archived = archived_count()
+    print(f"[compact] {stats['removed']}개 보관, 보관 파일: "
+          + (", ".join(f"{year}.json {n}개" for year, n in archived.items()) or "없음"))
+
+
+if __name__ == "__main__":
+    main()
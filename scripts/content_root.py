@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+게시글 본문 영역만 추출 (메뉴, 댓글, 사이드바 제외)
+- CONTENT_ROOTS: 사이트별 본문 컨테이너 선택자 후보 (앞에서부터 시도)
+  텍스트가 CONTENT_MIN_CHARS(기본 20)자 이상인 첫 요소를 본문으로 사용하고, 없으면 페이지 전체 (기존 동작)
+- soup_text(soup, site): BeautifulSoup 페이지 (scrape_lounge)
+- driver_text(driver, site): Selenium 페이지의 innerText (scrape_hoyolab)
+- 소스별 본문 크기를 모아 실행 종료 시 print_body_summary()로 출력
+  CONTENT_STATS=1 이면 페이지 전체 길이도 구해 감소량을 출력 (기본은 본문 영역을 못 찾았을 때만 페이지 전체를 읽음)
+- CONTENT_ROOT=0 이면 항상 페이지 전체
+"""
+
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from bs4 import BeautifulSoup
+
+
+CONTENT_ROOTS: Dict[str, List[str]] = {
+    # 네이버 게임 라운지 상세 (스마트에디터 본문 > CSS 모듈 클래스)
+    "lounge": [".se-main-container", "[class*='post_content']", "[class*='detail_content']",
+               "[class*='article_content']", "article"],
+    # HoYoLAB 게시글 상세
+    "hoyolab": [".mhy-article-page__content", ".mhy-article-page .ql-editor", "[class*='article-page__content']",
+                ".ql-editor", "article"],
+}
+
+# 선택자 후보 중 innerText가 충분한 첫 요소, 없으면 body (전체 길이는 stats일 때만, 아니면 null)
+_ROOT_JS = """
+var selectors = arguments[0], minChars = arguments[1], stats = arguments[2];
+var fullText = function () { return document.body ? document.body.innerText : ""; };
+for (var i = 0; i < selectors.length; i++) {
+    var el = document.querySelector(selectors[i]);
+    var text = el ? el.innerText : "";
+    if (text && text.trim().length >= minChars) return [text, selectors[i], stats ? fullText().length : null];
+}
+var full = fullText();
+return [full, "", full.length];
+"""
+
+_stats_lock = threading.Lock()
+_stats: Dict[str, Dict[str, int]] = {}
+
+
+def enabled() -> bool:
+    return os.getenv("CONTENT_ROOT", "1") != "0"
+
+
+def min_chars() -> int:
+    return int(os.getenv("CONTENT_MIN_CHARS", "20"))
+
+
+def stats_enabled() -> bool:
+    return os.getenv("CONTENT_STATS", "0") == "1"
+
+
+def _record(source: str, full: Optional[int], kept: int, root: str) -> None:
+    """full은 페이지 전체 길이 (stats가 꺼져 있고 본문 영역을 찾았으면 None)"""
+    with _stats_lock:
+        s = _stats.setdefault(source, {"posts": 0, "fallback": 0, "measured": 0, "full": 0, "kept": 0})
+        s["posts"] += 1
+        s["fallback"] += 0 if root else 1
+        s["kept"] += kept
+        if stats_enabled() and full is not None:
+            s["measured"] += 1
+            s["full"] += full
+
+
+def soup_text(soup: BeautifulSoup, site: str, source: str = "") -> Tuple[str, str]:
+    """(본문 텍스트, 사용한 선택자 - 페이지 전체면 "")"""
+    if enabled():
+        for selector in CONTENT_ROOTS.get(site, []):
+            el = soup.select_one(selector)
+            text = el.get_text("\n", strip=True) if el else ""
+            if len(text) >= min_chars():
+                full = len(soup.get_text("\n", strip=True)) if stats_enabled() else None
+                _record(source or site, full, len(text), selector)
+                return text, selector
+    full = soup.get_text("\n", strip=True)
+    _record(source or site, len(full), len(full), "")
+    return full, ""
+
+
+def driver_text(driver, site: str, source: str = "") -> Tuple[str, str]:
+    """Selenium 페이지에서 (본문 innerText, 사용한 선택자 - 페이지 전체면 "")"""
+    selectors = CONTENT_ROOTS.get(site, []) if enabled() else []
+    text, selector, full = driver.execute_script(_ROOT_JS, selectors, min_chars(), stats_enabled())
+    _record(source or site, full, len(text or ""), selector)
+    return text or "", selector
+
+
+def body_stats() -> Dict[str, Dict[str, int]]:
+    with _stats_lock:
+        return {source: dict(s) for source, s in _stats.items()}
+
+
+def print_body_summary() -> None:
+    """실행 종료 시 소스별 본문 크기 출력 (CONTENT_STATS=1 이면 페이지 전체 대비 감소량도)"""
+    for source, s in sorted(body_stats().items()):
+        line = f"[body] {source}: 게시글 {s['posts']}개 (페이지 전체 사용 {s['fallback']}개), 본문 {s['kept']:,}자"
+        if s["measured"] == s["posts"] and s["full"]:
+            line += f" (페이지 전체 {s['full']:,}자에서 {1 - s['kept'] / s['full']:.0%} 감소)"
+        print(line)
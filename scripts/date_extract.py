@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+한국어 날짜/기간 추출 (스크래퍼 공용)
+- 각 스크래퍼가 쓰던 패턴(kor_dt, kor_range, find_korean_datetime, find_korean_daterange, extract_date_from_tweet)을
+  PATTERNS 한 곳에 모아 한 번만 컴파일
+- scan(text): 본문을 한 번 훑어 모든 날짜/기간 후보를 위치, 종류, 신뢰도와 함께 반환
+  날짜가 시작될 수 있는 위치(4자리 연도+/, 연도+년, N월, N/N, "업데이트")를 하나의 전방 탐색 정규식으로 찾고
+  그 위치에서만 해당 계열 패턴을 match (패턴마다 본문 전체를 다시 검색하지 않음)
+  같은 본문은 최근 결과를 재사용하므로 한 게시글에서 여러 함수를 불러도 한 번만 훑음
+- first(text, *names): names 순서대로 후보가 있는 첫 패턴의 가장 앞 후보 (기존 re.search 순차 호출과 같은 결과)
+
+벤치마크: python scripts/bench_date_extract.py
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+
+# 이름 -> (정규식, 후보 종류, 그룹 의미, 신뢰도)
+# 그룹 의미: y/m/d/H/M (시작 또는 단일 날짜), y2/m2/d2 (종료), "-"는 사용하지 않는 그룹
+# 종류: datetime(시간 포함), date, range(시작~종료), until(종료일만)
+PATTERNS: Dict[str, Tuple[str, str, Tuple[str, ...], float]] = {
+    # 단일 날짜/시간
+    "md_weekday_time": (r"(\d{1,2})\s*월\s*(\d{1,2})\s*일\s*\([^)]+\)\s*(\d{1,2}):(\d{2})",
+                        "datetime", ("m", "d", "H", "M"), 0.8),
+    "slash_md_weekday_time": (r"(\d{1,2})/(\d{1,2})\s*\([^)]+\)\s*(\d{1,2}):(\d{2})",
+                              "datetime", ("m", "d", "H", "M"), 0.7),
+    "md_time_st": (r"(\d{1,2})\s*월\s*(\d{1,2})\s*일\s*(\d{1,2})(?::(\d{2}))?\s*\(K?ST\)?",
+                   "datetime", ("m", "d", "H", "M"), 0.75),
+    "md_time_kst": (r"(\d{1,2})\s*월\s*(\d{1,2})\s*일\s*(\d{1,2})[:：]\s*(\d{2})\s*[\(（]?\s*KST\s*[\)）]?",
+                    "datetime", ("m", "d", "H", "M"), 0.8),
+    "md_time_kst_paren": (r"(\d{1,2})\s*월\s*(\d{1,2})\s*일\s*(\d{1,2}):(\d{2})\s*\(KST\)",
+                          "datetime", ("m", "d", "H", "M"), 0.85),
+    "md": (r"(\d{1,2})\s*월\s*(\d{1,2})\s*일", "date", ("m", "d"), 0.5),
+    "ymd_slash_time_utc8": (r"(\d{4})/(\d{1,2})/(\d{1,2})\s+(\d{1,2}):(\d{2})\s*[\(（]?\s*UTC\+8\s*[\)）]?",
+                            "datetime", ("y", "m", "d", "H", "M"), 0.9),
+    "ymd_slash_time_kst": (r"(\d{4})/(\d{1,2})/(\d{1,2})\s+(\d{1,2}):(\d{2})\s*\(KST\)",
+                           "datetime", ("y", "m", "d", "H", "M"), 0.95),
+    "ymd_slash_time": (r"(\d{4})/(\d{1,2})/(\d{1,2})\s+(\d{1,2}):(\d{2})",
+                       "datetime", ("y", "m", "d", "H", "M"), 0.85),
+    # 기간
+    "range_ymd_time": (r"(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일\s*\d{1,2}:\d{2}\s*[~\-–—]\s*"
+                       r"(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일\s*\d{1,2}:\d{2}",
+                       "range", ("y", "m", "d", "y2", "m2", "d2"), 0.95),
+    "range_ymd": (r"(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일\s*[~\-–—]\s*(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일",
+                  "range", ("y", "m", "d", "y2", "m2", "d2"), 0.9),
+    "range_ymd_slash_time": (r"(\d{4})/(\d{1,2})/(\d{1,2})\s+\d{1,2}:\d{2}\s*[~\-–—]\s*"
+                             r"(\d{4})/(\d{1,2})/(\d{1,2})\s+\d{1,2}:\d{2}",
+                             "range", ("y", "m", "d", "y2", "m2", "d2"), 0.95),
+    "range_ymd_slash": (r"(\d{4})/(\d{1,2})/(\d{1,2})\s*[~\-–—]\s*(\d{4})/(\d{1,2})/(\d{1,2})",
+                        "range", ("y", "m", "d", "y2", "m2", "d2"), 0.9),
+    "range_md": (r"(\d{1,2})\s*월\s*(\d{1,2})\s*일\s*[~\-–—]\s*(\d{1,2})\s*월\s*(\d{1,2})\s*일",
+                 "range", ("m", "d", "m2", "d2"), 0.7),
+    "range_md_tight": (r"(\d{1,2})월\s*(\d{1,2})일\s*[~\-–—]\s*(\d{1,2})월\s*(\d{1,2})일",
+                       "range", ("m", "d", "m2", "d2"), 0.7),
+    "range_md_ascii": (r"(\d{1,2})\s*월\s*(\d{1,2})\s*일\s*[~\-]\s*(\d{1,2})\s*월\s*(\d{1,2})\s*일",
+                       "range", ("m", "d", "m2", "d2"), 0.7),
+    "range_md_from_to": (r"(\d{1,2})\s*월\s*(\d{1,2})\s*일\s*부터.*?(\d{1,2})\s*월\s*(\d{1,2})\s*일\s*까지",
+                         "range", ("m", "d", "m2", "d2"), 0.75),
+    "range_slash_md": (r"(\d{1,2})/(\d{1,2})\s*[~\-–—]\s*(\d{1,2})/(\d{1,2})",
+                       "range", ("m", "d", "m2", "d2"), 0.6),
+    "until_ymd": (r"업데이트\s*이후.*?(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일",
+                  "until", ("y2", "m2", "d2"), 0.6),
+    "until_ymd_slash_time": (r"업데이트\s*(?:후|이후).*?[~\-–—]\s*(\d{4})/(\d{1,2})/(\d{1,2})\s+\d{1,2}:\d{2}",
+                             "until", ("y2", "m2", "d2"), 0.7),
+}
+
+# 시작 위치 계열 -> 그 위치에서 시도할 패턴 (계열끼리는 같은 위치에서 겹치지 않음)
+_FAMILIES: Dict[str, List[str]] = {
+    "ymd_slash": ["ymd_slash_time_utc8", "ymd_slash_time_kst", "ymd_slash_time", "range_ymd_slash_time",
+                  "range_ymd_slash"],
+    "ymd_kor": ["range_ymd_time", "range_ymd"],
+    "md_kor": ["md_weekday_time", "md_time_st", "md_time_kst", "md_time_kst_paren", "md", "range_md",
+               "range_md_tight", "range_md_ascii", "range_md_from_to"],
+    "md_slash": ["slash_md_weekday_time", "range_slash_md"],
+    "update": ["until_ymd", "until_ymd_slash_time"],
+}
+_TRIGGER = re.compile(
+    r"(?=(?P<ymd_slash>\d{4}/)|(?P<ymd_kor>\d{4}년)|(?P<md_kor>\d{1,2}\s*월)|(?P<md_slash>\d{1,2}/\d)"
+    r"|(?P<update>업데이트))"
+)
+_COMPILED = {name: re.compile(spec[0]) for name, spec in PATTERNS.items()}
+_FAMILY_PATTERNS = {family: [(name, _COMPILED[name]) for name in names] for family, names in _FAMILIES.items()}
+
+
+class DateCandidate:
+    """scan 결과 하나 (fields: y/m/d/H/M/y2/m2/d2 중 패턴에 있는 값, 없는 시/분은 None)"""
+
+    __slots__ = ("pattern", "kind", "start", "end", "text", "fields", "confidence")
+
+    def __init__(self, pattern: str, match: "re.Match", text: str):
+        _, kind, roles, confidence = PATTERNS[pattern]
+        self.pattern = pattern
+        self.kind = kind
+        self.start, self.end = match.span()
+        self.text = match.group(0)
+        self.fields: Dict[str, Optional[int]] = {}
+        for role, value in zip(roles, match.groups()):
+            if role != "-":
+                self.fields[role] = int(value) if value is not None else None
+        # 숫자 중간에서 시작한 후보 (예: "123월"의 "23월")는 신뢰도 낮춤
+        if self.start and text[self.start - 1].isdigit():
+            confidence -= 0.3
+        self.confidence = round(confidence, 2)
+
+    def __getitem__(self, role: str) -> Optional[int]:
+        return self.fields.get(role)
+
+    def __repr__(self) -> str:
+        return f"DateCandidate({self.pattern}, {self.start}-{self.end}, {self.fields}, {self.confidence})"
+
+
+@lru_cache(maxsize=32)
+def scan(text: str) -> Tuple[DateCandidate, ...]:
+    """본문의 모든 날짜/기간 후보 (시작 위치 순, 같은 위치는 PATTERNS 순)"""
+    out: List[DateCandidate] = []
+    for trigger in _TRIGGER.finditer(text):
+        pos = trigger.start()
+        for name, pattern in _FAMILY_PATTERNS[trigger.lastgroup]:
+            m = pattern.match(text, pos)
+            if m:
+                out.append(DateCandidate(name, m, text))
+    return tuple(out)
+
+
+def first(text: str, *names: str) -> Optional[DateCandidate]:
+    """names 중 후보가 있는 첫 패턴의 가장 앞 후보 (패턴 순서가 우선순위)"""
+    found: Dict[str, DateCandidate] = {}
+    for c in scan(text or ""):
+        if c.pattern not in found:
+            found[c.pattern] = c
+    for name in names:
+        if name in found:
+            return found[name]
+    return None
+
+
+def ymd(year: int, month: int, day: int) -> str:
+    return f"{year}-{month:02d}-{day:02d}"
@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""
+Selenium WebDriver 풀 (모든 스크래퍼 공용)
+Chrome 기동 비용을 워커당 1회로 줄이기 위해 드라이버를 임대/반납 방식으로 재사용
+"""
+
+import atexit
+import itertools
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+
+
+DEFAULT_USER_AGENT = "Mozilla/5.0 (compatible; subculture-news/1.0)"
+DEBUG_PORT_BASE = 9222
+
+# 풀이 여러 개여도 디버깅 포트가 겹치지 않도록 프로세스 전역으로 슬롯 번호 발급
+_slot_counter = itertools.count(1)
+
+
+def build_chrome_options(user_agent: str = DEFAULT_USER_AGENT, debug_port: Optional[int] = None) -> Options:
+    """공용 Chrome 옵션 (헤드리스 + 봇 탐지 회피)"""
+    chrome_options = Options()
+    chrome_options.add_argument("--headless")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--window-size=1920,1080")
+    chrome_options.add_argument(f"--user-agent={user_agent}")
+    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+    # 환경에 따른 추가 옵션 (GitHub Actions에서만 적용)
+    if os.getenv('GITHUB_ACTIONS'):
+        chrome_options.add_argument("--disable-extensions")
+        chrome_options.add_argument("--disable-plugins")
+        chrome_options.add_argument("--disable-images")
+        # 여러 인스턴스가 동시에 뜰 수 있으므로 인스턴스마다 다른 포트 사용
+        if debug_port:
+            chrome_options.add_argument(f"--remote-debugging-port={debug_port}")
+        chrome_options.add_argument("--disable-background-timer-throttling")
+        chrome_options.add_argument("--disable-renderer-backgrounding")
+        chrome_options.add_argument("--disable-backgrounding-occluded-windows")
+    return chrome_options
+
+
+def create_driver(user_agent: str = DEFAULT_USER_AGENT, debug_port: Optional[int] = None):
+    """Chrome WebDriver 생성 (webdriver-manager 우선, 실패 시 기본 드라이버)"""
+    chrome_options = build_chrome_options(user_agent, debug_port)
+    try:
+        from webdriver_manager.chrome import ChromeDriverManager
+        from selenium.webdriver.chrome.service import Service
+        service = Service(ChromeDriverManager().install())
+        driver = webdriver.Chrome(service=service, options=chrome_options)
+    except Exception as e:
+        print(f"WebDriver Manager failed, trying default: {e}")
+        driver = webdriver.Chrome(options=chrome_options)
+
+    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    return driver
+
+
+class PooledDriver:
+    """풀에서 임대한 드라이버 래퍼 (get() 호출 수를 세어 재활용 시점을 판단)"""
+
+    def __init__(self, driver, slot: int):
+        self._driver = driver
+        self.slot = slot
+        self.page_loads = 0
+
+    @property
+    def raw(self):
+        return self._driver
+
+    def get(self, url: str) -> None:
+        self.page_loads += 1
+        self._driver.get(url)
+
+    def __getattr__(self, name):
+        return getattr(self._driver, name)
+
+
+class _WorkerLease:
+    """DriverPool.worker_lease()의 임대 상태 (renew(): max_page_loads에 도달한 드라이버는 반납하고 새로 임대)"""
+
+    def __init__(self, pool: "DriverPool"):
+        self.pool = pool
+        self.driver: Optional[PooledDriver] = None
+
+    def renew(self, todo: "queue.Queue", job) -> PooledDriver:
+        """job을 처리할 드라이버. 새로 임대하다 실패하면 job을 todo에 되돌려 다른 워커가 처리하도록 함"""
+        if self.driver is not None and self.driver.page_loads >= self.pool.max_page_loads:
+            driver, self.driver = self.driver, None
+            self.pool.release(driver)
+        if self.driver is None:
+            try:
+                self.driver = self.pool.acquire()
+            except Exception:
+                todo.put(job)
+                raise
+        return self.driver
+
+
+class DriverPool:
+    """
+    Chrome 드라이버 풀
+    - lease(): 컨텍스트 매니저로 따뜻한(warm) 드라이버 임대
+    - 반납 시 쿠키/추가 탭을 정리해 다음 게시판에 상태가 새지 않도록 초기화
+    - max_page_loads 회 페이지 로드 후에는 드라이버를 종료하고 새로 기동 (메모리 누수 방지)
+    """
+
+    def __init__(self, size: int = 1, max_page_loads: int = 50, user_agent: str = DEFAULT_USER_AGENT):
+        self.size = max(1, size)
+        self.max_page_loads = max(1, max_page_loads)
+        self.user_agent = user_agent
+        self._idle: "queue.LifoQueue[PooledDriver]" = queue.LifoQueue()
+        self._slots = threading.Semaphore(self.size)
+        self._lock = threading.Lock()
+        self._live: list = []
+        self.launches = 0
+        self._closed = False
+
+    def _launch(self) -> PooledDriver:
+        slot = next(_slot_counter)
+        driver = create_driver(self.user_agent, DEBUG_PORT_BASE + slot)
+        pooled = PooledDriver(driver, slot)
+        with self._lock:
+            self._live.append(pooled)
+            self.launches += 1
+        print(f"[driver_pool] Chrome 기동 (slot={slot}, 누적 {self.launches}회)")
+        return pooled
+
+    def _retire(self, pooled: PooledDriver) -> None:
+        with self._lock:
+            if pooled in self._live:
+                self._live.remove(pooled)
+        try:
+            pooled.raw.quit()
+        except Exception:
+            pass
+
+    def _reset(self, pooled: PooledDriver) -> bool:
+        """다음 임대를 위한 상태 초기화. 실패하면 False (드라이버 폐기)"""
+        try:
+            handles = pooled.window_handles
+            for handle in handles[1:]:
+                pooled.switch_to.window(handle)
+                pooled.close()
+            pooled.switch_to.window(handles[0])
+            pooled.delete_all_cookies()
+            pooled.raw.get("about:blank")
+            return True
+        except Exception as e:
+            print(f"[driver_pool] 드라이버 초기화 실패, 폐기: {e}")
+            return False
+
+    def ensure_capacity(self, size: int) -> None:
+        """동시 임대 가능 수를 최소 size로 확장 (병렬 워커 수에 맞춤)"""
+        with self._lock:
+            extra = size - self.size
+            if extra <= 0:
+                return
+            self.size = size
+        for _ in range(extra):
+            self._slots.release()
+
+    def acquire(self) -> PooledDriver:
+        if self._closed:
+            raise RuntimeError("DriverPool is closed")
+        self._slots.acquire()
+        try:
+            try:
+                return self._idle.get_nowait()
+            except queue.Empty:
+                return self._launch()
+        except Exception:
+            self._slots.release()
+            raise
+
+    def release(self, pooled: PooledDriver) -> None:
+        try:
+            if self._closed:
+                self._retire(pooled)
+            elif pooled.page_loads >= self.max_page_loads:
+                print(f"[driver_pool] slot={pooled.slot} 페이지 {pooled.page_loads}회 로드, 재활용")
+                self._retire(pooled)
+            elif self._reset(pooled):
+                self._idle.put(pooled)
+            else:
+                self._retire(pooled)
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def lease(self):
+        """with pool.lease() as driver: ... 형태로 드라이버 임대"""
+        pooled = self.acquire()
+        try:
+            yield pooled
+        finally:
+            self.release(pooled)
+
+    @contextmanager
+    def worker_lease(self):
+        """
+        한 번 임대해 여러 페이지를 여는 워커용: 항목마다 lease.renew(todo, job)으로 드라이버를 받으면
+        max_page_loads회 로드한 드라이버는 임대가 끝날 때까지 기다리지 않고 재활용 (끝나면 마지막 드라이버 반납)
+        """
+        lease = _WorkerLease(self)
+        try:
+            yield lease
+        finally:
+            if lease.driver is not None:
+                self.release(lease.driver)
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        with self._lock:
+            live = list(self._live)
+        for pooled in live:
+            self._retire(pooled)
+        if self.launches:
+            print(f"[driver_pool] 종료 (Chrome 기동 총 {self.launches}회)")
+
+
+def map_with_drivers(fn: Callable, items: Iterable, workers: int = 1, pool: Optional[DriverPool] = None) -> List:
+    """
+    items를 최대 workers개의 드라이버에 나눠 fn(driver, item)을 병렬 실행하고 입력 순서대로 결과 반환
+    워커마다 드라이버를 한 번만 임대하므로 게시글마다 초기화 비용이 들지 않음
+    fn은 자체적으로 예외를 처리해야 함 (드라이버 자체가 죽으면 해당 워커만 종료되고 나머지 워커가 이어서 처리)
+    """
+    items = list(items)
+    results: List = [None] * len(items)
+    if not items:
+        return results
+    pool = pool or get_pool()
+    workers = max(1, min(workers, len(items)))
+    pool.ensure_capacity(workers)
+
+    todo: "queue.Queue" = queue.Queue()
+    for i, item in enumerate(items):
+        todo.put((i, item))
+
+    def worker() -> None:
+        with pool.worker_lease() as lease:
+            while True:
+                try:
+                    i, item = todo.get_nowait()
+                except queue.Empty:
+                    return
+                results[i] = fn(lease.renew(todo, (i, item)), item)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(worker) for _ in range(workers)]
+        errors = [f.exception() for f in futures]
+    if all(errors):
+        raise errors[0]
+    for err in errors:
+        if err:
+            print(f"[driver_pool] 워커 오류: {err}")
+    return results
+
+
+def imap_with_drivers(fn: Callable, items: Iterable, workers: int = 1, pool: Optional[DriverPool] = None,
+                      ahead: Optional[int] = None) -> Iterator:
+    """
+    map_with_drivers의 스트리밍 버전: 결과를 입력 순서대로, 앞선 항목이 끝나는 대로 하나씩 내보냄
+    소비되지 않은 결과는 최대 ahead개(기본 workers*2)까지만 미리 처리 (소비가 느리면 워커가 대기)
+    드라이버가 죽은 워커의 항목은 None, 모든 워커가 죽어 더 진행할 수 없으면 첫 오류를 다시 발생
+    """
+    items = list(items)
+    if not items:
+        return
+    pool = pool or get_pool()
+    workers = max(1, min(workers, len(items)))
+    pool.ensure_capacity(workers)
+
+    todo: "queue.Queue" = queue.Queue()
+    for i, item in enumerate(items):
+        todo.put((i, item))
+    permits = threading.Semaphore(max(workers, ahead or workers * 2))
+    stop = threading.Event()
+    ready = threading.Condition()
+    done: Dict[int, object] = {}
+    errors: List[BaseException] = []
+    alive = [workers]
+
+    def worker() -> None:
+        try:
+            with pool.worker_lease() as lease:
+                while not stop.is_set():
+                    permits.acquire()
+                    try:
+                        i, item = todo.get_nowait()
+                    except queue.Empty:
+                        permits.release()
+                        return
+                    try:
+                        driver = lease.renew(todo, (i, item))
+                    except Exception:
+                        permits.release()
+                        raise
+                    try:
+                        result = fn(driver, item)
+                    except Exception:
+                        with ready:
+                            done[i] = None
+                            ready.notify_all()
+                        raise
+                    with ready:
+                        done[i] = result
+                        ready.notify_all()
+        except Exception as e:
+            print(f"[driver_pool] 워커 오류: {e}")
+            errors.append(e)
+        finally:
+            with ready:
+                alive[0] -= 1
+                ready.notify_all()
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for _ in range(workers):
+            executor.submit(worker)
+        try:
+            for i in range(len(items)):
+                with ready:
+                    while i not in done and alive[0]:
+                        ready.wait()
+                    if i not in done:
+                        raise errors[0] if errors else RuntimeError("driver workers exited early")
+                    result = done.pop(i)
+                permits.release()
+                yield result
+        finally:
+            # 소비가 중간에 멈추면 워커는 처리 중인 항목까지만 끝내고 종료
+            stop.set()
+            for _ in range(workers):
+                permits.release()
+
+
+_shared_pools: Dict[str, DriverPool] = {}
+_shared_lock = threading.Lock()
+
+
+def get_pool(user_agent: str = DEFAULT_USER_AGENT) -> DriverPool:
+    """프로세스 공용 드라이버 풀 (User-Agent별 1개, DRIVER_POOL_SIZE / DRIVER_MAX_PAGE_LOADS 환경변수로 조정)"""
+    with _shared_lock:
+        pool = _shared_pools.get(user_agent)
+        if pool is None or pool._closed:
+            pool = DriverPool(
+                size=int(os.getenv("DRIVER_POOL_SIZE", "1")),
+                max_page_loads=int(os.getenv("DRIVER_MAX_PAGE_LOADS", "50")),
+                user_agent=user_agent,
+            )
+            _shared_pools[user_agent] = pool
+            atexit.register(pool.close)
+        return pool
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+프론트엔드용 달력 이벤트 내보내기 (data/manifest.json + data/shards/)
+- updates.json 항목을 바로 그릴 수 있는 FullCalendar 이벤트 객체로 변환 (제목, 색상, 헤더 이미지, allDay 확정)
+  시작/종료일이 다른 날이면 시작 이벤트 + 종료 이벤트(빨간색) 두 개
+- 이벤트 날짜의 월(YYYY-MM) x 게임 그룹 단위 shard (공백 없는 JSON), 파일명에 내용 해시 포함
+  (내용이 같으면 파일명도 같아 브라우저 캐시를 계속 사용, 바뀌면 새 파일명)
+- 게임 그룹은 js/main.js 필터와 같은 키: steam_* -> "steam_all", 스위치 -> "switch_all", 그 외 game_id
+  페이지는 체크박스가 바뀌면 해당 그룹 shard의 이벤트 소스만 추가/제거
+- 월을 알 수 없는 날짜(연도만, 출시 예정 등)는 달력에 그릴 수 없어 제외 (manifest total에는 포함)
+- manifest.json만 매번 새로 받고 shard는 보이는 달/선택한 게임만 받음
+
+제목/썸네일은 data/games.json 기준이라 games.json만 바꿨을 때는 직접 다시 실행.
+updates.json을 쓰는 곳(update_store.export_pending, cleanup_data)에서 함께 호출.
+직접 실행: python scripts/export_shards.py
+"""
+
+import json
+import os
+import re
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from atomic_io import atomic_write, compact_json, digest_bytes, dumps_json, read_bytes
+
+
+DATA_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data"))
+SHARD_SUBDIR = "shards"
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 2
+
+# js/main.js 범례와 같은 색상: 업데이트(파랑), 방송(황금), 신규발매(초록), 종료(빨강)
+TYPE_COLORS = {"update": "#0d6efd", "broadcast": "#ffc107", "release": "#198754"}
+END_COLOR = "#dc3545"
+STEAM_HEADER_URL = "https://shared.fastly.steamstatic.com/store_item_assets/steam/apps/{appid}/header.jpg"
+_IMG_SRC = re.compile(r'src="([^"]+)"')
+
+_ISO_MONTH = re.compile(r"^(\d{4})-(\d{1,2})(?:-|$|T)")
+
+
+def month_key(value) -> Optional[str]:
+    """YYYY-MM-DD... -> "YYYY-MM" (그 외 형식은 None)"""
+    m = _ISO_MONTH.match(str(value or ""))
+    return f"{m.group(1)}-{int(m.group(2)):02d}" if m else None
+
+
+def shard_group(u: Dict) -> str:
+    """js/main.js filterUpdates의 필터 키"""
+    game_id = str(u.get("game_id") or "")
+    if game_id.startswith("steam_"):
+        return "steam_all"
+    if u.get("platform") == "switch":
+        return "switch_all"
+    return game_id
+
+
+def event_type(u: Dict) -> str:
+    """업데이트 / 공식방송 / 신규발매"""
+    desc = str(u.get("description") or "")
+    link = str(u.get("url") or "").lower()
+    if any(k in desc for k in ("방송", "프로그램", "라이브")) or "youtube.com" in link or "youtu.be" in link:
+        return "broadcast"
+    game_id = str(u.get("game_id") or "")
+    if game_id.startswith(("steam_", "coming_")) or "발매예정" in desc:
+        return "release"
+    return "update"
+
+
+def header_image(u: Dict) -> str:
+    """툴팁 헤더 이미지 (Steam은 CDN 기본 주소, 스위치는 <img> 태그에서 src 추출). 나머지 CDN 후보는 페이지에서 game_id로 계산"""
+    image = u.get("header_image") or u.get("headerImage") or ""
+    game_id = str(u.get("game_id") or "")
+    if game_id.startswith("steam_"):
+        return image or STEAM_HEADER_URL.format(appid=game_id.replace("steam_", "", 1))
+    if u.get("platform") == "switch" and image:
+        m = _IMG_SRC.search(image)
+        if m:
+            return m.group(1)
+    return image
+
+
+def _is_timed(value) -> bool:
+    return isinstance(value, str) and "T" in value
+
+
+def to_calendar_events(u: Dict, games: Dict[str, Dict]) -> List[Dict]:
+    """
+    항목 -> FullCalendar 이벤트 목록 (js/main.js toCalendarEvents와 같은 결과)
+    빈 값은 생략하고, extendedProps.lastDate(종료일 또는 시작일)로 페이지가 3개월 지난 항목을 숨김
+    """
+    game_id = str(u.get("game_id") or "")
+    game = games.get(game_id) or {}
+    name = u.get("name") or ""
+    title = game.get("name") or (name if name.strip() else None) or game_id
+    kind = event_type(u)
+    color = TYPE_COLORS[kind]
+    start, end = u.get("update_date") or "", u.get("end_date") or ""
+    last = (end if end else start)[:10] if month_key(end if end else start) else ""
+
+    props = {
+        "gameId": game_id,
+        "description": u.get("description") or "",
+        "version": u.get("version") or "",
+        "thumb": game.get("thumbnail") or "",
+        "url": u.get("url") or "",
+        "isNew": game_id.startswith(("steam_", "coming_")),
+        "platform": u.get("platform") or "steam",
+        "name": name or game.get("name") or title,
+        "tags": u.get("tags") or "",
+        "summary": u.get("summary") or "",
+        "headerImage": header_image(u),
+        "type": kind,
+        "lastDate": last,
+    }
+    props = {k: v for k, v in props.items() if v}
+
+    def event(date: str, bg: str, **extra) -> Dict:
+        return {
+            "title": title,
+            "start": date,
+            "allDay": not _is_timed(date),
+            "backgroundColor": bg,
+            "borderColor": bg,
+            "textColor": "#fff",
+            "extendedProps": {**props, "color": {"bg": bg}, **extra},
+        }
+
+    if end and start and str(end)[:10] != str(start)[:10]:
+        return [event(start, color, milestone="start"), event(end, END_COLOR, milestone="end")]
+    return [event(start, color)]
+
+
+def load_games(data_dir: str = DATA_DIR) -> Dict[str, Dict]:
+    try:
+        with open(os.path.join(data_dir, "games.json"), "r", encoding="utf-8") as f:
+            return {g["id"]: g for g in json.load(f)}
+    except Exception:
+        return {}
+
+
+def build_shards(updates: Iterable[Dict], games: Dict[str, Dict]) -> Dict[Tuple[str, str], List[Dict]]:
+    """(이벤트 날짜의 월, 그룹) -> 이벤트 목록 (updates.json 순서 유지, 월을 알 수 없는 이벤트 제외)"""
+    shards: Dict[Tuple[str, str], List[Dict]] = {}
+    for u in updates:
+        group = shard_group(u)
+        for ev in to_calendar_events(u, games):
+            month = month_key(ev["start"])
+            if month:
+                shards.setdefault((month, group), []).append(ev)
+    return shards
+
+
+def _shard_name(group: str) -> str:
+    return re.sub(r"[^0-9A-Za-z_-]", "_", group) or "_"
+
+
+def _referenced(manifest: Dict) -> Set[str]:
+    return {
+        info["file"]
+        for groups in (manifest.get("months") or {}).values()
+        for info in groups.values()
+        if isinstance(info, dict) and info.get("file")
+    }
+
+
+def export_shards(updates: List[Dict], data_dir: str = DATA_DIR) -> Dict:
+    """
+    이벤트 shard 파일과 manifest.json 기록 후 manifest 반환
+    - 이미 있는 shard 파일은 다시 쓰지 않음 (파일명 = 내용 해시)
+    - manifest는 내용이 바뀐 경우에만 기록 (변경 없는 실행이 커밋을 만들지 않도록)
+    - 현재/직전 manifest 어느 쪽에서도 참조하지 않는 shard는 삭제 (배포 중 이전 manifest를 받은 방문자 보호)
+    """
+    shard_root = os.path.join(data_dir, SHARD_SUBDIR)
+    manifest_path = os.path.join(data_dir, MANIFEST_NAME)
+
+    months: Dict[str, Dict[str, Dict]] = {}
+    written = 0
+    for (month, group), items in sorted(build_shards(updates, load_games(data_dir)).items()):
+        data = compact_json(items)
+        rel = f"{SHARD_SUBDIR}/{month}/{_shard_name(group)}.{digest_bytes(data)[:12]}.json"
+        path = os.path.join(data_dir, *rel.split("/"))
+        if not os.path.exists(path):
+            atomic_write(path, data)
+            written += 1
+        months.setdefault(month, {})[group] = {"file": rel, "count": len(items)}
+
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "total": len(updates),
+        "groups": sorted({group for groups in months.values() for group in groups}),
+        "months": months,
+    }
+    raw, _ = read_bytes(manifest_path)
+    try:
+        previous = json.loads(raw.decode("utf-8")) if raw else {}
+    except ValueError:
+        previous = {}
+    data = dumps_json(manifest)
+    if raw != data:
+        atomic_write(manifest_path, data)
+
+    keep = _referenced(manifest) | _referenced(previous)
+    removed = 0
+    if os.path.isdir(shard_root):
+        for dirpath, dirnames, filenames in os.walk(shard_root, topdown=False):
+            for name in filenames:
+                rel = os.path.relpath(os.path.join(dirpath, name), data_dir).replace(os.sep, "/")
+                if rel not in keep:
+                    os.remove(os.path.join(dirpath, name))
+                    removed += 1
+            if dirpath != shard_root and not os.listdir(dirpath):
+                os.rmdir(dirpath)
+
+    shard_count = sum(len(groups) for groups in months.values())
+    print(f"[shards] {shard_count}개 shard ({len(months)}개월), 새로 기록 {written}개, 삭제 {removed}개"
+          + ("" if raw != data else ", manifest 변경 없음"))
+    return manifest
+
+
+def main():
+    with open(os.path.join(DATA_DIR, "updates.json"), "r", encoding="utf-8") as f:
+        updates = json.load(f)
+    export_shards(updates)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+"""
+DB(update_store)에만 반영된 변경을 data/updates.json + 프론트엔드 shard로 내보내기
+스크래퍼는 병합만 하므로 직접 실행한 뒤에는 이 스크립트(또는 compact_updates.py)로 내보냄
+
+사용: python scripts/export_updates.py [--force]
+"""
+
+import argparse
+
+from update_store import export_pending
+
+
+def main():
+    parser = argparse.ArgumentParser(description="아직 내보내지 않은 변경을 updates.json / shard로 내보냄")
+    parser.add_argument("--force", action="store_true", help="변경이 없어도 다시 내보냄")
+    args = parser.parse_args()
+    export_pending(force=args.force)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+HoYoLAB JSON API 클라이언트 (작성자 글 목록 + 게시글 상세)
+scrape_hoyolab.fetch_posts 의 기본 경로. parse_zzz / parse_star_rail 이 쓰는 {"title", "url", "body"} 반환
+"""
+
+import json
+import re
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from html_parse import parse
+from http_client import get_json, get_json_conditional
+from post_stream import committed, imap_ordered
+
+
+API_BASE = "https://bbs-api-os.hoyolab.com/community/post/wapi"
+ARTICLE_URL = "https://www.hoyolab.com/article/{post_id}"
+API_HEADERS = {
+    "Accept": "application/json",
+    "Referer": "https://www.hoyolab.com/",
+    "Origin": "https://www.hoyolab.com",
+    "x-rpc-language": "ko-kr",
+    "x-rpc-client_type": "4",
+}
+PAGE_SIZE = 20
+
+
+def _data(res: Dict) -> Dict:
+    """API 응답 {"retcode": 0, "data": {...}} 에서 data 추출"""
+    if not isinstance(res, dict):
+        return {}
+    if res.get("retcode", 0) != 0:
+        raise RuntimeError(f"HoYoLAB API error: retcode={res.get('retcode')} message={res.get('message')}")
+    return res.get("data") or {}
+
+
+def _delta_text(structured) -> str:
+    """structured_content (Quill delta JSON) -> 텍스트"""
+    if isinstance(structured, str):
+        try:
+            structured = json.loads(structured)
+        except ValueError:
+            return ""
+    if not isinstance(structured, list):
+        return ""
+    return "".join(op.get("insert") for op in structured if isinstance(op, dict) and isinstance(op.get("insert"), str))
+
+
+def post_body_text(post: Dict) -> str:
+    """게시글 객체에서 본문 텍스트 추출 (structured_content 우선, 없으면 HTML content)"""
+    text = _delta_text(post.get("structured_content"))
+    if not text.strip():
+        content = post.get("content") or ""
+        text = parse(content).get_text("\n") if "<" in content else content
+    lines = [line.strip() for line in text.splitlines()]
+    return "\n".join(line for line in lines if line)
+
+
+def fetch_user_posts(author_id: str, limit: int = 20, seen: Optional[Set[str]] = None,
+                     etag: str = "") -> Tuple[Optional[List[Dict]], str]:
+    """
+    작성자 글 목록을 커서(next_offset) 단위로 페이지 이동하며 limit개까지 수집
+    페이지의 마지막 글이 seen에 있으면 중단 (상단 고정 글은 이미 봤어도 그 뒤에 새 글이 있을 수 있음)
+    첫 페이지가 etag 이후 바뀌지 않았으면 None
+    (글 목록, 첫 페이지 ETag) 반환
+    """
+    posts: List[Dict] = []
+    offset = ""
+    first_etag = ""
+    while len(posts) < limit:
+        params = {"size": min(PAGE_SIZE, limit - len(posts)), "uid": author_id}
+        if offset:
+            params["offset"] = offset
+            res = get_json(f"{API_BASE}/userPost", params=params, headers=API_HEADERS)
+        else:
+            res, first_etag = get_json_conditional(f"{API_BASE}/userPost", params=params, headers=API_HEADERS, etag=etag)
+            if res is None:
+                return None, first_etag
+        data = _data(res)
+        items = data.get("list") or []
+        for item in items:
+            post = item.get("post", item) if isinstance(item, dict) else None
+            if post and post.get("post_id"):
+                posts.append(post)
+        if seen and posts and str(posts[-1]["post_id"]) in seen:
+            break
+        offset = str(data.get("next_offset") or "")
+        if data.get("is_last") or not items or not offset:
+            break
+    return posts[:limit], first_etag
+
+
+def fetch_post_full(post_id: str) -> Dict:
+    """게시글 상세 (post 객체)"""
+    data = _data(get_json(f"{API_BASE}/getPostFull", params={"post_id": post_id, "read": 1}, headers=API_HEADERS))
+    full = data.get("post") or {}
+    return full.get("post", full)
+
+
+def post_id_from_url(url: str) -> str:
+    """https://www.hoyolab.com/article/12345 -> "12345" """
+    m = re.search(r"/article/(\d+)", url)
+    return m.group(1) if m else url
+
+
+def to_post(post: Dict, body: Optional[str] = None) -> Dict:
+    return {
+        "title": (post.get("subject") or "").strip(),
+        "url": ARTICLE_URL.format(post_id=post.get("post_id")),
+        "body": body if body is not None else post_body_text(post),
+    }
+
+
+def fetch_posts(author_id: str, limit: int = 20, workers: int = 4, state=None) -> Iterator[Dict]:
+    """
+    목록 API + 게시글 상세 API로 포스트 수집 (순서 유지)
+    목록은 호출 즉시 가져오고, 상세는 workers개 스레드로 받는 대로 하나씩 내보냄 (post_stream.imap_ordered)
+    state(scrape_state.SourceState)가 있으면 아직 보지 않은 글만 상세 조회하고 끝까지 소비된 뒤 기록
+    목록 자체가 비어 있으면 RuntimeError (호출 측에서 폴백)
+    """
+    stream = str(author_id)
+    seen = state.seen_ids(stream) if state else None
+    listed, etag = fetch_user_posts(author_id, limit, seen=seen, etag=state.etag(stream) if state else "")
+    if listed is None:
+        print(f"[hoyolab_api] author {author_id}: not modified (ETag)")
+        return iter(())
+    if not listed:
+        raise RuntimeError(f"empty post list for author {author_id}")
+    print(f"[hoyolab_api] author {author_id}: {len(listed)} posts")
+    if state:
+        listed = state.take_new(stream, listed, key=lambda p: p["post_id"])
+
+    def load(post: Dict) -> Dict:
+        try:
+            full = fetch_post_full(post["post_id"])
+            merged = {**post, **{k: v for k, v in full.items() if v}}
+            return to_post(merged)
+        except Exception as e:
+            # 목록의 요약 본문은 잘려 있으므로 본문 없이 반환 (state가 본 것으로 기록하지 않아 다음 실행에서 다시 조회)
+            print(f"[hoyolab_api] detail failed for {post.get('post_id')}: {e}")
+            return to_post(post, body="")
+
+    return committed(imap_ordered(load, listed, workers), state, stream, key=post_id_from_url, etag=etag)
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+HTML 파싱 공용 (BeautifulSoup 백엔드 선택 + 필요한 부분만 트리로)
+- lxml이 설치돼 있으면 lxml(C 구현), 없으면 html.parser
+  HTML_PARSER 환경변수로 강제 지정 가능 (예: HTML_PARSER=html.parser)
+- parse(html, only): only(SoupStrainer)에 맞는 태그와 그 하위만 트리로 만듦
+  게시판 목록은 <a>만(BOARD_LINKS), Steam 검색 결과는 결과 행만(SEARCH_ROWS) 만들어 select 범위와 메모리를 줄임
+- text(html): 문서 전체 텍스트 (줄 단위, 앞뒤 공백 제거)
+
+벤치마크: python scripts/bench_html_parse.py
+"""
+
+import os
+from typing import Optional
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import lxml  # noqa: F401
+    DEFAULT_FEATURES = "lxml"
+except ImportError:
+    DEFAULT_FEATURES = "html.parser"
+
+
+# 게시판 목록: 제목 링크 (scrape_lounge.extract_board_posts의 a[class*='title'], a[href*='detail'])
+BOARD_LINKS = SoupStrainer("a")
+# Steam 검색 결과 행 (scrape_comingsoon.parse_list의 a.search_result_row)
+SEARCH_ROWS = SoupStrainer("a", class_="search_result_row")
+
+
+def features() -> str:
+    return os.getenv("HTML_PARSER") or DEFAULT_FEATURES
+
+
+def parse(html: str, only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    return BeautifulSoup(html or "", features(), parse_only=only)
+
+
+def text(html: str) -> str:
+    return parse(html).get_text("\n", strip=True)
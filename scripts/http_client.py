@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+"""
+공용 HTTP 클라이언트
+- 세션 재사용으로 커넥션 유지
+- ETag 조건부 요청 (get_json_conditional)
+- 토큰 버킷 속도 제한(RateLimiter) + 429/5xx/연결 오류 시 지터 백오프 재시도(request_with_retry)
+- 디스크 응답 캐시 (ResponseCache): 엔드포인트별 TTL, If-None-Match/If-Modified-Since 재검증, 용량 제한 LRU, 실행 중 동일 URL 중복 제거
+- HTTP_FIXTURE_MODE=record|replay, HTTP_FIXTURE_DIR=<경로> 로 응답을 기록/재생하여 오프라인 테스트 지원
+"""
+
+import atexit
+import hashlib
+import json
+import os
+import random
+import re
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+DEFAULT_HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; subculture-news/1.0)"}
+
+_local = threading.local()
+
+
+class FixtureMissing(Exception):
+    """replay 모드에서 기록된 응답이 없을 때"""
+
+
+def get_session() -> requests.Session:
+    """스레드별 requests 세션"""
+    session = getattr(_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        session.headers.update(DEFAULT_HEADERS)
+        _local.session = session
+    return session
+
+
+class RateLimiter:
+    """토큰 버킷: 평균 초당 rate개, 최대 burst개까지 연속 허용 (스레드 안전)"""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+def request_with_retry(session: requests.Session, url: str, params: Optional[Dict] = None,
+                       headers: Optional[Dict] = None, timeout: int = 30, retries: int = 3,
+                       backoff: float = 1.0, limiter: Optional[RateLimiter] = None) -> requests.Response:
+    """
+    GET + 재시도 (429/5xx, 연결 오류/타임아웃)
+    대기 시간은 backoff * 2^시도 범위의 무작위 값 (full jitter), Retry-After가 있으면 그 이상 대기
+    마지막 시도의 응답은 상태 코드와 관계없이 반환
+    """
+    for attempt in range(retries + 1):
+        if limiter:
+            limiter.acquire()
+        try:
+            res = session.get(url, params=params, headers=headers, timeout=timeout)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            if attempt == retries:
+                raise
+            reason = type(e).__name__
+            delay = random.uniform(0, backoff * 2 ** attempt)
+        else:
+            if res.status_code not in RETRY_STATUS or attempt == retries:
+                return res
+            reason = f"HTTP {res.status_code}"
+            delay = random.uniform(0, backoff * 2 ** attempt)
+            retry_after = res.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                delay = max(delay, float(retry_after))
+        print(f"[http] {reason}, {delay:.1f}s 후 재시도 ({attempt + 1}/{retries}): {url}")
+        time.sleep(delay)
+    raise RuntimeError("unreachable")
+
+
+def fixture_path(url: str, params: Optional[Dict] = None) -> str:
+    """URL + 정렬된 쿼리 파라미터로 결정되는 fixture 파일 경로"""
+    base = os.getenv("HTTP_FIXTURE_DIR", "")
+    key = url + "?" + json.dumps(sorted((params or {}).items()), ensure_ascii=False)
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(base, f"{digest}.json")
+
+
+def _fixture_mode() -> str:
+    if not os.getenv("HTTP_FIXTURE_DIR"):
+        return ""
+    return os.getenv("HTTP_FIXTURE_MODE", "replay")
+
+
+def _replay(url: str, params: Optional[Dict]):
+    path = fixture_path(url, params)
+    if not os.path.exists(path):
+        raise FixtureMissing(f"No recorded response for {url} {params or ''} ({path})")
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)["body"]
+
+
+def _record(url: str, params: Optional[Dict], data) -> None:
+    path = fixture_path(url, params)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"url": url, "params": params or {}, "body": data}, f, ensure_ascii=False, indent=2)
+
+
+def get_json(url: str, params: Optional[Dict] = None, headers: Optional[Dict] = None, timeout: int = 30):
+    """GET 후 JSON 반환 (fixture record/replay 지원)"""
+    data, _ = get_json_conditional(url, params=params, headers=headers, timeout=timeout)
+    return data
+
+
+def get_json_conditional(url: str, params: Optional[Dict] = None, headers: Optional[Dict] = None,
+                         etag: str = "", timeout: int = 30) -> Tuple[Optional[object], str]:
+    """
+    If-None-Match 조건부 GET
+    (data, 새 ETag) 반환, 304 Not Modified면 data는 None (replay 모드에서는 항상 기록된 응답)
+    """
+    mode = _fixture_mode()
+    if mode == "replay":
+        return _replay(url, params), ""
+
+    req_headers = dict(headers or {})
+    if etag:
+        req_headers["If-None-Match"] = etag
+    res = request_with_retry(get_session(), url, params=params, headers=req_headers, timeout=timeout)
+    if res.status_code == 304:
+        return None, etag
+    res.raise_for_status()
+    data = res.json()
+
+    if mode == "record":
+        _record(url, params, data)
+    return data, res.headers.get("ETag", "")
+
+
+class ResponseCache:
+    """
+    디스크 응답 캐시
+    - index.json: 요청 키(URL + 파라미터) -> 검증자(ETag/Last-Modified), 수집 시각, 마지막 사용 시각, 본문 해시
+    - blobs/<sha1>: 본문 (내용 주소 방식이라 같은 본문은 한 번만 저장)
+    - ttls: [(URL 정규식, 초)] 처음 일치하는 규칙의 TTL 동안은 네트워크 없이 사용, 지나면 조건부 요청으로 재검증
+    - 한 실행 안에서 같은 요청은 동시에 들어와도 한 번만 전송
+    - 실제 네트워크 요청만 limiter로 속도 제한, 여러 스레드가 하나의 커넥션 풀(pool_size)을 공유
+    """
+
+    def __init__(self, cache_dir: str, ttls: Optional[List[Tuple[str, int]]] = None,
+                 default_ttl: int = 0, max_bytes: int = 200 * 1024 * 1024,
+                 limiter: Optional[RateLimiter] = None, pool_size: int = 10):
+        self.cache_dir = cache_dir
+        self.limiter = limiter
+        # urllib3 커넥션 풀은 스레드 안전하므로 워커 스레드들이 세션 하나를 공유 (GET만 사용)
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.ttls = [(re.compile(pattern), ttl) for pattern, ttl in (ttls or [])]
+        self.default_ttl = default_ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, threading.Lock] = {}
+        self._memo: Dict[str, str] = {}
+        self._dirty = False
+        self.stats = {"memo": 0, "fresh": 0, "revalidated": 0, "fetched": 0, "bytes": 0}
+        try:
+            with open(os.path.join(cache_dir, "index.json"), "r", encoding="utf-8") as f:
+                self._index: Dict[str, Dict] = json.load(f)
+        except Exception:
+            self._index = {}
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self.stats[name] += amount
+
+    def _ttl(self, url: str) -> int:
+        for pattern, ttl in self.ttls:
+            if pattern.search(url):
+                return ttl
+        return self.default_ttl
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self.cache_dir, "blobs", digest)
+
+    def _read_blob(self, entry: Dict) -> Optional[str]:
+        try:
+            with open(self._blob_path(entry["blob"]), "r", encoding="utf-8") as f:
+                return f.read()
+        except Exception:
+            return None
+
+    def _store(self, key: str, url: str, res: requests.Response, text: str) -> None:
+        data = text.encode("utf-8")
+        digest = hashlib.sha1(data).hexdigest()
+        path = self._blob_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as f:
+                f.write(data)
+        now = time.time()
+        with self._lock:
+            self._index[key] = {
+                "url": url,
+                "etag": res.headers.get("ETag", ""),
+                "last_modified": res.headers.get("Last-Modified", ""),
+                "fetched_at": now,
+                "used_at": now,
+                "size": len(data),
+                "blob": digest,
+            }
+            self._dirty = True
+
+    def _touch(self, key: str, revalidated: bool = False) -> None:
+        with self._lock:
+            entry = self._index.get(key)
+            if entry:
+                entry["used_at"] = time.time()
+                if revalidated:
+                    entry["fetched_at"] = entry["used_at"]
+                self._dirty = True
+
+    def get_text(self, url: str, params: Optional[Dict] = None, headers: Optional[Dict] = None,
+                 timeout: int = 30) -> str:
+        """캐시를 거친 GET (2xx가 아니면 requests.HTTPError)"""
+        key = hashlib.sha1((url + "?" + json.dumps(sorted((params or {}).items()), ensure_ascii=False)).encode("utf-8")).hexdigest()
+        with self._lock:
+            key_lock = self._inflight.setdefault(key, threading.Lock())
+        with key_lock:
+            if key in self._memo:
+                self._count("memo")
+                return self._memo[key]
+
+            entry = self._index.get(key)
+            cached = self._read_blob(entry) if entry else None
+            if cached is not None and time.time() - entry["fetched_at"] < self._ttl(url):
+                self._count("fresh")
+                self._touch(key)
+                self._memo[key] = cached
+                return cached
+
+            req_headers = dict(headers or {})
+            if cached is not None:
+                if entry.get("etag"):
+                    req_headers["If-None-Match"] = entry["etag"]
+                if entry.get("last_modified"):
+                    req_headers["If-Modified-Since"] = entry["last_modified"]
+            res = request_with_retry(self.session, url, params=params, headers=req_headers,
+                                     timeout=timeout, limiter=self.limiter)
+            if res.status_code == 304 and cached is not None:
+                self._count("revalidated")
+                self._touch(key, revalidated=True)
+                text = cached
+            else:
+                res.raise_for_status()
+                self._count("fetched")
+                self._count("bytes", len(res.content))
+                text = res.text
+                self._store(key, url, res, text)
+            self._memo[key] = text
+            return text
+
+    def get_json(self, url: str, params: Optional[Dict] = None, headers: Optional[Dict] = None, timeout: int = 30):
+        return json.loads(self.get_text(url, params=params, headers=headers, timeout=timeout))
+
+    def _evict(self) -> None:
+        """최근 사용 시각이 오래된 항목부터 max_bytes 이하가 될 때까지 삭제 (참조가 없어진 본문 파일도 삭제)"""
+        entries = sorted(self._index.items(), key=lambda kv: kv[1].get("used_at", 0))
+        total = sum(e.get("size", 0) for _, e in entries)
+        for key, entry in entries:
+            if total <= self.max_bytes:
+                break
+            del self._index[key]
+            total -= entry.get("size", 0)
+        referenced = {e["blob"] for e in self._index.values()}
+        blob_dir = os.path.join(self.cache_dir, "blobs")
+        if os.path.isdir(blob_dir):
+            for name in os.listdir(blob_dir):
+                if name not in referenced:
+                    os.remove(os.path.join(blob_dir, name))
+
+    def save(self) -> None:
+        with self._lock:
+            if not self._dirty:
+                return
+            self._evict()
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp = os.path.join(self.cache_dir, "index.json.tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self._index, f)
+            os.replace(tmp, os.path.join(self.cache_dir, "index.json"))
+            self._dirty = False
+
+    def summary(self) -> str:
+        s = self.stats
+        return (f"[http_cache] 실행 내 재사용 {s['memo']}, TTL 적중 {s['fresh']}, "
+                f"304 재검증 {s['revalidated']}, 다운로드 {s['fetched']} ({s['bytes'] / 1024:.0f}KB)")
+
+
+_caches: Dict[str, ResponseCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_cache(name: str, ttls: Optional[List[Tuple[str, int]]] = None, default_ttl: int = 0,
+              rate: float = 0, burst: int = 1, pool_size: int = 10) -> ResponseCache:
+    """
+    이름별 공용 응답 캐시 (HTTP_CACHE_DIR/<name>, 기본 .cache/http/<name>)
+    HTTP_CACHE_MAX_MB로 용량 제한 (기본 200MB), 프로세스 종료 시 인덱스 저장
+    rate > 0 이면 네트워크 요청을 초당 rate개로 제한 (설정은 처음 만들 때만 적용)
+    """
+    with _caches_lock:
+        if name not in _caches:
+            base = os.getenv("HTTP_CACHE_DIR") or os.path.abspath(
+                os.path.join(os.path.dirname(__file__), "..", ".cache", "http"))
+            cache = ResponseCache(
+                os.path.join(base, name),
+                ttls=ttls,
+                default_ttl=default_ttl,
+                max_bytes=int(float(os.getenv("HTTP_CACHE_MAX_MB", "200")) * 1024 * 1024),
+                limiter=RateLimiter(rate, burst) if rate > 0 else None,
+                pool_size=pool_size,
+            )
+            atexit.register(cache.save)
+            _caches[name] = cache
+        return _caches[name]
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+네이버 게임 라운지 JSON API 클라이언트 (Chrome 없이 게시판 목록/본문 수집)
+scrape_lounge.fetch_board_posts 에서 우선 시도하고, 실패 시 Selenium으로 폴백
+"""
+
+import json
+import os
+import re
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from html_parse import text as html_text
+from http_client import get_json, get_json_conditional
+from post_stream import committed, imap_ordered
+
+
+API_BASE = "https://comm-api.game.naver.com/nng_main/v1/community/lounge/{lounge_id}"
+DETAIL_URL = "https://game.naver.com/lounge/{lounge_id}/board/detail/{feed_id}"
+API_HEADERS = {
+    "Accept": "application/json",
+    "Referer": "https://game.naver.com/",
+    "Origin": "https://game.naver.com",
+}
+
+
+def parse_board_url(board_url: str) -> Tuple[str, str]:
+    """https://game.naver.com/lounge/nikke/board/48 -> ("nikke", "48")"""
+    m = re.search(r"/lounge/([^/]+)/board/(\d+)", board_url)
+    if not m:
+        raise ValueError(f"Not a lounge board URL: {board_url}")
+    return m.group(1), m.group(2)
+
+
+def stream_key(board_url: str) -> str:
+    """증분 수집 상태(scrape_state)에서 게시판을 구분하는 키"""
+    lounge_id, board_id = parse_board_url(board_url)
+    return f"{lounge_id}/board/{board_id}"
+
+
+def feed_id_from_url(url: str) -> str:
+    """.../board/detail/12345 -> "12345" """
+    m = re.search(r"/detail/(\d+)", url)
+    return m.group(1) if m else url
+
+
+def _content(data: Dict) -> Dict:
+    """API 응답 {"code": 200, "content": {...}} 에서 content 추출"""
+    if not isinstance(data, dict):
+        return {}
+    code = data.get("code")
+    if code not in (None, 200):
+        raise RuntimeError(f"Lounge API error: code={code} message={data.get('message')}")
+    return data.get("content") or {}
+
+
+def _collect_text(node, out: List[str]) -> None:
+    """SmartEditor 문서 JSON에서 텍스트 노드 값을 문단 단위로 수집"""
+    if isinstance(node, dict):
+        if node.get("@ctype") == "paragraph":
+            line = "".join(
+                n.get("value", "") for n in node.get("nodes", [])
+                if isinstance(n, dict) and isinstance(n.get("value"), str)
+            )
+            out.append(line)
+            return
+        if node.get("@ctype") == "textNode" and isinstance(node.get("value"), str):
+            out.append(node["value"])
+            return
+        for v in node.values():
+            _collect_text(v, out)
+    elif isinstance(node, list):
+        for v in node:
+            _collect_text(v, out)
+
+
+def contents_to_text(contents) -> str:
+    """게시글 contents (SmartEditor JSON 문자열 또는 HTML) -> 줄 단위 텍스트"""
+    if not contents:
+        return ""
+    if isinstance(contents, str):
+        stripped = contents.lstrip()
+        if stripped.startswith("{") or stripped.startswith("["):
+            try:
+                contents = json.loads(stripped)
+            except ValueError:
+                pass
+    if isinstance(contents, str):
+        return html_text(contents)
+    lines: List[str] = []
+    _collect_text(contents, lines)
+    return "\n".join(line.strip() for line in lines if line.strip())
+
+
+def fetch_feed_list(lounge_id: str, board_id: str, limit: int = 20, etag: str = "") -> Tuple[Optional[List[Dict]], str]:
+    """게시판 최신 글 목록 (feed 객체 리스트, 새 ETag). 목록이 etag 이후 바뀌지 않았으면 None"""
+    data, new_etag = get_json_conditional(
+        API_BASE.format(lounge_id=lounge_id) + "/feed",
+        params={"boardId": board_id, "buffFilteringYN": "N", "limit": limit, "offset": 0, "order": "NEW"},
+        headers=API_HEADERS,
+        etag=etag,
+    )
+    if data is None:
+        return None, new_etag
+    feeds = _content(data).get("feeds") or []
+    return [item.get("feed", item) for item in feeds if isinstance(item, dict)], new_etag
+
+
+def fetch_feed_detail(lounge_id: str, feed_id) -> Dict:
+    """게시글 상세 (feed 객체)"""
+    data = get_json(API_BASE.format(lounge_id=lounge_id) + f"/feed/{feed_id}", headers=API_HEADERS)
+    content = _content(data)
+    return content.get("feed", content)
+
+
+def feed_to_post(lounge_id: str, feed: Dict, body: Optional[str] = None) -> Dict:
+    """API feed 객체 -> 파서가 사용하는 {"title", "url", "body"}"""
+    feed_id = feed.get("feedId") or feed.get("id")
+    return {
+        "title": (feed.get("title") or "").strip(),
+        "url": DETAIL_URL.format(lounge_id=lounge_id, feed_id=feed_id),
+        "body": body if body is not None else contents_to_text(feed.get("contents")),
+    }
+
+
+def fetch_board_posts(board_url: str, max_items: int = 20, workers: int = 4, state=None) -> Iterator[Dict]:
+    """
+    게시판 목록 1회 + 본문이 없는 글만 상세 API 호출 (순서 유지)
+    목록은 호출 즉시 가져오고, 게시글은 본문이 준비되는 대로 하나씩 내보냄 (post_stream.imap_ordered)
+    state(scrape_state.SourceState)가 있으면 ETag 조건부 요청 + 이미 본 글 이후는 건너뛰고 새 글만, 끝까지 소비된 뒤 기록
+    목록 자체가 비어 있으면 RuntimeError (API 응답 형식 변경 등으로 간주, 호출 측에서 폴백)
+    """
+    lounge_id, board_id = parse_board_url(board_url)
+    stream = stream_key(board_url)
+    feeds, etag = fetch_feed_list(lounge_id, board_id, max_items, etag=state.etag(stream) if state else "")
+    if feeds is None:
+        print(f"[lounge_api] {lounge_id}/board/{board_id}: not modified (ETag)")
+        return iter(())
+    feeds = [f for f in feeds if f.get("feedId") or f.get("id")][:max_items]
+    if not feeds:
+        raise RuntimeError(f"empty feed list for {board_url}")
+    print(f"[lounge_api] {lounge_id}/board/{board_id}: {len(feeds)} feeds")
+    if state:
+        feeds = state.take_new(stream, feeds, key=lambda f: f.get("feedId") or f.get("id"))
+
+    def load(feed: Dict) -> Dict:
+        body = contents_to_text(feed.get("contents"))
+        if not body:
+            try:
+                detail = fetch_feed_detail(lounge_id, feed.get("feedId") or feed.get("id"))
+                body = contents_to_text(detail.get("contents"))
+            except Exception as e:
+                print(f"[lounge_api] detail failed for {feed.get('feedId')}: {e}")
+                body = ""
+        return feed_to_post(lounge_id, feed, body)
+
+    return committed(imap_ordered(load, feeds, workers), state, stream, key=lambda p: feed_id_from_url(p["url"]), etag=etag)
+
+
+def api_enabled() -> bool:
+    return os.getenv("LOUNGE_API", "1") != "0"
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+공용 병합/중복 제거 엔진
+- 키 정책: "update" (game_id|version|update_date|description), "release" (name|update_date|platform)
+- 해시 기반 O(n) 중복 제거 (병합/교체 구간은 update_store.UpdateStore가 이 키로 수행)
+- 추가/갱신/삭제 건수 집계, MERGE_STATS_PATH가 있으면 실행 로그(action_log) 기록용 JSON으로 저장
+- updates.json 정규 순서: 항목은 날짜 -> game_id -> 키 순, 필드는 FIELD_ORDER 순
+  (수집 순서와 무관하게 같은 내용이면 같은 파일이 되어 변경된 항목만 diff에 나타남)
+"""
+
+import json
+import os
+import re
+from typing import Callable, Dict, Iterable, List, Tuple, Union
+
+
+KeyPolicy = Callable[[Dict], str]
+
+
+def update_key(u: Dict) -> str:
+    """업데이트 식별 키 (스크래퍼 공통)"""
+    return f"{u.get('game_id')}|{u.get('version', '')}|{u.get('update_date')}|{u.get('description', '')}"
+
+
+def release_key(u: Dict) -> str:
+    """발매 일정 식별 키 (같은 게임이 여러 장르 설명으로 중복 수집되는 경우)"""
+    return f"{u.get('name', '')}|{u.get('update_date', '')}|{u.get('platform', '')}"
+
+
+# updates.json 필드 순서 (목록에 없는 필드는 뒤에 이름순)
+FIELD_ORDER = ["game_id", "version", "update_date", "end_date", "description", "name", "url", "platform",
+               "tags", "summary", "header_image"]
+_FIELD_RANK = {name: i for i, name in enumerate(FIELD_ORDER)}
+_ISO_DATE = re.compile(r"^(\d{4})-(\d{1,2})-(\d{1,2})(.*)$")
+
+KEY_POLICIES: Dict[str, KeyPolicy] = {
+    "update": update_key,
+    "release": release_key,
+}
+
+
+def resolve_key(key: Union[str, KeyPolicy]) -> KeyPolicy:
+    return KEY_POLICIES[key] if isinstance(key, str) else key
+
+
+def canonical_fields(u: Dict) -> Dict:
+    """필드를 FIELD_ORDER 순으로 다시 배치한 사본"""
+    return {name: u[name] for name in sorted(u, key=lambda n: (_FIELD_RANK.get(n, len(FIELD_ORDER)), n))}
+
+
+def sort_key(u: Dict) -> Tuple:
+    """정규 순서 키: YYYY-MM-DD 날짜(자릿수 맞춤) 순, 그 외 형식(연도만, 출시 예정 등)은 뒤에 문자열 순"""
+    date = str(u.get("update_date") or "")
+    m = _ISO_DATE.match(date)
+    if m:
+        date_key = (0, f"{m.group(1)}-{int(m.group(2)):02d}-{int(m.group(3)):02d}{m.group(4)}")
+    else:
+        date_key = (1, date)
+    return date_key + (str(u.get("game_id") or ""), update_key(u))
+
+
+def canonical_updates(items: Iterable[Dict]) -> List[Dict]:
+    """updates.json에 기록할 정규 순서 (항목 정렬 + 필드 순서)"""
+    return [canonical_fields(u) for u in sorted(items, key=sort_key)]
+
+
+def new_stats() -> Dict[str, int]:
+    """archived: 보관된 항목이라 건너뛴 건수 (update_store 툼스톤)"""
+    return {"added": 0, "updated": 0, "removed": 0, "unchanged": 0, "archived": 0}
+
+
+def dedupe(items: Iterable[Dict], key: Union[str, KeyPolicy] = "update") -> List[Dict]:
+    """같은 키는 처음 나온 항목만 유지 (순서 유지)"""
+    key_fn = resolve_key(key)
+    seen = set()
+    out: List[Dict] = []
+    for item in items:
+        k = key_fn(item)
+        if k in seen:
+            continue
+        seen.add(k)
+        out.append(item)
+    return out
+
+
+def format_changes(stats: Dict[str, int]) -> str:
+    """실행 로그의 changes 형식 ("추가+삭제-", 갱신이 있으면 " 갱신~" 추가)"""
+    text = f"{stats.get('added', 0)}+{stats.get('removed', 0)}-"
+    if stats.get("updated"):
+        text += f" {stats['updated']}~"
+    return text
+
+
+_totals = new_stats()
+
+
+def record_stats(stats: Dict[str, int], label: str = "") -> None:
+    """
+    병합 건수 출력 + MERGE_STATS_PATH에 누적 저장 (한 프로세스에서 여러 번 병합해도 합계 기록)
+    워크플로는 이 파일로 실행 로그(scripts/action_log.py)의 changes/merge를 채움
+    """
+    for name in _totals:
+        _totals[name] += stats.get(name, 0)
+    print(f"[merge] {label + ': ' if label else ''}+{stats.get('added', 0)} ~{stats.get('updated', 0)} "
+          f"-{stats.get('removed', 0)} (변경 없음 {stats.get('unchanged', 0)}"
+          + (f", 보관됨 {stats['archived']}" if stats.get("archived") else "") + ")")
+    path = os.getenv("MERGE_STATS_PATH")
+    if path:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({**_totals, "changes": format_changes(_totals)}, f, ensure_ascii=False)
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+페이지 준비 상태 감지 (고정 time.sleep 대체)
+선택자 존재 + DOM 변경 정지(quiescence) + 네트워크 유휴를 폴링하고, 조건이 맞으면 즉시 반환
+"""
+
+import threading
+import time
+from typing import Dict, Optional
+
+
+# 첫 호출 시 MutationObserver를 설치하고, 이후에는 마지막 DOM 변경 시각과 리소스 수를 반환
+_PROBE_JS = """
+if (!window.__snReady) {
+    window.__snReady = {last: performance.now()};
+    try {
+        new MutationObserver(function () { window.__snReady.last = performance.now(); })
+            .observe(document.documentElement || document,
+                     {subtree: true, childList: true, attributes: true, characterData: true});
+    } catch (e) {}
+}
+var sel = arguments[0];
+return {
+    state: document.readyState,
+    found: sel ? !!document.querySelector(sel) : true,
+    quiet: performance.now() - window.__snReady.last,
+    resources: performance.getEntriesByType('resource').length
+};
+"""
+
+_stats_lock = threading.Lock()
+_stats: Dict[str, float] = {"pages": 0, "waited": 0.0, "timeouts": 0}
+
+
+def wait_until_ready(driver, selector: Optional[str] = None, timeout: float = 10.0,
+                     quiet_ms: int = 500, poll: float = 0.1, label: str = "") -> bool:
+    """
+    페이지가 안정될 때까지 대기 후 실제 대기 시간을 로그로 남김
+    - selector가 있으면 해당 요소가 나타날 때까지
+    - DOM 변경과 리소스 요청이 quiet_ms 동안 없을 때까지
+    timeout 안에 selector를 찾았으면 True (DOM이 계속 바뀌어 시간 초과된 경우도 포함), 못 찾았으면 False
+    """
+    started = time.time()
+    deadline = started + timeout
+    found = False
+    settled = False
+    last_resources = -1
+    resources_changed_at = started
+
+    while True:
+        now = time.time()
+        try:
+            probe = driver.execute_script(_PROBE_JS, selector)
+        except Exception:
+            probe = None
+
+        if probe:
+            found = bool(probe.get("found"))
+            if probe.get("resources") != last_resources:
+                last_resources = probe.get("resources")
+                resources_changed_at = now
+            network_idle = (now - resources_changed_at) * 1000 >= quiet_ms
+            dom_quiet = (probe.get("quiet") or 0) >= quiet_ms
+            if probe.get("state") == "complete" and found and dom_quiet and network_idle:
+                settled = True
+                break
+
+        if now >= deadline:
+            break
+        time.sleep(poll)
+
+    elapsed = time.time() - started
+    with _stats_lock:
+        _stats["pages"] += 1
+        _stats["waited"] += elapsed
+        if not settled:
+            _stats["timeouts"] += 1
+
+    status = "ready" if settled else ("timeout (selector found)" if found else "timeout")
+    target = f" [{selector}]" if selector else ""
+    print(f"  [ready] {label or 'page'}{target}: {elapsed:.2f}s {status}")
+    return found
+
+
+def scroll_and_settle(driver, timeout: float = 5.0, label: str = "scroll") -> None:
+    """페이지 끝까지 스크롤해 지연 로딩을 유도하고 새 콘텐츠가 안정될 때까지 대기"""
+    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+    wait_until_ready(driver, timeout=timeout, label=label)
+
+
+def ready_stats() -> Dict[str, float]:
+    with _stats_lock:
+        return dict(_stats)
+
+
+def print_ready_summary() -> None:
+    """실행 종료 시 페이지당 평균 대기 시간 출력"""
+    stats = ready_stats()
+    if not stats["pages"]:
+        return
+    avg = stats["waited"] / stats["pages"]
+    print(f"[ready] 페이지 {int(stats['pages'])}개, 총 대기 {stats['waited']:.1f}s "
+          f"(평균 {avg:.2f}s, 시간 초과 {int(stats['timeouts'])}회)")
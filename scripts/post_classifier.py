@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+게시글 분류 (키워드 규칙 -> 태그)
+- RULES: 게임별 태그 규칙 (모집, 튜닝, 기간 한정 채널, 워프, 방송 ...)을 데이터로 선언
+  키워드를 추가해도 본문을 다시 훑는 횟수는 늘지 않음
+- PostClassifier: 규칙의 키워드를 필드(title/body/text)별로 모아 다중 패턴 검색기를 만들고
+  classify()는 필드마다 한 번만 훑어 나온 키워드로 모든 태그를 판정
+  pyahocorasick이 설치돼 있으면 Aho-Corasick 오토마톤, 없으면 키워드 대안 정규식 하나 (결과는 같음)
+
+규칙 형식
+    태그: {"when": {조건 이름: [절, ...]}, "unless": (리터럴, ...)}
+    - 조건: 모든 절이 충족되면 성립, 태그: 조건 중 하나라도 성립하고 unless 리터럴이 하나도 없으면 붙음
+    - 절: 리터럴 튜플, 하나라도 있으면 충족
+    - 리터럴: "필드:키워드" (필드 값에 키워드 포함) 또는 콜론 없는 플래그 이름 (classify(flags=...)로 전달)
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Set, Tuple
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+UPDATE_NOTICE = "업데이트 소식 사전 안내"
+
+RULES: Dict[str, Dict[str, Dict]] = {
+    # 라운지 게시글 본문 수집 시 로그용 (scrape_lounge.fetch_post_body)
+    "lounge": {
+        "recruit_hint": {"when": {"body": [("body:특수모집", "body:합류", "body:모집에 합류")]}},
+    },
+    "nikke": {
+        # 특수모집 합류 공지 (조건 이름은 로그에 출력)
+        "recruit": {"when": {
+            "cond1": [(f"title:{UPDATE_NOTICE}",),
+                      ("body:모집에 합류", "body:특수 모집", "body:모집"),
+                      ("body:모집에 합류", "body:특수 모집", "body:합류")],
+            "cond2": [("title:특수모집",), ("title:합류",)],
+            "cond3": [("body:특수모집", "body:특수 모집"), ("body:합류",)],
+            "cond4": [("title:캐릭터 특수모집",)],
+            "cond5": [("body:캐릭터 특수모집",)],
+            "cond6": [("body:SSR",), ("body:합류",), (f"title:{UPDATE_NOTICE}",)],
+        }},
+        "broadcast": {"when": {
+            "preview_notice": [("title:방송",), ("title:사전",), ("title:안내",)],
+            "notice": [("title:방송",), ("title:안내",)],
+        }},
+    },
+    "ww": {
+        "notice": {"when": {"title": [("title:업데이트 점검 사전 공지",)]}},
+        # 캐릭터 이벤트 튜닝 (무기 이벤트 튜닝은 제목에 "캐릭터"가 없어 제외됨)
+        "tuning": {"when": {"title": [("title:캐릭터",), ("title:이벤트",), ("title:튜닝",)]}},
+        # 프리뷰 특별 방송 (title은 이모지를 뺀 제목, "시작됩니다"는 지난 방송 공지)
+        "broadcast": {
+            "when": {
+                "preview": [("title:프리뷰",), ("title:방송",)],
+                "special": [("title:특별 방송",)],
+            },
+            "unless": ("title:카페", "title:콜라보", "title:이모티콘", "title:애니메이션", "title:컷신",
+                       "title:스케치", "title:오프라인 상영회", "title:시작됩니다"),
+        },
+    },
+    # HoYoLAB (플래그 ver: 제목/본문에서 버전을 찾음)
+    "zzz": {
+        "update_notice": {"when": {"title": [("title:업데이트 안내",), ("ver",)]}},
+        "broadcast": {"when": {
+            "special_title": [("title:특별",), ("title:방송",)],
+            "special_body": [("body:특별",), ("body:방송",)],
+            "notice_title": [("title:방송",), ("title:예고",)],
+            "notice_body": [("body:방송",), ("body:예고",)],
+            "version_title": [("ver",), ("title:방송",)],
+            "version_body": [("ver",), ("body:방송",)],
+        }},
+        "broadcast_notice": {"when": {"any": [("title:예고", "body:예고")]}},
+        "channel": {"when": {
+            "limited": [("title:기간 한정 채널",)],
+            "version": [("ver",), ("title:채널",)],
+        }},
+        "channel_first": {"when": {"title": [("title:상)", "title:(상", "title:상반기")]}},
+        "channel_second": {"when": {"title": [("title:하)", "title:(하", "title:하반기")]}},
+    },
+    "star_rail": {
+        "update_notice": {"when": {"title": [("title:업데이트 점검 예고", "title:업데이트 안내"), ("ver",)]}},
+        "preview": {"when": {"title": [("title:프리뷰 스페셜 프로그램",), ("ver",)]}},
+        # 이벤트 워프 (1)/(2) 구분은 scrape_hoyolab.parse_star_rail의 정규식
+        "warp": {"when": {"title": [("title:워프",), ("ver",)]}},
+    },
+}
+
+
+def keyword_rules(field: str, keywords: Iterable[str], tag: str = "match") -> Dict[str, Dict]:
+    """키워드 중 하나라도 있으면 tag (트위터 KEYWORDS 같은 단순 목록용)"""
+    return {tag: {"when": {"keywords": [tuple(f"{field}:{kw}" for kw in keywords)]}}}
+
+
+def _split(literal: str) -> Tuple[str, str]:
+    """"필드:키워드" -> (필드, 키워드), 플래그 -> ("", 플래그)"""
+    field, sep, keyword = literal.partition(":")
+    return (field, keyword) if sep else ("", literal)
+
+
+class KeywordScanner:
+    """키워드 집합 -> 본문을 한 번 훑어 포함된 키워드 집합"""
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords = sorted(set(keywords), key=lambda kw: (-len(kw), kw))
+        self._automaton = None
+        self._pattern = None
+        if not self.keywords:
+            return
+        if ahocorasick is not None:
+            self._automaton = ahocorasick.Automaton()
+            for kw in self.keywords:
+                self._automaton.add_word(kw, kw)
+            self._automaton.make_automaton()
+        else:
+            # 긴 키워드부터 시도하는 대안 하나로 찾은 키워드 끝(m.end())부터 이어서 검색 (본문을 다시 훑지 않음)
+            # 찾은 키워드와 겹치는 키워드는 미리 계산: 그 안에 포함된 키워드, 끝에 걸쳐 시작하는 키워드 (시작 오프셋)
+            self._pattern = re.compile("|".join(re.escape(kw) for kw in self.keywords))
+            self._inside = {kw: [w for w in self.keywords if w in kw] for kw in self.keywords}
+            self._straddle = {
+                kw: [(off, w) for off in range(1, len(kw)) for w in self.keywords
+                     if len(w) > len(kw) - off and w.startswith(kw[off:])]
+                for kw in self.keywords
+            }
+
+    def find(self, text: str) -> Set[str]:
+        found: Set[str] = set()
+        if not text or not self.keywords:
+            return found
+        if self._automaton is not None:
+            for _, kw in self._automaton.iter(text):
+                found.add(kw)
+            return found
+        total = len(self.keywords)
+        m = self._pattern.search(text)
+        while m and len(found) < total:
+            kw = m.group()
+            found.update(self._inside[kw])
+            for off, w in self._straddle[kw]:
+                if w not in found and text.startswith(w, m.start() + off):
+                    found.add(w)
+            m = self._pattern.search(text, m.end())
+        return found
+
+
+class Classification:
+    """classify 결과: 필드별 포함 키워드, 태그 -> 성립한 조건 이름"""
+
+    __slots__ = ("hits", "flags", "tags")
+
+    def __init__(self, hits: Dict[str, Set[str]], flags: Set[str]):
+        self.hits = hits
+        self.flags = flags
+        self.tags: Dict[str, List[str]] = {}
+
+    def has(self, field: str, keyword: str) -> bool:
+        return keyword in self.hits.get(field, ())
+
+    def holds(self, literal: str) -> bool:
+        field, keyword = _split(literal)
+        return self.has(field, keyword) if field else keyword in self.flags
+
+    def __contains__(self, tag: str) -> bool:
+        return tag in self.tags
+
+    def __repr__(self) -> str:
+        return f"Classification({self.tags})"
+
+
+class PostClassifier:
+    """태그 규칙 -> 필드별 KeywordScanner"""
+
+    def __init__(self, rules: Dict[str, Dict]):
+        self.rules = rules
+        keywords: Dict[str, Set[str]] = {}
+        for spec in rules.values():
+            literals = [lit for clauses in spec["when"].values() for clause in clauses for lit in clause]
+            for literal in literals + list(spec.get("unless", ())):
+                field, keyword = _split(literal)
+                if field:
+                    keywords.setdefault(field, set()).add(keyword)
+        self.scanners = {field: KeywordScanner(kws) for field, kws in keywords.items()}
+
+    def classify(self, flags: Iterable[str] = (), **fields: str) -> Classification:
+        """fields: 필드 이름=본문 (규칙에 없는 필드는 무시), flags: 참인 플래그 이름"""
+        result = Classification(
+            {field: scanner.find(fields.get(field) or "") for field, scanner in self.scanners.items()},
+            set(flags),
+        )
+        for tag, spec in self.rules.items():
+            if any(result.holds(lit) for lit in spec.get("unless", ())):
+                continue
+            matched = [name for name, clauses in spec["when"].items()
+                       if all(any(result.holds(lit) for lit in clause) for clause in clauses)]
+            if matched:
+                result.tags[tag] = matched
+        return result
+
+
+@lru_cache(maxsize=None)
+def for_game(game: str) -> PostClassifier:
+    """RULES[game]으로 만든 분류기 (프로세스당 한 번 생성)"""
+    return PostClassifier(RULES[game])
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+게시글 스트리밍 (수집 -> 파싱 -> 병합을 목록 전체가 모이기 전에 시작)
+- imap_ordered(fn, items, workers): 스레드 workers개로 fn(item)을 실행해 입력 순서대로 하나씩 내보냄
+  소비되지 않은 결과는 최대 ahead개(기본 workers*2)까지만 미리 수집하므로 limit을 늘려도 메모리는 일정
+- lookahead(items, learn, window): 항목마다 learn(item)을 먼저 적용하고 window개 뒤에 (item, learn 결과)를 내보냄
+  버전 -> 업데이트일처럼 다른 게시글을 참조하는 값을 전체를 두 번 훑지 않고 앞뒤 창 안에서 찾음
+  창이 게시글 수 이상이면(window=None이면 항상) 기존 2회 순회(캐시 먼저, 본 처리 나중)와 결과가 같음
+  lookahead_window(limit): PARSE_LOOKAHEAD, 없으면 수집 개수 limit (목록 전체를 보므로 결과가 기존과 같음)
+  메모리를 줄이려면 PARSE_LOOKAHEAD를 limit보다 작게 (창 밖의 참조를 못 찾은 글은 state.retry로 다음 실행에서 다시 파싱)
+- committed(posts, state, stream, key): 게시글을 그대로 내보내고 끝까지 소비됐을 때만 state.commit
+  (파싱 중 실패하면 기록하지 않아 다음 실행에서 다시 수집)
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+
+def lookahead_window(limit: int) -> int:
+    return max(0, int(os.getenv("PARSE_LOOKAHEAD") or limit))
+
+
+def imap_ordered(fn: Callable, items: Iterable, workers: int = 4, ahead: Optional[int] = None) -> Iterator:
+    """fn(item)을 병렬 실행하고 앞선 결과가 끝나는 대로 입력 순서대로 내보냄 (fn은 자체적으로 예외 처리)"""
+    workers = max(1, workers)
+    ahead = max(workers, ahead or workers * 2)
+    pending: deque = deque()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        try:
+            for item in items:
+                pending.append(executor.submit(fn, item))
+                if len(pending) >= ahead:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            # 소비가 중간에 멈추면 아직 시작하지 않은 작업은 취소
+            for future in pending:
+                future.cancel()
+
+
+def lookahead(items: Iterable, learn: Callable, window: Optional[int] = None) -> Iterator[Tuple]:
+    """learn(item)을 window개 앞선 항목까지(None이면 전부) 먼저 적용한 뒤 (item, learn(item))을 입력 순서대로 내보냄"""
+    buffer: deque = deque()
+    for item in items:
+        buffer.append((item, learn(item)))
+        if window is not None and len(buffer) > window:
+            yield buffer.popleft()
+    while buffer:
+        yield buffer.popleft()
+
+
+def committed(posts: Iterable[Dict], state, stream: str, key: Callable[[Dict], str], etag: str = "") -> Iterator[Dict]:
+    """posts를 그대로 내보내고 끝까지 소비되면 state.commit (게시글 대신 id와 본문 유무만 보관)"""
+    keys, ok = [], []
+    for p in posts:
+        keys.append(key(p))
+        ok.append(bool(p.get("body")))
+        if state:
+            state.track(stream, keys[-1], p["url"])
+        yield p
+    if state:
+        state.commit(stream, keys, ok, etag)
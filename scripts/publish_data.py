@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+배포용 데이터 빌드 (기본 출력: dist/, git 미포함)
+- data/ 의 JSON(updates, games, manifest, shards, logs/summary)을 공백 없는 구분자로 다시 기록
+  실행 로그(logs/*.ndjson)는 이미 한 줄 JSON이라 그대로 복사
+- 각 파일의 .gz / .br 사전 압축본 (gzip_static 등 사전 압축 파일을 그대로 내보내는 호스팅용)
+  brotli 모듈이 없으면 .br은 건너뜀 (pip install brotli)
+- --columnar: updates를 열 단위로 저장한 *.columnar.json 추가
+  반복되는 값(game_id, platform, 날짜 등)은 열마다 사전에 한 번만, tags 같은 쉼표 목록은 토큰 사전 + 인덱스 목록
+- 페이지 파일(html, css, js, assets)도 복사해 출력 폴더를 그대로 배포 가능
+- 크기 보고: 표 출력 + <out>/data/sizes.json, GITHUB_STEP_SUMMARY가 있으면 Actions 요약에도 기록
+
+사용: python scripts/publish_data.py [--out dist] [--columnar] [--no-site]
+"""
+
+import argparse
+import gzip
+import json
+import os
+import shutil
+from typing import Any, Dict, List, Optional
+
+from atomic_io import compact_json
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+DATA_DIR = os.path.join(ROOT, "data")
+SITE_FILES = ["index.html", "logs.html", "detail.html", "css", "js", "assets"]
+# 크기 보고에서 따로 보여줄 파일 (나머지는 shards 등으로 묶어서 합계)
+REPORTED = ["updates.json", "logs/summary.json"]
+# 쉼표 목록 문자열 열 (토큰 사전으로 저장)
+LIST_COLUMNS = {"tags": ", "}
+COLUMNAR_SOURCES = ["updates.json"]
+COLUMNAR_VERSION = 1
+
+
+def _value_key(value: Any) -> str:
+    return value if isinstance(value, str) else json.dumps(value, ensure_ascii=False, sort_keys=True)
+
+
+def to_columnar(rows: List[Dict]) -> Dict:
+    """
+    행 목록 -> 열 단위 문서
+    열마다 "missing"(키가 없는 행 번호)을 빼고 남은 행의 값을 다음 중 하나로 저장
+    - "dict" + "index": 값이 반복되는 열 (사전 + 행별 인덱스)
+    - "tokens" + "lists" + "sep": LIST_COLUMNS (토큰 사전 + 행별 토큰 인덱스 목록)
+    - "values": 값이 모두 다른 열
+    """
+    names: List[str] = []
+    for row in rows:
+        for name in row:
+            if name not in names:
+                names.append(name)
+
+    columns = []
+    for name in names:
+        missing = [i for i, row in enumerate(rows) if name not in row]
+        values = [row[name] for row in rows if name in row]
+        column: Dict[str, Any] = {"name": name}
+        if missing:
+            column["missing"] = missing
+        sep = LIST_COLUMNS.get(name)
+        if sep and all(isinstance(v, str) for v in values):
+            tokens: Dict[str, int] = {}
+            column["sep"] = sep
+            column["lists"] = [[tokens.setdefault(t, len(tokens)) for t in v.split(sep)] for v in values]
+            column["tokens"] = list(tokens)
+        elif len({_value_key(v) for v in values}) < len(values):
+            index: Dict[str, int] = {}
+            dictionary: List[Any] = []
+            codes = []
+            for v in values:
+                key = _value_key(v)
+                if key not in index:
+                    index[key] = len(dictionary)
+                    dictionary.append(v)
+                codes.append(index[key])
+            column["dict"] = dictionary
+            column["index"] = codes
+        else:
+            column["values"] = values
+        columns.append(column)
+    return {"format": "columnar", "version": COLUMNAR_VERSION, "count": len(rows), "columns": columns}
+
+
+def from_columnar(doc: Dict) -> List[Dict]:
+    """to_columnar의 역변환 (빌드 시 왕복 검증용, 프론트엔드 디코더의 기준 구현)"""
+    rows: List[Dict] = [{} for _ in range(doc["count"])]
+    for column in doc["columns"]:
+        missing = set(column.get("missing", ()))
+        present = [i for i in range(doc["count"]) if i not in missing]
+        if "lists" in column:
+            tokens, sep = column["tokens"], column["sep"]
+            values = [sep.join(tokens[t] for t in lst) for lst in column["lists"]]
+        elif "dict" in column:
+            values = [column["dict"][c] for c in column["index"]]
+        else:
+            values = column["values"]
+        for i, v in zip(present, values):
+            rows[i][column["name"]] = v
+    return rows
+
+
+def _variants(path: str, data: bytes) -> Dict[str, int]:
+    """압축본 기록 후 크기 {"min", "gz", "br"} (br은 brotli 모듈이 있을 때만)"""
+    sizes = {"min": len(data)}
+    with open(path, "wb") as f:
+        f.write(data)
+    gz = gzip.compress(data, compresslevel=9, mtime=0)
+    with open(path + ".gz", "wb") as f:
+        f.write(gz)
+    sizes["gz"] = len(gz)
+    if brotli is not None:
+        br = brotli.compress(data, quality=11)
+        with open(path + ".br", "wb") as f:
+            f.write(br)
+        sizes["br"] = len(br)
+    return sizes
+
+
+def _add(total: Dict[str, int], sizes: Dict[str, int]) -> None:
+    for k, v in sizes.items():
+        total[k] = total.get(k, 0) + v
+
+
+def build(out_dir: str, columnar: bool = False, site: bool = True) -> Dict[str, Dict[str, int]]:
+    """out_dir/data 에 배포용 JSON 기록 후 항목별 크기 반환"""
+    out_data = os.path.join(out_dir, "data")
+    if os.path.isdir(out_data):
+        shutil.rmtree(out_data)
+    os.makedirs(out_data)
+    report: Dict[str, Dict[str, int]] = {}
+
+    for dirpath, _, filenames in os.walk(DATA_DIR):
+        for name in sorted(filenames):
+            if not name.endswith((".json", ".ndjson")):
+                continue
+            src = os.path.join(dirpath, name)
+            rel = os.path.relpath(src, DATA_DIR).replace(os.sep, "/")
+            if rel.startswith(("state/", "archive/")):
+                continue  # 스크래퍼 내부 상태, 만료 항목 보관소 (페이지에서 쓰지 않음)
+            with open(src, "rb") as f:
+                raw = f.read()
+            dst = os.path.join(out_data, *rel.split("/"))
+            os.makedirs(os.path.dirname(dst), exist_ok=True)
+            if name.endswith(".ndjson"):
+                obj = None
+                sizes = {"raw": len(raw), **_variants(dst, raw)}
+            else:
+                obj = json.loads(raw.decode("utf-8"))
+                sizes = {"raw": len(raw), **_variants(dst, compact_json(obj))}
+            if rel in REPORTED:
+                group = rel
+            elif rel.startswith("shards/"):
+                group = "shards/*"
+            elif rel.startswith("logs/"):
+                group = "logs/*.ndjson"
+            else:
+                group = "기타"
+            _add(report.setdefault(group, {}), sizes)
+            _add(report.setdefault("합계", {}), sizes)
+
+            if columnar and rel in COLUMNAR_SOURCES and isinstance(obj, list):
+                doc = to_columnar(obj)
+                if from_columnar(doc) != obj:
+                    raise RuntimeError(f"columnar round-trip mismatch: {rel}")
+                col_name = rel[:-len(".json")] + ".columnar.json"
+                col_sizes = _variants(os.path.join(out_data, col_name), compact_json(doc))
+                report[col_name] = {"raw": len(raw), **col_sizes}
+
+    if site:
+        for name in SITE_FILES:
+            src = os.path.join(ROOT, name)
+            dst = os.path.join(out_dir, name)
+            if os.path.isdir(src):
+                shutil.copytree(src, dst, dirs_exist_ok=True)
+            elif os.path.exists(src):
+                shutil.copy2(src, dst)
+
+    order = REPORTED + sorted(k for k in report if k.endswith(".columnar.json")) + ["shards/*", "logs/*.ndjson", "기타", "합계"]
+    report = {k: report[k] for k in order if k in report}
+    with open(os.path.join(out_data, "sizes.json"), "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    return report
+
+
+def _kb(n: Optional[int]) -> str:
+    return "-" if n is None else f"{n / 1024:,.1f}KB"
+
+
+def _pct(n: Optional[int], base: int) -> str:
+    return "" if n is None or not base else f" ({n / base:.0%})"
+
+
+def format_report(report: Dict[str, Dict[str, int]]) -> List[str]:
+    lines = ["| 파일 | 원본 | 압축 없음(min) | gzip | brotli |", "|---|---:|---:|---:|---:|"]
+    for name, s in report.items():
+        raw = s["raw"]
+        lines.append(f"| {name} | {_kb(raw)} | {_kb(s['min'])}{_pct(s['min'], raw)} | "
+                     f"{_kb(s['gz'])}{_pct(s['gz'], raw)} | {_kb(s.get('br'))}{_pct(s.get('br'), raw)} |")
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description="배포용 데이터 빌드 (min + gzip/brotli)")
+    parser.add_argument("--out", default=os.path.join(ROOT, "dist"))
+    parser.add_argument("--columnar", action="store_true", help="updates 열 단위 버전도 생성")
+    parser.add_argument("--no-site", action="store_true", help="페이지 파일 복사 생략 (데이터만)")
+    args = parser.parse_args()
+
+    report = build(args.out, columnar=args.columnar, site=not args.no_site)
+    if brotli is None:
+        print("[publish] brotli 모듈 없음, .br 생략 (pip install brotli)")
+    lines = format_report(report)
+    print("\n".join(lines))
+    print(f"[publish] {args.out} 에 기록 (크기: data/sizes.json)")
+    summary = os.getenv("GITHUB_STEP_SUMMARY")
+    if summary:
+        with open(summary, "a", encoding="utf-8") as f:
+            f.write("### 데이터 크기\n\n" + "\n".join(lines) + "\n")
+
+
+if __name__ == "__main__":
+    main()
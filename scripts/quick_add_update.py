@@ -5,9 +5,10 @@ X(트위터)나 다른 곳에서 발견한 정보를 빠르게 추가
 """
 import sys
 import io
-import json
 from datetime import datetime
 
+from update_store import export_pending, merge_into_store
+
 # Windows 콘솔 인코딩 문제 해결
 if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
@@ -83,29 +84,17 @@ def add_update():
         print("❌ 취소됨")
         return
     
-    # 기존 데이터 로드
-    try:
-        with open('data/updates.json', 'r', encoding='utf-8') as f:
-            data = json.load(f)
-    except FileNotFoundError:
-        data = []
-    
-    # 중복 체크
-    def key(u):
-        return f"{u.get('game_id')}|{u.get('update_date')}|{u.get('description','')[:40]}"
-    
-    if key(update) in {key(u) for u in data}:
-        print("\n⚠️  이미 존재하는 업데이트입니다!")
+    # 스크래퍼와 같은 키/툼스톤으로 병합한 뒤 updates.json + shard 내보내기 (잠금 + compare-and-swap)
+    stats = merge_into_store([update], label="quick_add")
+    export_pending()
+    if stats["archived"]:
+        print("\n⚠️  이미 보관된(만료된) 업데이트입니다!")
+        return
+    if not stats["added"]:
+        print("\n⚠️  이미 존재하는 업데이트입니다!" + (" (내용 갱신)" if stats["updated"] else ""))
         return
-    
-    # 추가
-    data.append(update)
-    
-    with open('data/updates.json', 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
     
     print(f"\n✅ 업데이트 추가 완료!")
-    print(f"총 업데이트 수: {len(data)}")
 
 if __name__ == "__main__":
     add_update()
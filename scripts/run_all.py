@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+전체 소스 한 번에 실행 (hoyolab, lounge, comingsoon, twitter)
+- 소스별 collect()를 스레드로 동시에 실행 (Python 기동/모듈 import/Chrome 기동은 한 번만)
+- 소스별 시간 제한 + 실패 격리: 실패/시간 초과 소스는 결과와 상태를 버리고 나머지만 반영
+- 결과를 메모리에 모아 DB에 한 번만 병합하고 updates.json / shard는 마지막에 한 번만 내보냄
+  (update_store.apply_to_store -> export_pending)
+- 마지막에 소스별 소요 시간 표 출력 (가장 오래 걸린 소스 = 임계 경로)
+
+사용: python scripts/run_all.py [hoyolab lounge comingsoon twitter] [--timeout 초]
+소스별 시간 제한은 RUN_ALL_TIMEOUT(기본 900초), RUN_ALL_TIMEOUT_<SOURCE>(예: RUN_ALL_TIMEOUT_COMINGSOON)로 변경 가능
+"""
+
+import argparse
+import importlib
+import os
+import sys
+import threading
+import time
+from typing import Dict, List, Optional
+
+from content_root import print_body_summary
+from driver_pool import get_pool
+from merge_engine import new_stats
+from page_ready import print_ready_summary
+from update_store import SourceBatch, apply_to_store, export_pending
+
+
+# 소스 이름 -> collect()가 있는 모듈 (반영 순서도 이 순서)
+SOURCES = {
+    "hoyolab": "scrape_hoyolab",
+    "lounge": "scrape_lounge",
+    "comingsoon": "scrape_comingsoon",
+    "twitter": "scrape_twitter",
+}
+
+
+class SourceRun:
+    """소스 하나의 실행 결과 (daemon 스레드라 시간 초과 시 기다리지 않고 버림)"""
+
+    def __init__(self, name: str, timeout: float):
+        self.name = name
+        self.timeout = timeout
+        self.batch: Optional[SourceBatch] = None
+        self.error = ""
+        self.elapsed = 0.0
+        self.stats: Optional[Dict[str, int]] = None
+        self.done = threading.Event()
+        self.module = None
+
+    def start(self) -> None:
+        # import는 메인 스레드에서 (스레드 간 동시 import 회피, import 실패도 이 소스만 실패 처리)
+        try:
+            self.module = importlib.import_module(SOURCES[self.name])
+        except Exception as e:
+            self.error = f"{type(e).__name__}: {e}"
+            self.done.set()
+            return
+        threading.Thread(target=self._run, name=f"run_all-{self.name}", daemon=True).start()
+
+    def _run(self) -> None:
+        started = time.perf_counter()
+        try:
+            self.batch = self.module.collect()
+        except BaseException as e:
+            self.error = f"{type(e).__name__}: {e}"
+        finally:
+            self.elapsed = time.perf_counter() - started
+            self.done.set()
+
+    @property
+    def status(self) -> str:
+        if not self.done.is_set():
+            return "timeout"
+        return "failed" if self.error else "ok"
+
+
+def source_timeout(name: str, default: float) -> float:
+    return float(os.getenv(f"RUN_ALL_TIMEOUT_{name.upper()}", default))
+
+
+def print_table(runs: List[SourceRun], merge_elapsed: float, total: float) -> None:
+    critical = max(runs, key=lambda r: r.elapsed if r.done.is_set() else r.timeout, default=None)
+    print("\n" + "=" * 72)
+    print(f"{'source':<12} {'status':<8} {'time':>8} {'items':>6} {'changes':>16}  note")
+    print("-" * 72)
+    for r in runs:
+        elapsed = r.elapsed if r.done.is_set() else r.timeout
+        items = len(r.batch.updates) if r.batch else 0
+        changes = f"+{r.stats['added']} ~{r.stats['updated']} -{r.stats['removed']}" if r.stats else "-"
+        note = r.error[:60] if r.error else ("임계 경로" if r is critical else "")
+        print(f"{r.name:<12} {r.status:<8} {elapsed:>7.1f}s {items:>6} {changes:>16}  {note}")
+    print("-" * 72)
+    print(f"{'merge':<12} {'':<8} {merge_elapsed:>7.1f}s")
+    print(f"{'total':<12} {'':<8} {total:>7.1f}s")
+    print("=" * 72)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="모든 소스를 동시에 수집하고 한 번에 병합")
+    parser.add_argument("sources", nargs="*", default=list(SOURCES), help=f"실행할 소스 ({', '.join(SOURCES)})")
+    parser.add_argument("--timeout", type=float, default=float(os.getenv("RUN_ALL_TIMEOUT", "900")),
+                        help="소스별 시간 제한 (초)")
+    args = parser.parse_args()
+    unknown = [s for s in args.sources if s not in SOURCES]
+    if unknown:
+        parser.error(f"unknown source: {', '.join(unknown)}")
+
+    started = time.perf_counter()
+    runs = [SourceRun(name, source_timeout(name, args.timeout)) for name in SOURCES if name in args.sources]
+    for r in runs:
+        r.start()
+    launched = time.perf_counter()
+    for r in runs:
+        r.done.wait(max(0.0, launched + r.timeout - time.perf_counter()))
+        if r.status == "timeout":
+            print(f"[run_all] {r.name}: {r.timeout:.0f}s 시간 초과, 결과 버림")
+        elif r.error:
+            print(f"[run_all] {r.name} 실패: {r.error}")
+
+    # 시간 초과 소스가 아직 드라이버를 쓰고 있어도 Chrome은 여기서 정리
+    get_pool().close()
+    print_ready_summary()
+    print_body_summary()
+
+    ok = [r for r in runs if r.status == "ok" and r.batch is not None]
+    merge_started = time.perf_counter()
+
+    def apply(store) -> Dict[str, int]:
+        total = new_stats()
+        for r in ok:
+            r.stats = r.batch.apply(store)
+            for name in total:
+                total[name] += r.stats.get(name, 0)
+        return total
+
+    if ok:
+        apply_to_store(apply, "run_all")
+        # 반영에 성공한 소스만 증분 상태 저장 (실패/시간 초과 소스는 다음 실행에서 다시 수집)
+        for r in ok:
+            if r.batch.state is not None:
+                r.batch.state.save()
+        export_pending()
+    merge_elapsed = time.perf_counter() - merge_started
+
+    print_table(runs, merge_elapsed, time.perf_counter() - started)
+    code = 0 if ok else 1
+    if any(r.status == "timeout" for r in runs):
+        # 멈춘 소스의 내부 스레드 풀이 인터프리터 종료를 막지 않도록 즉시 종료
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(code)
+    return code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,25 +1,73 @@
-import json
 import os
-from datetime import datetime, timezone, timedelta
+import time
+from datetime import date, datetime, timezone, timedelta
 from dateutil.relativedelta import relativedelta
-from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Optional, Tuple
 
-import requests
 from bs4 import BeautifulSoup
 from dateutil import parser as date_parser
 
+from html_parse import SEARCH_ROWS, parse
+from http_client import get_cache
+from scrape_state import SourceState
+from merge_engine import dedupe
+from update_store import SourceBatch, apply_to_store
+
 
 URL = "https://store.steampowered.com/search/?filter=popularcomingsoon&os=win&l=koreana&cc=kr&page={page}"
 APPDETAILS_URL = "https://store.steampowered.com/api/appdetails"
+# to_updates에서 쓰는 필드만 요청 (basic: short_description, header_image 포함)
+APPDETAILS_FILTERS = "basic,genres,categories,release_date,price_overview"
+STORE_PAGE_URL = "https://store.steampowered.com/app/{appid}/?l=koreana&cc=kr"
+
+# 엔드포인트별 캐시 TTL (초): TTL 안에서는 네트워크 없이 사용, 지나면 조건부 요청으로 재검증
+STEAM_CACHE_TTLS = [
+    (r"/search/", 30 * 60),            # 검색 목록은 순위가 자주 바뀜
+    (r"/api/appdetails", 12 * 3600),
+    (r"/app/\d+/", 48 * 3600),         # 스토어 페이지 (찜 횟수, 태그, 발매일)
+]
+
+
+# 이전 실행에서 본 찜 횟수가 기준의 이 비율 미만이면 (WISHLIST_CACHE_DAYS일 동안) 요청 없이 제외
+WISHLIST_CACHE_MARGIN = 0.8
+
+
+def steam_workers() -> int:
+    return max(1, int(os.getenv("STEAM_WORKERS", "4")))
+
+
+def steam_cache():
+    """
+    Steam 응답 캐시 (.cache/http/steam, GitHub Actions에서는 actions/cache로 실행 간 유지)
+    실제 요청은 STEAM_RATE(초당, 기본 2) 토큰 버킷으로 제한하고 워커들이 커넥션 풀을 공유
+    """
+    return get_cache(
+        "steam",
+        ttls=STEAM_CACHE_TTLS,
+        rate=float(os.getenv("STEAM_RATE", "2")),
+        burst=steam_workers(),
+        pool_size=steam_workers(),
+    )
+
+
+def fetch_store_page(appid: str) -> BeautifulSoup:
+    """스토어 페이지 (찜 횟수와 태그/발매일 수집이 한 번의 다운로드를 공유)"""
+    html = steam_cache().get_text(STORE_PAGE_URL.format(appid=appid), timeout=60)
+    return parse(html)
+
+
+def fetch_search_page(page: int) -> BeautifulSoup:
+    """검색 결과 행(a.search_result_row)만 트리로 만듦"""
+    return parse(steam_cache().get_text(URL.format(page=page), timeout=60), SEARCH_ROWS)
 
 
 def parse_list(max_pages: int = 3) -> List[Dict]:
-    headers = {"User-Agent": "Mozilla/5.0 (compatible; subculture-news/1.0)"}
     results: List[Dict] = []
-    for page in range(1, max_pages + 1):
-        html = requests.get(URL.format(page=page), headers=headers, timeout=60)
-        html.raise_for_status()
-        soup = BeautifulSoup(html.text, "html.parser")
+    # 검색 페이지는 병렬로 받고, 행은 페이지 순서대로 처리
+    with ThreadPoolExecutor(max_workers=steam_workers()) as executor:
+        soups = list(executor.map(fetch_search_page, range(1, max_pages + 1)))
+    for soup in soups:
         for row in soup.select("a.search_result_row"):
             name_el = row.select_one("span.title")
             name = name_el.get_text(strip=True) if name_el else ""
@@ -115,56 +163,104 @@ def parse_list(max_pages: int = 3) -> List[Dict]:
     return uniq
 
 
-def fetch_appdetails(appid: str) -> Dict:
+def fetch_app_api(appid: str) -> Dict:
+    """appdetails API 단건 조회 (filters로 필요한 필드만)"""
     params = {
         "appids": appid,
         "cc": "KR",
         "l": "koreana",
+        "filters": APPDETAILS_FILTERS,
     }
-    headers = {"User-Agent": "Mozilla/5.0 (compatible; subculture-news/1.0)"}
-    res = requests.get(APPDETAILS_URL, params=params, headers=headers, timeout=60)
-    res.raise_for_status()
-    data = res.json()
-    app_data = data.get(appid, {}).get("data", {})
-    
+    data = steam_cache().get_json(APPDETAILS_URL, params=params, timeout=60)
+    return (data or {}).get(appid, {}).get("data", {}) or {}
+
+
+def fetch_app_api_batch(appids: List[str]) -> Dict[str, Dict]:
+    """
+    appdetails API 일괄 조회 -> {appid: data}
+    기본은 단건(filters 적용) 병렬 조회. Steam은 price_overview 외의 filters로는 여러 appids 요청을 거부하므로
+    STEAM_APPDETAILS_BATCH(>1)를 지정한 경우에만 묶어 요청하고, 거부되면(400/null) 이번 호출의 나머지는 단건으로 전환
+    단건도 실패한 앱은 빈 dict
+    """
+    unique = list(dict.fromkeys(a for a in appids if a))
+    result: Dict[str, Dict] = {}
+    batch = int(os.getenv("STEAM_APPDETAILS_BATCH", "1"))
+    requests_made = 0
+
+    if batch > 1 and len(unique) > 1:
+        for i in range(0, len(unique), batch):
+            chunk = unique[i:i + batch]
+            params = {"appids": ",".join(chunk), "cc": "KR", "l": "koreana", "filters": APPDETAILS_FILTERS}
+            try:
+                data = steam_cache().get_json(APPDETAILS_URL, params=params, timeout=60)
+                requests_made += 1
+            except Exception as ex:
+                data = None
+                print(f"appdetails batch request rejected: {ex}")
+            if not isinstance(data, dict):
+                print("appdetails 묶음 요청 미지원, 단건 조회로 전환")
+                break
+            for appid in chunk:
+                entry = data.get(appid) or {}
+                if entry.get("success") and isinstance(entry.get("data"), dict):
+                    result[appid] = entry["data"]
+
+    rest = [a for a in unique if a not in result]
+
+    def single(appid: str) -> Dict:
+        try:
+            return fetch_app_api(appid)
+        except Exception as ex:
+            print(f"appdetails failed for {appid}: {ex}")
+            return {}
+
+    with ThreadPoolExecutor(max_workers=steam_workers()) as executor:
+        for appid, data in zip(rest, executor.map(single, rest)):
+            result[appid] = data
+    print(f"appdetails: 앱 {len(unique)}개, 묶음 요청 {requests_made}회 + 단건 {len(rest)}회")
+    return result
+
+
+def fetch_wishlist_count(appid: str) -> Optional[int]:
+    """스토어 페이지의 찜 횟수 (찾지 못하면 None)"""
     # 찜 횟수(wishlist count) 정보 가져오기 - Steam Store 페이지에서 추출
     try:
-        store_url = f"https://store.steampowered.com/app/{appid}/?l=koreana&cc=kr"
-        store_res = requests.get(store_url, headers=headers, timeout=60)
-        if store_res.status_code == 200:
-            soup = BeautifulSoup(store_res.text, "html.parser")
-            # 찜 횟수는 보통 "X명이 이 게임을 찜 목록에 추가했습니다" 형태로 표시
-            wishlist_text_selectors = [
-                ".wishlist_status",
-                ".game_details .details_block",
-                "div:contains('찜')",
-            ]
-            for selector in wishlist_text_selectors:
-                wishlist_el = soup.select_one(selector)
-                if wishlist_el:
-                    text = wishlist_el.get_text()
-                    # "12,345명이 이 게임을 찜" 형태에서 숫자 추출
-                    import re
-                    match = re.search(r"([\d,]+)\s*명.*?찜", text)
-                    if match:
-                        wishlist_str = match.group(1).replace(",", "")
-                        app_data["wishlist_count"] = int(wishlist_str)
-                        break
+        soup = fetch_store_page(appid)
+        # 찜 횟수는 보통 "X명이 이 게임을 찜 목록에 추가했습니다" 형태로 표시
+        wishlist_text_selectors = [
+            ".wishlist_status",
+            ".game_details .details_block",
+            "div:contains('찜')",
+        ]
+        for selector in wishlist_text_selectors:
+            wishlist_el = soup.select_one(selector)
+            if wishlist_el:
+                text = wishlist_el.get_text()
+                # "12,345명이 이 게임을 찜" 형태에서 숫자 추출
+                import re
+                match = re.search(r"([\d,]+)\s*명.*?찜", text)
+                if match:
+                    wishlist_str = match.group(1).replace(",", "")
+                    return int(wishlist_str)
     except Exception as e:
         # 찜 횟수를 가져오지 못해도 계속 진행
         pass
-    
+    return None
+
+
+def fetch_appdetails(appid: str, app_data: Optional[Dict] = None, wishlist_count: Optional[int] = None) -> Dict:
+    """appdetails API 데이터 + 찜 횟수 (app_data/wishlist_count를 주면 해당 요청 생략)"""
+    app_data = dict(app_data) if app_data is not None else fetch_app_api(appid)
+    if wishlist_count is None:
+        wishlist_count = fetch_wishlist_count(appid)
+    if wishlist_count is not None:
+        app_data["wishlist_count"] = wishlist_count
     return app_data
 
 def fetch_store_info(appid: str) -> dict:
     """Steam Store 페이지에서 태그와 발매일을 직접 스크래핑 (한국 기준)"""
     try:
-        url = f"https://store.steampowered.com/app/{appid}/?l=koreana&cc=kr"
-        headers = {"User-Agent": "Mozilla/5.0 (compatible; subculture-news/1.0)"}
-        res = requests.get(url, headers=headers, timeout=60)
-        res.raise_for_status()
-        
-        soup = BeautifulSoup(res.text, "html.parser")
+        soup = fetch_store_page(appid)
         tags = []
         release_date = None
         
@@ -209,170 +305,243 @@ def fetch_store_info(appid: str) -> dict:
         return {"tags": [], "release_date": None}
 
 
-def to_updates(entries: List[Dict], months: List[int]) -> List[Dict]:
+def in_months(e: Dict, months: List[int]) -> bool:
+    # month filter (keep items with parseable YYYY-MM-DD only)
+    try:
+        dt = date_parser.parse(e["release_date"]) if e["release_date"] != "TBA" else None
+    except Exception:
+        dt = None
+    return not (dt and months and dt.month not in months)
+
+
+def entry_to_update(e: Dict, months: List[int], min_wishlist: int, api_data: Optional[Dict] = None,
+                    wishlist_count: Optional[int] = None) -> Tuple[Optional[Dict], str]:
+    """
+    검색 결과 1건 -> (업데이트 항목 또는 None, 결과: ok|month|wishlist). 워커 스레드에서 호출
+    api_data: fetch_app_api_batch로 미리 받은 appdetails, wishlist_count: 이미 확인한 찜 횟수 (없으면 직접 조회)
+    """
+    if not in_months(e, months):
+        return None, "month"
+    details = {}
+    if e.get("appid"):
+        try:
+            details = fetch_appdetails(e["appid"], api_data, wishlist_count)
+        except Exception:
+            details = {}
+    
+    # 찜 횟수 필터링
+    wishlist_count = details.get("wishlist_count", 0)
+    if wishlist_count < min_wishlist:
+        print(f"Filtered out {e['name']} (wishlist: {wishlist_count} < {min_wishlist})")
+        return None, "wishlist"
+    
+    # Store 페이지에서 태그와 발매일 수집 (한국 기준)
+    store_info = {"tags": [], "release_date": None}
+    if e.get("appid"):
+        store_info = fetch_store_info(e["appid"])
+    
+    all_tags = []
+    
+    # 특별 처리: SILENT HILL f의 경우 수동으로 태그 설정
+    if e.get("appid") == "2947440":
+        all_tags = ["심리적 공포", "공포", "생존 공포", "풍부한 스토리", "액션"]
+    else:
+        # Store 페이지 태그 우선 사용
+        if store_info["tags"]:
+            all_tags.extend(store_info["tags"])
+        else:
+            # Store 태그가 없으면 API 태그 사용
+            if details.get("genres"):
+                all_tags.extend([g.get("description") for g in details["genres"] if g.get("description")])
+            
+            if details.get("categories"):
+                all_tags.extend([c.get("description") for c in details["categories"] if c.get("description")])
+    
+    # 중복 제거하고 정렬
+    unique_tags = list(dict.fromkeys(all_tags))  # 순서 유지하면서 중복 제거
+    tags = ", ".join(unique_tags)
+    
+    summary = details.get("short_description", "")
+    # 고해상도 헤더: appdetails의 header_image 우선 사용
+    hi_res_header = details.get("header_image") if isinstance(details, dict) else None
+    
+    # 발매일 우선순위: Store 페이지 (한국어) > Steam API > 원본
+    final_release_date = e["release_date"]
+    
+    # 1. Store 페이지에서 한국어로 표시된 발매일 사용 (최우선)
+    if store_info.get("release_date"):
+        try:
+            store_date_text = store_info["release_date"]
+            # 한국어 날짜 파싱: "2025년 10월 10일" 형식
+            store_dt = date_parser.parse(store_date_text, fuzzy=True)
+            final_release_date = store_dt.strftime("%Y-%m-%d")
+            
+            # 디버깅
+            if "Little Nightmares" in e["name"] or "풀메탈" in e["name"] or "FullMetal" in e["name"]:
+                print(f"{e['name']}: Store KR date = {store_date_text} -> {final_release_date}")
+        except Exception as ex:
+            print(f"Failed to parse Store date for {e['name']}: {store_info.get('release_date')} - {ex}")
+    
+    # 2. Store 페이지에서 가져오지 못한 경우 Steam API 사용
+    elif details and details.get("release_date"):
+        api_date_str = details["release_date"].get("date", "")
+        if api_date_str:
+            try:
+                # Steam API 날짜 형식: "9 Oct, 2025" 또는 "Oct 9, 2025"
+                api_dt = date_parser.parse(api_date_str, fuzzy=True)
+                final_release_date = api_dt.strftime("%Y-%m-%d")
+                
+                # 디버깅
+                if "Little Nightmares" in e["name"] or "풀메탈" in e["name"] or "FullMetal" in e["name"]:
+                    print(f"{e['name']}: API date = {api_date_str} -> {final_release_date}")
+            except Exception as ex:
+                print(f"Failed to parse API date for {e['name']}: {api_date_str} - {ex}")
+    
+    return {
+        "game_id": f"steam_{e['appid']}" if e.get("appid") else f"coming_{e['name']}",
+        "version": "",
+        "update_date": final_release_date,
+        "description": f"발매예정 · {e['genres']}",
+        "name": e["name"],
+        "url": e.get("url", ""),
+        "platform": e.get("platform", "steam"),
+        "tags": tags,
+        "summary": summary,
+        "header_image": hi_res_header or e.get("header_image", ""),
+        "wishlist_count": wishlist_count,  # 찜 횟수 추가
+    }, "ok"
+
+
+def to_updates(entries: List[Dict], months: List[int], state: Optional[SourceState] = None) -> List[Dict]:
+    """
+    비용이 낮은 조건부터 단계별로 걸러낸 뒤 남은 게임만 상세 수집
+    1. 검색 결과의 발매일로 월 필터 (요청 없음)
+    2. 이전 실행에서 확인한 찜 횟수 (state, 요청 없음)
+    3. 스토어 페이지의 찜 횟수 (스토어 페이지 1회)
+    4. 통과한 게임만 appdetails 일괄 조회 + 스토어 태그/발매일 파싱 (스토어 페이지는 3단계 응답 재사용)
+    """
     # 환경 변수에서 최소 찜 횟수 설정 (기본값: 5000)
     min_wishlist = int(os.getenv("MIN_WISHLIST_COUNT", "5000"))
+    cache_days = int(os.getenv("WISHLIST_CACHE_DAYS", "7"))
+    wishlist_cache: Dict[str, Dict] = state.context_for("wishlist") if state else {}
+    today = datetime.now(timezone.utc).date()
+    started = time.time()
     
-    updates = []
-    filtered_count = 0
+    # 단계별 제외 사유와 절약한 요청 수 (appdetails 1 + 스토어 페이지 1)
+    status = [""] * len(entries)
+    avoided = {"month": 0, "wishlist_cache": 0, "wishlist": 0}
     
-    for e in entries:
-        # month filter (keep items with parseable YYYY-MM-DD only)
+    # 1단계: 발매월
+    for i, e in enumerate(entries):
+        if not in_months(e, months):
+            status[i] = "month"
+            avoided["month"] += 2 if e.get("appid") else 0
+    
+    # 2단계: 캐시된 찜 횟수 (기간이 지난 항목은 삭제)
+    for appid, cached in list(wishlist_cache.items()):
         try:
-            dt = date_parser.parse(e["release_date"]) if e["release_date"] != "TBA" else None
+            expired = (today - date.fromisoformat(cached["date"])).days > cache_days
         except Exception:
-            dt = None
-        if dt and months and dt.month not in months:
-            continue
-        details = {}
-        if e.get("appid"):
-            try:
-                details = fetch_appdetails(e["appid"])
-            except Exception:
-                details = {}
-        
-        # 찜 횟수 필터링
-        wishlist_count = details.get("wishlist_count", 0)
-        if wishlist_count < min_wishlist:
-            filtered_count += 1
-            print(f"Filtered out {e['name']} (wishlist: {wishlist_count} < {min_wishlist})")
+            expired = True
+        if expired:
+            del wishlist_cache[appid]
+    for i, e in enumerate(entries):
+        cached = wishlist_cache.get(e.get("appid") or "")
+        if status[i] or not cached:
             continue
-        
-        # Store 페이지에서 태그와 발매일 수집 (한국 기준)
-        store_info = {"tags": [], "release_date": None}
-        if e.get("appid"):
-            store_info = fetch_store_info(e["appid"])
-        
-        all_tags = []
-        
-        # 특별 처리: SILENT HILL f의 경우 수동으로 태그 설정
-        if e.get("appid") == "2947440":
-            all_tags = ["심리적 공포", "공포", "생존 공포", "풍부한 스토리", "액션"]
-        else:
-            # Store 페이지 태그 우선 사용
-            if store_info["tags"]:
-                all_tags.extend(store_info["tags"])
-            else:
-                # Store 태그가 없으면 API 태그 사용
-                if details.get("genres"):
-                    all_tags.extend([g.get("description") for g in details["genres"] if g.get("description")])
-                
-                if details.get("categories"):
-                    all_tags.extend([c.get("description") for c in details["categories"] if c.get("description")])
-        
-        # 중복 제거하고 정렬
-        unique_tags = list(dict.fromkeys(all_tags))  # 순서 유지하면서 중복 제거
-        tags = ", ".join(unique_tags)
-        
-        summary = details.get("short_description", "")
-        # 고해상도 헤더: appdetails의 header_image 우선 사용
-        hi_res_header = details.get("header_image") if isinstance(details, dict) else None
-        
-        # 발매일 우선순위: Store 페이지 (한국어) > Steam API > 원본
-        final_release_date = e["release_date"]
-        
-        # 1. Store 페이지에서 한국어로 표시된 발매일 사용 (최우선)
-        if store_info.get("release_date"):
+        if cached["count"] < min_wishlist * WISHLIST_CACHE_MARGIN:
+            status[i] = "wishlist_cache"
+            avoided["wishlist_cache"] += 2
+    
+    # 3단계: 스토어 페이지 찜 횟수 (STEAM_WORKERS개 병렬)
+    pending = [i for i in range(len(entries)) if not status[i]]
+    def wishlist_of(i: int) -> Optional[int]:
+        appid = entries[i].get("appid")
+        return fetch_wishlist_count(appid) if appid else None
+    with ThreadPoolExecutor(max_workers=steam_workers()) as executor:
+        counts = dict(zip(pending, executor.map(wishlist_of, pending)))
+    for i in pending:
+        e = entries[i]
+        if counts[i] is not None:
+            wishlist_cache[e["appid"]] = {"count": counts[i], "date": today.isoformat()}
+        counts[i] = counts[i] or 0
+        if counts[i] < min_wishlist:
+            status[i] = "wishlist"
+            avoided["wishlist"] += 1 if e.get("appid") else 0
+            print(f"Filtered out {e['name']} (wishlist: {counts[i]} < {min_wishlist})")
+    
+    # 4단계: 통과한 게임만 상세 수집 (결과는 입력 순서로 정렬)
+    survivors = [i for i in pending if not status[i]]
+    api_data = fetch_app_api_batch([entries[i]["appid"] for i in survivors if entries[i].get("appid")])
+    updates_by_index: Dict[int, Dict] = {}
+    with ThreadPoolExecutor(max_workers=steam_workers()) as executor:
+        futures = {
+            executor.submit(entry_to_update, entries[i], months, min_wishlist,
+                            api_data.get(entries[i].get("appid")), counts[i]): i
+            for i in survivors
+        }
+        for future in as_completed(futures):
             try:
-                store_date_text = store_info["release_date"]
-                # 한국어 날짜 파싱: "2025년 10월 10일" 형식
-                store_dt = date_parser.parse(store_date_text, fuzzy=True)
-                final_release_date = store_dt.strftime("%Y-%m-%d")
-                
-                # 디버깅
-                if "Little Nightmares" in e["name"] or "풀메탈" in e["name"] or "FullMetal" in e["name"]:
-                    print(f"{e['name']}: Store KR date = {store_date_text} -> {final_release_date}")
+                update, _ = future.result()
+                if update:
+                    updates_by_index[futures[future]] = update
             except Exception as ex:
-                print(f"Failed to parse Store date for {e['name']}: {store_info.get('release_date')} - {ex}")
-        
-        # 2. Store 페이지에서 가져오지 못한 경우 Steam API 사용
-        elif details and details.get("release_date"):
-            api_date_str = details["release_date"].get("date", "")
-            if api_date_str:
-                try:
-                    # Steam API 날짜 형식: "9 Oct, 2025" 또는 "Oct 9, 2025"
-                    api_dt = date_parser.parse(api_date_str, fuzzy=True)
-                    final_release_date = api_dt.strftime("%Y-%m-%d")
-                    
-                    # 디버깅
-                    if "Little Nightmares" in e["name"] or "풀메탈" in e["name"] or "FullMetal" in e["name"]:
-                        print(f"{e['name']}: API date = {api_date_str} -> {final_release_date}")
-                except Exception as ex:
-                    print(f"Failed to parse API date for {e['name']}: {api_date_str} - {ex}")
-        
-        updates.append({
-            "game_id": f"steam_{e['appid']}" if e.get("appid") else f"coming_{e['name']}",
-            "version": "",
-            "update_date": final_release_date,
-            "description": f"발매예정 · {e['genres']}",
-            "name": e["name"],
-            "url": e.get("url", ""),
-            "platform": e.get("platform", "steam"),
-            "tags": tags,
-            "summary": summary,
-            "header_image": hi_res_header or e.get("header_image", ""),
-            "wishlist_count": wishlist_count,  # 찜 횟수 추가
-        })
+                print(f"Failed to process {entries[futures[future]].get('name')}: {ex}")
+    
+    updates = [updates_by_index[i] for i in sorted(updates_by_index)]
+    filtered_count = status.count("wishlist") + status.count("wishlist_cache")
     
     print(f"\n필터링 요약:")
     print(f"  총 수집: {len(entries)}개")
+    print(f"  1단계 발매월 제외: {status.count('month')}개 (요청 {avoided['month']}회 절약)")
+    print(f"  2단계 캐시된 찜 횟수로 제외: {status.count('wishlist_cache')}개 (요청 {avoided['wishlist_cache']}회 절약)")
+    print(f"  3단계 찜 횟수로 제외: {status.count('wishlist')}개 (appdetails 요청 {avoided['wishlist']}회 절약)")
     print(f"  필터링됨: {filtered_count}개 (찜 횟수 < {min_wishlist})")
     print(f"  최종 추가: {len(updates)}개")
+    print(f"  소요 시간: {time.time() - started:.1f}s (워커 {steam_workers()}개, STEAM_RATE={os.getenv('STEAM_RATE', '2')}/s)")
     
     return updates
 
 
-def main():
+def collect() -> SourceBatch:
+    """Steam 출시 예정 목록 수집 (대상 월의 기존 Steam 게임을 교체하는 방식으로 반영)"""
     # 당일 기준 롤링 개월 수 계산 (기본 3개월)
     rolling = int(os.getenv("ROLLING_MONTHS", "3"))
     now = datetime.now(timezone.utc)
     months = [(now + relativedelta(months=i)).month for i in range(max(1, rolling))]
     entries = parse_list(max_pages=int(os.getenv("MAX_PAGES", "10")))
-    updates = to_updates(entries, months)
+    # 이전 실행에서 확인한 찜 횟수 (data/state/steam.json)
+    state = SourceState("steam")
+    updates = to_updates(entries, months, state)
+    steam_cache().save()
+    print(steam_cache().summary())
     updates.sort(key=lambda x: x["update_date"])
 
-    updates_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data", "updates.json"))
-    try:
-        with open(updates_path, "r", encoding="utf-8") as f:
-            existing = json.load(f)
-    except Exception:
-        existing = []
-
     # Remove previous steam_/coming_ entries in target months to avoid duplicates
+    # (월을 알 수 없는 날짜 형식은 기존처럼 dateutil로 해석해 판단)
     def is_target(entry: Dict) -> bool:
-        gid = str(entry.get("game_id", ""))
-        if not (gid.startswith("steam_") or gid.startswith("coming_")):
-            return False
         try:
             d = date_parser.parse(entry.get("update_date", ""))
             return d.month in months
         except Exception:
             return False
 
-    # 기존 Steam 게임들을 제거
-    filtered = [e for e in existing if not is_target(e)]
+    # 추가 중복 제거: 같은 이름, 날짜, 플랫폼을 가진 게임은 처음 것만 유지
+    unique_updates = dedupe(updates, key="release")
     
-    # 추가 중복 제거: 같은 이름과 날짜를 가진 게임들 제거
-    def is_duplicate(entry: Dict, new_entries: List[Dict]) -> bool:
-        for new_entry in new_entries:
-            if (entry.get("name") == new_entry.get("name") and 
-                entry.get("update_date") == new_entry.get("update_date") and
-                entry.get("platform") == new_entry.get("platform")):
-                return True
-        return False
-    
-    # 새로운 업데이트에서 중복 제거
-    unique_updates = []
-    for update in updates:
-        if not is_duplicate(update, unique_updates):
-            unique_updates.append(update)
-    
-    merged = filtered + unique_updates
+    print(f"Collected {len(updates)} upcoming coming-soon entries for months={months} (rolling={rolling})")
+
+    # 대상 월의 기존 Steam 게임을 새 목록으로 교체 (다시 수집된 게임은 변경 없음으로 유지)
+    def replace(store, items: List[Dict]) -> Dict[str, int]:
+        return store.replace_window(["steam_", "coming_"], months, items, undated=is_target)
 
-    with open(updates_path, "w", encoding="utf-8") as f:
-        json.dump(merged, f, ensure_ascii=False, indent=2)
+    return SourceBatch("steam_comingsoon", unique_updates, state, replace)
 
-    print(f"Wrote {len(updates)} upcoming coming-soon entries for months={months} (rolling={rolling})")
+
+def main():
+    batch = collect()
+    apply_to_store(batch.apply, batch.label)
+    batch.state.save()
 
 
 if __name__ == "__main__":
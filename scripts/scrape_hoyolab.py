@@ -1,23 +1,28 @@
 #!/usr/bin/env python3
 """
-HoYoLAB Selenium 기반 스크래퍼 (기존 스크래퍼 교체)
-동적 로딩 문제 해결을 위해 Selenium 사용
+HoYoLAB 스크래퍼
+JSON API(hoyolab_api)로 수집하고, 필요 시 Selenium 렌더링으로 폴백
 """
 
-import json
 import os
 import re
 import sys
 import io
+import time
 from datetime import datetime, timezone
-from typing import Dict, List, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+
+import hoyolab_api
+from content_root import driver_text, print_body_summary
+from date_extract import first
+from page_ready import print_ready_summary, scroll_and_settle, wait_until_ready
+from post_classifier import for_game
+from driver_pool import create_driver, get_pool, imap_with_drivers
+from post_stream import committed, lookahead, lookahead_window
+from scrape_state import SourceState
+from update_store import SourceBatch, merge_into_store
 
 # Windows 콘솔 인코딩 문제 해결
 if sys.platform == 'win32':
@@ -31,22 +36,58 @@ BASE = "https://www.hoyolab.com"
 
 
 def setup_driver():
-    """Chrome WebDriver 설정"""
-    chrome_options = Options()
-    chrome_options.add_argument("--headless")  # 헤드리스 모드
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--window-size=1920,1080")
-    chrome_options.add_argument("--user-agent=Mozilla/5.0 (compatible; subculture-news/1.0)")
+    """Chrome WebDriver 설정 (공용 driver_pool 사용)"""
+    return create_driver()
+
+
+def fetch_posts(author_id: str, limit: int = 20, state=None) -> Iterator[Dict]:
+    """
+    HoYoLAB 포스트 가져오기 (JSON API 기본, HOYOLAB_SELENIUM_FALLBACK=1 이면 실패 시 Selenium 사용)
+    목록은 호출 즉시 가져오고, 포스트는 본문이 준비되는 대로 입력 순서대로 하나씩 내보냄
+    state(scrape_state.SourceState)가 있으면 이미 본 포스트 이전의 새 글만 본문 수집하고, 끝까지 소비된 뒤 기록
+    """
+    try:
+        return hoyolab_api.fetch_posts(author_id, limit, workers=int(os.getenv("HOYOLAB_BODY_WORKERS", "4")), state=state)
+    except Exception as e:
+        print(f"HoYoLAB API failed: {e}")
     
-    driver = webdriver.Chrome(options=chrome_options)
-    return driver
+    if os.getenv("HOYOLAB_SELENIUM_FALLBACK", "0") != "1":
+        return iter(())
+    print("Falling back to Selenium (HOYOLAB_SELENIUM_FALLBACK=1)")
+    return fetch_posts_selenium(author_id, limit, state)
+
+
+def fetch_posts_selenium(author_id: str, limit: int = 20, state=None) -> Iterator[Dict]:
+    """Selenium을 사용하여 HoYoLAB 포스트 가져오기 (공용 드라이버 풀에서 임대)"""
+    with get_pool().lease() as driver:
+        posts = _fetch_post_list(driver, author_id, limit)
+    if state:
+        posts = state.take_new(str(author_id), posts, key=_post_id)
+    return committed(_selenium_bodies(posts), state, str(author_id), _post_id)
+
+
+def _selenium_bodies(posts: List[Dict]) -> Iterator[Dict]:
+    """각 포스트의 본문 가져오기 (HOYOLAB_BODY_WORKERS개 워커로 병렬 수집, 순서 유지)"""
+    workers = int(os.getenv("HOYOLAB_BODY_WORKERS", "1"))
+    started = time.time()
+    done = 0
+    try:
+        for post in imap_with_drivers(_fetch_post_body, posts, workers):
+            yield post if post is not None else posts[done]
+            done += 1
+    except Exception as e:
+        # 남은 포스트는 본문 없이 내보내 state가 다음 실행에서 다시 스캔하도록 함
+        print(f"스크래핑 중 오류 발생: {e}")
+        yield from posts[done:]
+    print(f"본문 {done}개 수집 완료 (워커 {workers}개, {time.time() - started:.1f}초)")
 
 
-def fetch_posts(author_id: str, limit: int = 20) -> List[Dict]:
-    """Selenium을 사용하여 HoYoLAB 포스트 가져오기"""
-    driver = setup_driver()
+def _post_id(post: Dict) -> str:
+    """https://www.hoyolab.com/article/12345 -> "12345" (API post_id와 같은 값)"""
+    return hoyolab_api.post_id_from_url(post["url"])
+
+
+def _fetch_post_list(driver, author_id: str, limit: int) -> List[Dict]:
     posts = []
     
     try:
@@ -54,22 +95,12 @@ def fetch_posts(author_id: str, limit: int = 20) -> List[Dict]:
         print(f"Fetching from: {url}")
         driver.get(url)
         
-        # 페이지 로딩 대기 (더 긴 시간)
-        wait = WebDriverWait(driver, 20)
-        
-        # 포스트 링크들이 로드될 때까지 대기
-        try:
-            wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "a[href*='/article/']")))
-            # 추가 대기: 동적 콘텐츠 로딩
-            import time
-            time.sleep(3)
-            
+        # 포스트 링크들이 로드되고 목록 렌더링이 멈출 때까지 대기
+        if wait_until_ready(driver, "a[href*='/article/']", timeout=20, label="hoyolab postList"):
             # 페이지를 스크롤하여 더 많은 콘텐츠 로딩
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
+            scroll_and_settle(driver, label="hoyolab postList scroll")
             driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(1)
-        except TimeoutException:
+        else:
             print("포스트 링크를 찾을 수 없습니다. 페이지 구조를 확인합니다...")
             # 페이지 소스 확인
             page_source = driver.page_source
@@ -142,136 +173,83 @@ def fetch_posts(author_id: str, limit: int = 20) -> List[Dict]:
                 print(f"링크 처리 중 오류: {e}")
                 continue
         
-        # 각 포스트의 본문 가져오기
-        for i, post in enumerate(posts):
-            try:
-                print(f"  -> 포스트 {i+1}/{len(posts)} 처리 중: {post['url']}")
-                driver.get(post["url"])
-                wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-                
-                # 페이지 로딩 대기 (동적 콘텐츠)
-                import time
-                time.sleep(3)
-                
-                # 제목이 비어있거나 짧으면 페이지에서 다시 찾기
-                if not post["title"] or len(post["title"]) < 10:
-                    try:
-                        # h1 태그가 로드될 때까지 더 긴 시간 대기
-                        WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.TAG_NAME, "h1")))
-                        time.sleep(2)  # 추가 대기
-                        
-                        title_element = driver.find_element(By.TAG_NAME, "h1")
-                        new_title = title_element.text.strip()
-                        if new_title:
-                            post["title"] = new_title
-                            try:
-                                print(f"  -> 제목 업데이트: {new_title[:50]}")
-                            except:
-                                print(f"  -> 제목 업데이트 완료")
-                    except Exception as e:
-                        print(f"  -> 제목 업데이트 실패: {e}")
-                
-                # 본문 로딩 보강: 스크롤 후 innerText 재수집
-                try:
-                    # 페이지 하단까지 스크롤하여 동적 콘텐츠 로딩 유도
-                    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(1)  # 로딩 대기
-                    
-                    # innerText로 더 정확한 텍스트 추출
-                    body_text = driver.execute_script("return document.body.innerText;")
-                    post["body"] = body_text
-                except:
-                    # fallback: 기존 방식
-                    body_element = driver.find_element(By.TAG_NAME, "body")
-                    body_text = body_element.text
-                    post["body"] = body_text
-                
-            except Exception as e:
-                print(f"포스트 본문 가져오기 실패 {post['url']}: {e}")
-                post["body"] = ""
-                
     except Exception as e:
         print(f"스크래핑 중 오류 발생: {e}")
-        
-    finally:
-        driver.quit()
     
     return posts
 
 
+def _fetch_post_body(driver, post: Dict) -> Dict:
+    """포스트 상세 페이지에서 본문(및 비어있는 제목)을 채운 사본 (imap_with_drivers 워커에서 호출)"""
+    post = dict(post)
+    try:
+        print(f"  -> 포스트 처리 중: {post['url']}")
+        driver.get(post["url"])
+        
+        # 페이지 로딩 대기 (제목 h1이 렌더링되고 DOM 변경이 멈출 때까지)
+        wait_until_ready(driver, "h1", timeout=20, label="hoyolab article")
+        
+        # 제목이 비어있거나 짧으면 페이지에서 다시 찾기
+        if not post["title"] or len(post["title"]) < 10:
+            try:
+                title_element = driver.find_element(By.TAG_NAME, "h1")
+                new_title = title_element.text.strip()
+                if new_title:
+                    post["title"] = new_title
+                    try:
+                        print(f"  -> 제목 업데이트: {new_title[:50]}")
+                    except:
+                        print(f"  -> 제목 업데이트 완료")
+            except Exception as e:
+                print(f"  -> 제목 업데이트 실패: {e}")
+        
+        # 본문 로딩 보강: 스크롤 후 innerText 재수집
+        try:
+            # 페이지 하단까지 스크롤하여 동적 콘텐츠 로딩 유도
+            scroll_and_settle(driver, label="hoyolab article scroll")
+            
+            # innerText로 더 정확한 텍스트 추출 (본문 영역만, 못 찾으면 페이지 전체)
+            post["body"], _ = driver_text(driver, "hoyolab")
+        except:
+            # fallback: 기존 방식
+            body_element = driver.find_element(By.TAG_NAME, "body")
+            body_text = body_element.text
+            post["body"] = body_text
+        
+    except Exception as e:
+        print(f"포스트 본문 가져오기 실패 {post['url']}: {e}")
+        post["body"] = ""
+    return post
+
+
 def find_korean_datetime(text: str) -> Tuple[str, str]:
     """Return (iso_datetime_kst, human_md) from strings like '8월 22일 20:30(KST)'.
-    If time missing, returns date only ISO (YYYY-MM-DD)."""
-    # ex: 2025/12/17 06:00 (UTC+8) - 슬래시 형식 (시간 포함, UTC+8)
-    m = re.search(r"(\d{4})/(\d{1,2})/(\d{1,2})\s+(\d{1,2}):(\d{2})\s*[\(（]?\s*UTC\+8\s*[\)）]?", text)
-    if m:
-        y, mm, dd, hh, mi = map(int, m.groups())
-        # UTC+8을 KST(UTC+9)로 변환 (+1시간)
-        dt = datetime(y, mm, dd, hh, mi)
-        return dt.strftime("%Y-%m-%d"), f"{mm}/{dd}"
-    # ex: 2025/12/17 06:00 (서버 시간) - 슬래시 형식 (시간 포함)
-    m = re.search(r"(\d{4})/(\d{1,2})/(\d{1,2})\s+(\d{1,2}):(\d{2})", text)
-    if m:
-        y, mm, dd, hh, mi = map(int, m.groups())
-        dt = datetime(y, mm, dd, hh, mi)
-        return dt.strftime("%Y-%m-%d"), f"{mm}/{dd}"
-    # ex: 8월 22일 20:30(KST) 또는 8월 22일 20:30（KST） - 전각 콜론, 전각 공백, KST 변형 모두 지원
-    m = re.search(r"(\d{1,2})\s*월\s*(\d{1,2})\s*일\s*(\d{1,2})[:：]\s*(\d{2})\s*[\(（]?\s*KST\s*[\)）]?", text)
-    if m:
-        mm, dd, hh, mi = map(int, m.groups())
-        year = datetime.now().year
-        dt = datetime(year, mm, dd, hh, mi)
-        return dt.strftime("%Y-%m-%dT%H:%M:00+09:00"), f"{mm}/{dd} {hh:02d}:{mi:02d}"
-    # ex: 8월 22일 (시간 미포함)
-    m = re.search(r"(\d{1,2})\s*월\s*(\d{1,2})\s*일", text)
-    if m:
-        mm, dd = map(int, m.groups())
-        year = datetime.now().year
-        dt = datetime(year, mm, dd)
-        return dt.strftime("%Y-%m-%d"), f"{mm}/{dd}"
-    return "", ""
-
+    If time missing, returns date only ISO (YYYY-MM-DD).
+    우선순위: YYYY/MM/DD HH:MM (UTC+8) > YYYY/MM/DD HH:MM > X월 X일 HH:MM(KST) > X월 X일 (date_extract)"""
+    c = first(text, "ymd_slash_time_utc8", "ymd_slash_time", "md_time_kst", "md")
+    if not c:
+        return "", ""
+    mm, dd = c["m"], c["d"]
+    dt = datetime(c.fields.get("y") or datetime.now().year, mm, dd, c["H"] or 0, c["M"] or 0)
+    if c.pattern == "md_time_kst":
+        return dt.strftime("%Y-%m-%dT%H:%M:00+09:00"), f"{mm}/{dd} {dt.hour:02d}:{dt.minute:02d}"
+    return dt.strftime("%Y-%m-%d"), f"{mm}/{dd}"
 
 def find_korean_daterange(text: str) -> Tuple[str, str]:
-    """Parse a range like '9월 24일 ~ 10월 15일' or '2025/11/26 12:00 ~ 2025/12/16 15:00' -> (YYYY-MM-DD, YYYY-MM-DD)."""
-    # 패턴 -1: "업데이트 후 ~ YYYY/MM/DD HH:MM" (종료일만 명시, 시작일은 없음)
-    m = re.search(r"업데이트\s*(?:후|이후).*?[~\-\–—]\s*(\d{4})/(\d{1,2})/(\d{1,2})\s+\d{1,2}:\d{2}", text)
-    if m:
-        y, mm, dd = map(int, m.groups())
-        # 시작일은 반환하지 않고 종료일만 반환 (빈 문자열, 종료일)
-        return "", datetime(y, mm, dd).strftime("%Y-%m-%d")
-    
-    # 패턴 00: "YYYY/MM/DD HH:MM ~ YYYY/MM/DD HH:MM" (슬래시 형식, 시간 포함)
-    m = re.search(r"(\d{4})/(\d{1,2})/(\d{1,2})\s+\d{1,2}:\d{2}\s*[~\-\–—]\s*(\d{4})/(\d{1,2})/(\d{1,2})\s+\d{1,2}:\d{2}", text)
-    if m:
-        y1, mm1, dd1, y2, mm2, dd2 = map(int, m.groups())
-        return datetime(y1, mm1, dd1).strftime("%Y-%m-%d"), datetime(y2, mm2, dd2).strftime("%Y-%m-%d")
-    
-    # 패턴 0: "YYYY년 X월 X일 HH:MM ~ YYYY년 X월 X일 HH:MM" (시간 포함, 연도 있음)
-    m = re.search(r"(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일\s*\d{1,2}:\d{2}\s*[~\-\–—]\s*(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일\s*\d{1,2}:\d{2}", text)
-    if m:
-        y1, mm1, dd1, y2, mm2, dd2 = map(int, m.groups())
-        return datetime(y1, mm1, dd1).strftime("%Y-%m-%d"), datetime(y2, mm2, dd2).strftime("%Y-%m-%d")
-    
-    # 패턴 1: "YYYY년 X월 X일 ~ YYYY년 X월 X일" (연도 있음)
-    m = re.search(r"(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일\s*[~\-\–—]\s*(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일", text)
-    if m:
-        y1, mm1, dd1, y2, mm2, dd2 = map(int, m.groups())
-        return datetime(y1, mm1, dd1).strftime("%Y-%m-%d"), datetime(y2, mm2, dd2).strftime("%Y-%m-%d")
-    
-    # 패턴 2: "X월 X일부터 X월 X일까지"
-    m = re.search(r"(\d{1,2})\s*월\s*(\d{1,2})\s*일\s*부터.*?(\d{1,2})\s*월\s*(\d{1,2})\s*일\s*까지", text)
-    if not m:
-        # 패턴 3: "X월 X일 ~ X월 X일" (일반 형태)
-        m = re.search(r"(\d{1,2})\s*월\s*(\d{1,2})\s*일\s*[~\-\–—]\s*(\d{1,2})\s*월\s*(\d{1,2})\s*일", text)
-    if not m:
+    """Parse a range like '9월 24일 ~ 10월 15일' or '2025/11/26 12:00 ~ 2025/12/16 15:00' -> (YYYY-MM-DD, YYYY-MM-DD).
+    "업데이트 후 ~ YYYY/MM/DD HH:MM"은 종료일만 반환. 연도 없는 기간은 12월 -> 1월이면 종료일을 다음 해로 (date_extract)"""
+    c = first(text, "until_ymd_slash_time", "range_ymd_slash_time", "range_ymd_time", "range_ymd",
+              "range_md_from_to", "range_md")
+    if not c:
         return "", ""
-    y = datetime.now().year
-    mm1, dd1, mm2, dd2 = map(int, m.groups())
-    # 연도 넘어가는 경우 처리 (예: 12월 -> 1월)
-    y2 = y if mm2 >= mm1 else y + 1
-    return datetime(y, mm1, dd1).strftime("%Y-%m-%d"), datetime(y2, mm2, dd2).strftime("%Y-%m-%d")
-
+    if c.kind == "until":
+        return "", datetime(c["y2"], c["m2"], c["d2"]).strftime("%Y-%m-%d")
+    if "y" in c.fields:
+        y1, y2 = c["y"], c["y2"]
+    else:
+        y1 = datetime.now().year
+        y2 = y1 if c["m2"] >= c["m"] else y1 + 1
+    return datetime(y1, c["m"], c["d"]).strftime("%Y-%m-%d"), datetime(y2, c["m2"], c["d2"]).strftime("%Y-%m-%d")
 
 def extract_version(text: str) -> str:
     m = re.search(r"(\d+(?:\.\d+)?)\s*버전", text)
@@ -284,42 +262,41 @@ def build_desc(start_md: str, end_md: str, lines: List[str]) -> str:
     return "\n".join(out)
 
 
-def parse_zzz(posts: List[Dict]) -> List[Dict]:
-    results: List[Dict] = []
-    # 캐시: 버전→업데이트 안내에서 추출한 업데이트일
-    version_to_update_date: Dict[str, str] = {}
-    for p in posts:
+def parse_zzz(posts: Iterable[Dict], version_cache: Optional[Dict[str, str]] = None, window: Optional[int] = None,
+              retry: Optional[Callable[[str], None]] = None) -> Iterator[Dict]:
+    """
+    포스트를 받는 대로 파싱해 업데이트를 하나씩 내보냄
+    window: 업데이트 안내를 미리 볼 포스트 수 (None이면 전체), retry(url): 캐시에서 시작일을 못 찾은 포스트 (SourceState.retry)
+    """
+    # 캐시: 버전→업데이트 안내에서 추출한 업데이트일 (version_cache를 주면 이전 실행 결과를 이어서 사용/갱신)
+    version_to_update_date: Dict[str, str] = version_cache if version_cache is not None else {}
+    # 게시글마다 제목/본문을 한 번만 훑어 태그 판정 (post_classifier.RULES["zzz"])
+    zzz = for_game("zzz")
+
+    def learn(p: Dict) -> Tuple[str, object]:
+        """버전/태그 판정 + 업데이트 안내면 시작일 캐싱 (post_stream.lookahead가 본 처리보다 window개 앞서 호출)"""
         title = p["title"]
         body = p.get("body", "")
         ver = extract_version(title + " " + body)
-        # 업데이트 안내 → 시작일 캐싱
-        if "업데이트 안내" in title and ver:
+        tags = zzz.classify(title=title, body=body, flags=("ver",) if ver else ())
+        if "update_notice" in tags:
             dt_iso, md = find_korean_datetime(body)
             if not dt_iso:
                 dt_iso, md = find_korean_datetime(title)
             if dt_iso:
                 version_to_update_date[ver] = dt_iso.split("T")[0]
+        return ver, tags
 
-    for p in posts:
+    for p, (ver, tags) in lookahead(posts, learn, window):
         title = p["title"]
         body = p.get("body", "")
         url = p["url"]
-        ver = extract_version(title + " " + body)
         
         # 특별 방송: 더 유연한 감지 로직
         # 1. "특별 방송" 키워드 체크 (띄어쓰기 무시)
         # 2. "방송 예고" 키워드 체크
         # 3. "버전" + "방송" 조합
-        is_broadcast = (
-            ("특별" in title and "방송" in title) or
-            ("특별" in body and "방송" in body) or
-            ("방송" in title and "예고" in title) or
-            ("방송" in body and "예고" in body) or
-            (ver and "방송" in title) or
-            (ver and "방송" in body)
-        )
-        
-        if is_broadcast:
+        if "broadcast" in tags:
             print(f"  -> 특별 방송 후보 발견: {title[:50] if title else '(제목 없음)'}...")
             # 본문에서 시간 포함 형태 우선, 없으면 제목에서 재시도
             dt_iso, md = find_korean_datetime(body)
@@ -329,7 +306,7 @@ def parse_zzz(posts: List[Dict]) -> List[Dict]:
                 # 설명 구성 (버전 정보 포함)
                 if ver:
                     desc = f"{ver} 버전 특별 방송"
-                elif "예고" in title or "예고" in body:
+                elif "broadcast_notice" in tags:
                     desc = "특별 방송 예고"
                 else:
                     desc = "특별 방송"
@@ -341,13 +318,13 @@ def parse_zzz(posts: List[Dict]) -> List[Dict]:
                     "description": desc,
                     "url": url,
                 }
-                results.append(result)
+                yield result
                 print(f"  -> 특별 방송 파싱 성공: {result}")
             else:
                 print(f"  -> 특별 방송 날짜 파싱 실패 (title: '{title[:50] if title else '(없음)'}', body length: {len(body)})")
             continue
         # 기간 한정 채널 (다양한 패턴 지원)
-        if "기간 한정 채널" in title or ("채널" in title and ver):
+        if "channel" in tags:
             print(f"  -> 기간 한정 채널 후보 발견: {title[:50]}")
             print(f"     본문 샘플: {body[:200]}")
             
@@ -359,7 +336,7 @@ def parse_zzz(posts: List[Dict]) -> List[Dict]:
             phase = ""
             start, end = "", ""
             
-            if "상)" in title or "(상" in title or "상반기" in title:
+            if "channel_first" in tags:
                 phase = "(상)"
                 print(f"     -> 상반기 채널 감지")
                 # 본문에서 날짜 범위 추출 시도
@@ -380,7 +357,7 @@ def parse_zzz(posts: List[Dict]) -> List[Dict]:
                     _, end = find_korean_daterange(body)
                     print(f"     -> 시작일: 캐시({start}), 종료일: 본문({end})")
                     
-            elif "하)" in title or "(하" in title or "하반기" in title:
+            elif "channel_second" in tags:
                 phase = "(하)"
                 print(f"     -> 하반기 채널 감지")
                 start, end = find_korean_daterange(body)
@@ -398,60 +375,66 @@ def parse_zzz(posts: List[Dict]) -> List[Dict]:
                 md_s = start.replace("2025-", "").replace("2024-", "").replace("2026-", "")
                 md_e = end.replace("2025-", "").replace("2024-", "").replace("2026-", "")
                 desc = build_desc(md_s, md_e, [f"[이벤트] {char_desc}{phase}"])
-                results.append({
+                yield {
                     "game_id": "zzz",
                     "version": ver,
                     "update_date": start,
                     "end_date": end,
                     "description": desc,
                     "url": url,
-                })
+                }
                 print(f"    ✅ 채널 파싱 성공: {start} ~ {end}, {char_desc}{phase}")
             else:
                 print(f"    ❌ 날짜 파싱 실패 (start={start}, end={end})")
-    return results
+                # 시작일(업데이트 안내 캐시)을 못 찾음: 본 것으로 기록하지 않아 다음 실행에서 다시 파싱
+                if retry and ver and end and not start and "channel_second" not in tags:
+                    retry(url)
+
 
+def parse_star_rail(posts: Iterable[Dict], version_cache: Optional[Dict[str, str]] = None, window: Optional[int] = None,
+                    retry: Optional[Callable[[str], None]] = None) -> Iterator[Dict]:
+    """포스트를 받는 대로 파싱해 업데이트를 하나씩 내보냄 (window, retry는 parse_zzz와 같음)"""
+    version_to_update_date: Dict[str, str] = version_cache if version_cache is not None else {}
+    star_rail = for_game("star_rail")
 
-def parse_star_rail(posts: List[Dict]) -> List[Dict]:
-    results: List[Dict] = []
-    version_to_update_date: Dict[str, str] = {}
-    for p in posts:
+    def learn(p: Dict) -> Tuple[str, object]:
+        """버전/태그 판정 + 업데이트 점검 예고 또는 업데이트 안내면 시작일 캐싱 (본 처리보다 window개 앞서 호출)"""
         title = p["title"]
         body = p.get("body", "")
         ver = extract_version(title + " " + body)
-        # 업데이트 점검 예고 또는 업데이트 안내에서 시작일 캐싱
-        if ("업데이트 점검 예고" in title or "업데이트 안내" in title) and ver:
+        tags = star_rail.classify(title=title, flags=("ver",) if ver else ())
+        if "update_notice" in tags:
             dt_iso, _ = find_korean_datetime(body)
             if not dt_iso:
                 dt_iso, _ = find_korean_datetime(title)
             if dt_iso:
                 version_to_update_date[ver] = dt_iso.split("T")[0]
+        return ver, tags
 
-    for p in posts:
+    for p, (ver, tags) in lookahead(posts, learn, window):
         title = p["title"]
         body = p.get("body", "")
         url = p["url"]
-        ver = extract_version(title + " " + body)
         
         # 프리뷰 스페셜 프로그램
-        if "프리뷰 스페셜 프로그램" in title and ver:
+        if "preview" in tags:
             dt_iso, _ = find_korean_datetime(body)
             if not dt_iso:
                 dt_iso, _ = find_korean_datetime(title)
             if dt_iso:
-                results.append({
+                yield {
                     "game_id": "star_rail",
                     "version": ver,
                     "update_date": dt_iso,
                     "description": f"{ver} 버전 프리뷰 스페셜 프로그램",
                     "url": url,
-                })
+                }
                 print(f"  -> 프리뷰 스페셜 프로그램 파싱: {ver}")
             continue
         
         # 이벤트 워프 (1/2) - 기존 로직
         m = re.search(r"이벤트\s*워프\s*\((\d)\)", title)
-        if m and ver:
+        if m and "warp" in tags:
             y = m.group(1)
             print(f"  -> 이벤트 워프 발견: {ver} 버전, 페이즈 {y}")
             if y == "1":
@@ -485,17 +468,19 @@ def parse_star_rail(posts: List[Dict]) -> List[Dict]:
                     else:
                         desc = build_desc(f"{int(md_s[1])}/{int(md_s[2])}", f"{int(md_e[1])}/{int(md_e[2])}", ["[이벤트] 워프(1)"])
                     
-                    results.append({
+                    yield {
                         "game_id": "star_rail",
                         "version": ver,
                         "update_date": start,
                         "end_date": end,
                         "description": desc,
                         "url": url,
-                    })
+                    }
                     print(f"    -> 워프(1) 파싱 성공: {start} ~ {end}")
                 else:
                     print(f"    -> 워프(1) 파싱 실패: start={start}, end={end}")
+                    if retry and ver and end and not start:
+                        retry(url)
             else:
                 start, end = find_korean_daterange(body)
                 if start and end:
@@ -511,19 +496,19 @@ def parse_star_rail(posts: List[Dict]) -> List[Dict]:
                     else:
                         desc = build_desc(f"{int(md_s[1])}/{int(md_s[2])}", f"{int(md_e[1])}/{int(md_e[2])}", ["[이벤트] 워프(2)"])
                     
-                    results.append({
+                    yield {
                         "game_id": "star_rail",
                         "version": ver,
                         "update_date": start,
                         "end_date": end,
                         "description": desc,
                         "url": url,
-                    })
+                    }
                     print(f"    -> 워프(2) 파싱 성공: {start} ~ {end}")
             continue
         
         # 새로운 패턴: "워프" 키워드가 있는 게시글 (캐릭터 이름 포함)
-        if "워프" in title and ver:
+        if "warp" in tags:
             print(f"  -> 워프 관련 게시글 발견: {title[:50]}")
             # 날짜 범위 추출
             start, end = find_korean_daterange(body)
@@ -538,80 +523,70 @@ def parse_star_rail(posts: List[Dict]) -> List[Dict]:
                 md_s = start.split("-")
                 md_e = end.split("-")
                 desc = build_desc(f"{int(md_s[1])}/{int(md_s[2])}", f"{int(md_e[1])}/{int(md_e[2])}", [f"[이벤트] {char_desc}"])
-                results.append({
+                yield {
                     "game_id": "star_rail",
                     "version": ver,
                     "update_date": start,
                     "end_date": end,
                     "description": desc,
                     "url": url,
-                })
+                }
                 print(f"    -> 워프 파싱 성공: {start} ~ {end}")
-    return results
 
 
 def merge_updates(new_updates: List[Dict]) -> None:
-    path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data", "updates.json"))
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            existing = json.load(f)
-    except Exception:
-        existing = []
-
-    # 디듀프 키: game_id + version + update_date + description
-    def key(u: Dict) -> str:
-        return f"{u.get('game_id')}|{u.get('version','')}|{u.get('update_date')}|{u.get('description','')[:40]}"
-
-    seen = {key(u) for u in existing}
-    merged = existing[:]
-    added = 0
-    for u in new_updates:
-        if key(u) in seen:
-            continue
-        merged.append(u)
-        added += 1
-
-    if added:
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(merged, f, ensure_ascii=False, indent=2)
-    print(f"HoYoLAB merged: +{added} items")
+    stats = merge_into_store(new_updates, label="hoyolab")
+    print(f"HoYoLAB merged: +{stats['added']} items (~{stats['updated']} updated)")
 
 
-def main():
+def collect() -> SourceBatch:
+    """ZZZ/스타레일 작성자 포스트 수집 (병합 전 결과, 드라이버 풀 종료는 호출 측에서)"""
     zzz_id = os.getenv("HOYOLAB_ZZZ_AUTHOR", "219270333")
     sr_id = os.getenv("HOYOLAB_SR_AUTHOR", "172534910")
     limit = int(os.getenv("HOYOLAB_LIMIT", "20"))
+    # 증분 수집: 작성자별로 이미 본 포스트 이후의 새 글만 수집 (SCRAPE_FULL=1 이면 전체)
+    state = SourceState("hoyolab")
 
     all_updates: List[Dict] = []
 
     # ZZZ 스크래핑
     try:
-        print("=== ZZZ HoYoLAB Selenium 스크래핑 시작 ===")
-        zzz_posts = fetch_posts(zzz_id, limit=limit)
-        print(f"ZZZ: 총 {len(zzz_posts)}개 포스트 수집")
-        
-        zzz_updates = parse_zzz(zzz_posts)
+        print("=== ZZZ HoYoLAB 스크래핑 시작 ===")
+        # 포스트는 본문이 준비되는 대로 파서로 흘려보냄 (목록 전체를 모으지 않음)
+        zzz_updates = list(parse_zzz(fetch_posts(zzz_id, limit=limit, state=state), state.context_for("zzz_version_dates"),
+                                     lookahead_window(limit), state.retry))
         all_updates += zzz_updates
         print(f"ZZZ: {len(zzz_updates)}개 업데이트 파싱")
         
     except Exception as e:
-        print(f"ZZZ Selenium scrape failed: {e}")
+        print(f"ZZZ scrape failed: {e}")
 
     # 스타레일 스크래핑
     try:
-        print("=== Star Rail HoYoLAB Selenium 스크래핑 시작 ===")
-        sr_posts = fetch_posts(sr_id, limit=limit)
-        print(f"Star Rail: 총 {len(sr_posts)}개 포스트 수집")
-        
-        sr_updates = parse_star_rail(sr_posts)
+        print("=== Star Rail HoYoLAB 스크래핑 시작 ===")
+        sr_updates = list(parse_star_rail(fetch_posts(sr_id, limit=limit, state=state), state.context_for("sr_version_dates"),
+                                          lookahead_window(limit), state.retry))
         all_updates += sr_updates
         print(f"Star Rail: {len(sr_updates)}개 업데이트 파싱")
         
     except Exception as e:
-        print(f"Star Rail Selenium scrape failed: {e}")
+        print(f"Star Rail scrape failed: {e}")
+
+    return SourceBatch("hoyolab", all_updates, state)
 
-    print(f"=== 총 {len(all_updates)}개 업데이트 병합 ===")
-    merge_updates(all_updates)
+
+def main():
+    try:
+        batch = collect()
+    finally:
+        # 두 작성자가 같은 Chrome을 공유하므로 마지막에 한 번만 종료
+        get_pool().close()
+        print_ready_summary()
+        print_body_summary()
+
+    print(f"=== 총 {len(batch.updates)}개 업데이트 병합 ===")
+    merge_updates(batch.updates)
+    batch.state.save()
 
 
 if __name__ == "__main__":
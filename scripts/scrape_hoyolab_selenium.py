@@ -4,60 +4,35 @@ HoYoLAB Selenium 기반 스크래퍼
 동적 로딩 문제 해결을 위해 Selenium 사용
 """
 
-import json
 import os
 import re
 import time
 from datetime import datetime, timezone
 from typing import Dict, List, Tuple
 
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+
+from date_extract import first
+from page_ready import print_ready_summary, scroll_and_settle, wait_until_ready
+from driver_pool import create_driver, get_pool
+from update_store import merge_into_store
 
 
 BASE = "https://www.hoyolab.com"
 
 
 def setup_driver():
-    """Chrome WebDriver 설정"""
-    chrome_options = Options()
-    chrome_options.add_argument("--headless")  # 헤드리스 모드
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--window-size=1920,1080")
-    chrome_options.add_argument("--user-agent=Mozilla/5.0 (compatible; subculture-news/1.0)")
-    # 환경에 따른 추가 옵션 (GitHub Actions에서만 적용)
-    import os
-    if os.getenv('GITHUB_ACTIONS'):
-        chrome_options.add_argument("--disable-extensions")
-        chrome_options.add_argument("--disable-plugins")
-        chrome_options.add_argument("--disable-images")
-        chrome_options.add_argument("--remote-debugging-port=9222")
-        chrome_options.add_argument("--single-process")
-        chrome_options.add_argument("--disable-background-timer-throttling")
-        chrome_options.add_argument("--disable-renderer-backgrounding")
-        chrome_options.add_argument("--disable-backgrounding-occluded-windows")
-    
-    try:
-        from webdriver_manager.chrome import ChromeDriverManager
-        from selenium.webdriver.chrome.service import Service
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=chrome_options)
-    except Exception as e:
-        print(f"WebDriver Manager failed, trying default: {e}")
-        driver = webdriver.Chrome(options=chrome_options)
-    
-    return driver
+    """Chrome WebDriver 설정 (공용 driver_pool 사용)"""
+    return create_driver()
 
 
 def fetch_posts_selenium(author_id: str, limit: int = 20) -> List[Dict]:
-    """Selenium을 사용하여 HoYoLAB 포스트 가져오기"""
-    driver = setup_driver()
+    """Selenium을 사용하여 HoYoLAB 포스트 가져오기 (공용 드라이버 풀에서 임대)"""
+    with get_pool().lease() as driver:
+        return _fetch_posts_with(driver, author_id, limit)
+
+
+def _fetch_posts_with(driver, author_id: str, limit: int) -> List[Dict]:
     posts = []
     
     try:
@@ -65,21 +40,12 @@ def fetch_posts_selenium(author_id: str, limit: int = 20) -> List[Dict]:
         print(f"Fetching from: {url}")
         driver.get(url)
         
-        # 페이지 로딩 대기 (더 긴 시간)
-        wait = WebDriverWait(driver, 20)
-        
-        # 포스트 링크들이 로드될 때까지 대기
-        try:
-            wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "a[href*='/article/']")))
-            # 추가 대기: 동적 콘텐츠 로딩
-            time.sleep(3)
-            
+        # 포스트 링크들이 로드되고 목록 렌더링이 멈출 때까지 대기
+        if wait_until_ready(driver, "a[href*='/article/']", timeout=20, label="hoyolab postList"):
             # 페이지를 스크롤하여 더 많은 콘텐츠 로딩
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
+            scroll_and_settle(driver, label="hoyolab postList scroll")
             driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(1)
-        except TimeoutException:
+        else:
             print("포스트 링크를 찾을 수 없습니다. 페이지 구조를 확인합니다...")
             # 페이지 소스 확인
             page_source = driver.page_source
@@ -157,18 +123,13 @@ def fetch_posts_selenium(author_id: str, limit: int = 20) -> List[Dict]:
             try:
                 print(f"  -> 포스트 {i+1}/{len(posts)} 처리 중: {post['url']}")
                 driver.get(post["url"])
-                wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
                 
-                # 페이지 로딩 대기 (동적 콘텐츠)
-                time.sleep(3)
+                # 페이지 로딩 대기 (제목 h1이 렌더링되고 DOM 변경이 멈출 때까지)
+                wait_until_ready(driver, "h1", timeout=20, label="hoyolab article")
                 
                 # 제목이 비어있거나 짧으면 페이지에서 다시 찾기
                 if not post["title"] or len(post["title"]) < 10:
                     try:
-                        # h1 태그가 로드될 때까지 더 긴 시간 대기
-                        WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.TAG_NAME, "h1")))
-                        time.sleep(2)  # 추가 대기
-                        
                         title_element = driver.find_element(By.TAG_NAME, "h1")
                         new_title = title_element.text.strip()
                         if new_title:
@@ -202,8 +163,7 @@ def fetch_posts_selenium(author_id: str, limit: int = 20) -> List[Dict]:
                     print(f"  -> 특별 방송 예고 포스트 감지, 강제 처리")
                     try:
                         # 더 긴 대기 시간과 다양한 선택자 시도
-                        WebDriverWait(driver, 15).until(EC.presence_of_element_located((By.TAG_NAME, "h1")))
-                        time.sleep(3)  # 추가 대기
+                        wait_until_ready(driver, "h1", timeout=15, quiet_ms=1000, label="hoyolab article (retry)")
                         
                         # JavaScript로 제목 추출 시도
                         title_js = driver.execute_script("""
@@ -234,8 +194,7 @@ def fetch_posts_selenium(author_id: str, limit: int = 20) -> List[Dict]:
                 # 본문 로딩 보강: 스크롤 후 innerText 재수집
                 try:
                     # 페이지 하단까지 스크롤하여 동적 콘텐츠 로딩 유도
-                    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(1)  # 로딩 대기
+                    scroll_and_settle(driver, label="hoyolab article scroll")
                     
                     # innerText로 더 정확한 텍스트 추출
                     body_text = driver.execute_script("return document.body.innerText;")
@@ -252,39 +211,20 @@ def fetch_posts_selenium(author_id: str, limit: int = 20) -> List[Dict]:
                 
     except Exception as e:
         print(f"스크래핑 중 오류 발생: {e}")
-        
-    finally:
-        driver.quit()
     
     return posts
 
 
 def find_korean_datetime(text: str) -> Tuple[str, str]:
-    """한국어 날짜/시간 형식 파싱"""
-    # ex: 2025/10/15 07:00(KST) 패턴
-    m = re.search(r"(\d{4})/(\d{1,2})/(\d{1,2})\s+(\d{1,2}):(\d{2})\s*\(KST\)", text)
-    if m:
-        yyyy, mm, dd, hh, mi = map(int, m.groups())
-        dt = datetime(yyyy, mm, dd, hh, mi)
-        return dt.strftime("%Y-%m-%dT%H:%M:00+09:00"), f"{mm}/{dd} {hh:02d}:{mi:02d}"
-    
-    # ex: 8월 22일 20:30(KST)
-    m = re.search(r"(\d{1,2})\s*월\s*(\d{1,2})\s*일\s*(\d{1,2}):(\d{2})\s*\(KST\)", text)
-    if m:
-        mm, dd, hh, mi = map(int, m.groups())
-        year = datetime.now().year
-        dt = datetime(year, mm, dd, hh, mi)
-        return dt.strftime("%Y-%m-%dT%H:%M:00+09:00"), f"{mm}/{dd} {hh:02d}:{mi:02d}"
-    
-    m = re.search(r"(\d{1,2})\s*월\s*(\d{1,2})\s*일", text)
-    if m:
-        mm, dd = map(int, m.groups())
-        year = datetime.now().year
-        dt = datetime(year, mm, dd)
-        return dt.strftime("%Y-%m-%d"), f"{mm}/{dd}"
-    
-    return "", ""
-
+    """한국어 날짜/시간 형식 파싱: YYYY/MM/DD HH:MM(KST) > X월 X일 HH:MM(KST) > X월 X일 (date_extract)"""
+    c = first(text, "ymd_slash_time_kst", "md_time_kst_paren", "md")
+    if not c:
+        return "", ""
+    mm, dd = c["m"], c["d"]
+    if c.kind == "date":
+        return datetime(datetime.now().year, mm, dd).strftime("%Y-%m-%d"), f"{mm}/{dd}"
+    dt = datetime(c.fields.get("y") or datetime.now().year, mm, dd, c["H"], c["M"])
+    return dt.strftime("%Y-%m-%dT%H:%M:00+09:00"), f"{mm}/{dd} {dt.hour:02d}:{dt.minute:02d}"
 
 def extract_version(text: str) -> str:
     """버전 번호 추출"""
@@ -293,14 +233,12 @@ def extract_version(text: str) -> str:
 
 
 def find_korean_daterange(text: str) -> Tuple[str, str]:
-    """한국어 날짜 범위 파싱"""
-    m = re.search(r"(\d{1,2})\s*월\s*(\d{1,2})\s*일\s*[~~\-]\s*(\d{1,2})\s*월\s*(\d{1,2})\s*일", text)
-    if not m:
+    """한국어 날짜 범위 파싱 (X월 X일 ~ X월 X일, date_extract)"""
+    c = first(text, "range_md_ascii")
+    if not c:
         return "", ""
     y = datetime.now().year
-    mm1, dd1, mm2, dd2 = map(int, m.groups())
-    return datetime(y, mm1, dd1).strftime("%Y-%m-%d"), datetime(y, mm2, dd2).strftime("%Y-%m-%d")
-
+    return datetime(y, c["m"], c["d"]).strftime("%Y-%m-%d"), datetime(y, c["m2"], c["d2"]).strftime("%Y-%m-%d")
 
 def build_desc(start_md: str, end_md: str, lines: List[str]) -> str:
     """설명 텍스트 생성"""
@@ -537,30 +475,8 @@ def parse_star_rail_selenium(posts: List[Dict]) -> List[Dict]:
 
 def merge_updates(new_updates: List[Dict]) -> None:
     """업데이트 병합"""
-    path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data", "updates.json"))
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            existing = json.load(f)
-    except Exception:
-        existing = []
-
-    # 디듀프 키: game_id + version + update_date + description
-    def key(u: Dict) -> str:
-        return f"{u.get('game_id')}|{u.get('version','')}|{u.get('update_date')}|{u.get('description','')[:40]}"
-
-    seen = {key(u) for u in existing}
-    merged = existing[:]
-    added = 0
-    for u in new_updates:
-        if key(u) in seen:
-            continue
-        merged.append(u)
-        added += 1
-
-    if added:
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(merged, f, ensure_ascii=False, indent=2)
-    print(f"HoYoLAB Selenium merged: +{added} items")
+    stats = merge_into_store(new_updates, label="hoyolab_selenium")
+    print(f"HoYoLAB Selenium merged: +{stats['added']} items (~{stats['updated']} updated)")
 
 
 def main():
@@ -597,6 +513,10 @@ def main():
     except Exception as e:
         print(f"Star Rail Selenium scrape failed: {e}")
 
+    # 두 작성자가 같은 Chrome을 공유하므로 마지막에 한 번만 종료
+    get_pool().close()
+    print_ready_summary()
+
     print(f"=== 총 {len(all_updates)}개 업데이트 병합 ===")
     merge_updates(all_updates)
 
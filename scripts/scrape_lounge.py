@@ -1,188 +1,90 @@
-import json
 import os
 import re
 import time
 from datetime import datetime
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 
 import requests
-from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
+from bs4 import BeautifulSoup, SoupStrainer
+import lounge_api
+from content_root import print_body_summary, soup_text
+from date_extract import first, ymd
+from driver_pool import create_driver, get_pool, imap_with_drivers
+from html_parse import BOARD_LINKS, parse
+from page_ready import print_ready_summary, wait_until_ready
+from post_classifier import for_game
+from post_stream import committed, lookahead, lookahead_window
+from scrape_state import SourceState
+from update_store import SourceBatch, merge_into_store
 
 
 KST_OFFSET = "+09:00"
 
 
 def get_selenium_driver():
-    """Selenium WebDriver 설정 (webdriver-manager 사용)"""
-    chrome_options = Options()
-    chrome_options.add_argument("--headless")
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--window-size=1920,1080")
-    chrome_options.add_argument("--user-agent=Mozilla/5.0 (compatible; subculture-news/1.0)")
-    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    chrome_options.add_experimental_option('useAutomationExtension', False)
-    # 환경에 따른 추가 옵션 (GitHub Actions에서만 적용)
-    import os
-    if os.getenv('GITHUB_ACTIONS'):
-        chrome_options.add_argument("--disable-extensions")
-        chrome_options.add_argument("--disable-plugins")
-        chrome_options.add_argument("--disable-images")
-        chrome_options.add_argument("--remote-debugging-port=9223")  # 다른 포트 사용
-        chrome_options.add_argument("--single-process")
-        chrome_options.add_argument("--disable-background-timer-throttling")
-        chrome_options.add_argument("--disable-renderer-backgrounding")
-        chrome_options.add_argument("--disable-backgrounding-occluded-windows")
-    
-    try:
-        # webdriver-manager를 사용하여 ChromeDriver 자동 관리
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=chrome_options)
-    except Exception as e:
-        print(f"WebDriver Manager failed, trying default: {e}")
-        driver = webdriver.Chrome(options=chrome_options)
-    
-    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-    return driver
+    """Selenium WebDriver 설정 (공용 driver_pool 사용)"""
+    return create_driver()
 
-def get(url: str) -> BeautifulSoup:
+def get(url: str, only: Optional[SoupStrainer] = None) -> BeautifulSoup:
     """기존 requests 방식 (fallback)"""
     headers = {"User-Agent": "Mozilla/5.0 (compatible; subculture-news/1.0)"}
     r = requests.get(url, headers=headers, timeout=30)
     r.raise_for_status()
-    return BeautifulSoup(r.text, "html.parser")
+    return parse(r.text, only)
 
 def get_with_selenium(url: str, wait_time: int = 10, driver=None) -> BeautifulSoup:
     """Selenium을 사용한 JavaScript 렌더링"""
-    should_quit = False
     if driver is None:
-        driver = get_selenium_driver()
-        should_quit = True
-    
-    try:
-        driver.get(url)
-        # 페이지 로딩 대기
-        WebDriverWait(driver, wait_time).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
-        # 추가 대기 (동적 콘텐츠 로딩)
-        time.sleep(2)  # 3초에서 2초로 단축
-        html = driver.page_source
-        return BeautifulSoup(html, "html.parser")
-    finally:
-        if should_quit:
-            driver.quit()
+        with get_pool().lease() as leased:
+            return get_with_selenium(url, wait_time, leased)
 
+    driver.get(url)
+    # 페이지 로딩 대기 (본문이 렌더링되고 DOM 변경이 멈출 때까지)
+    wait_until_ready(driver, "body", timeout=wait_time, label="lounge detail")
+    return parse(driver.page_source)
 
-def kor_dt(text: str) -> Tuple[str, str]:
-    # 패턴 1: X월 X일(요일) HH:MM (가장 일반적)
-    m = re.search(r"(\d{1,2})\s*월\s*(\d{1,2})\s*일\s*\([^)]+\)\s*(\d{1,2}):(\d{2})", text)
-    if m:
-        mm, dd, hh, mi = m.group(1), m.group(2), m.group(3), m.group(4)
-        year = datetime.now().year
-        return f"{year}-{int(mm):02d}-{int(dd):02d}T{int(hh):02d}:{int(mi):02d}:00{KST_OFFSET}", f"{int(mm)}/{int(dd)} {int(hh):02d}:{int(mi):02d}"
-    
-    # 패턴 2: X/X(요일) HH:MM
-    m = re.search(r"(\d{1,2})/(\d{1,2})\s*\([^)]+\)\s*(\d{1,2}):(\d{2})", text)
-    if m:
-        mm, dd, hh, mi = m.group(1), m.group(2), m.group(3), m.group(4)
-        year = datetime.now().year
-        return f"{year}-{int(mm):02d}-{int(dd):02d}T{int(hh):02d}:{int(mi):02d}:00{KST_OFFSET}", f"{int(mm)}/{int(dd)} {int(hh):02d}:{int(mi):02d}"
-    
-    # 패턴 3: X월 X일 HH:MM (KST) - 기존 패턴
-    m = re.search(r"(\d{1,2})\s*월\s*(\d{1,2})\s*일\s*(\d{1,2})(?::(\d{2}))?\s*\(K?ST\)?", text)
-    if m:
-        mm, dd, hh, mi = m.group(1), m.group(2), m.group(3), m.group(4) or "00"
-        year = datetime.now().year
-        return f"{year}-{int(mm):02d}-{int(dd):02d}T{int(hh):02d}:{int(mi):02d}:00{KST_OFFSET}", f"{int(mm)}/{int(dd)} {int(hh):02d}:{int(mi):02d}"
-    
-    # 패턴 4: X월 X일만 (시간 없음)
-    m = re.search(r"(\d{1,2})\s*월\s*(\d{1,2})\s*일", text)
-    if m:
-        mm, dd = m.group(1), m.group(2)
-        year = datetime.now().year
-        return f"{year}-{int(mm):02d}-{int(dd):02d}", f"{int(mm)}/{int(dd)}"
-    
-    return "", ""
 
+def kor_dt(text: str) -> Tuple[str, str]:
+    """X월 X일(요일) HH:MM > X/X(요일) HH:MM > X월 X일 HH:MM (KST) > X월 X일 순으로 첫 날짜 (date_extract)"""
+    c = first(text, "md_weekday_time", "slash_md_weekday_time", "md_time_st", "md")
+    if not c:
+        return "", ""
+    mm, dd = c["m"], c["d"]
+    year = datetime.now().year
+    if c.kind == "date":
+        return f"{year}-{mm:02d}-{dd:02d}", f"{mm}/{dd}"
+    hh, mi = c["H"], c["M"] or 0
+    return f"{year}-{mm:02d}-{dd:02d}T{hh:02d}:{mi:02d}:00{KST_OFFSET}", f"{mm}/{dd} {hh:02d}:{mi:02d}"
 
 def kor_range(text: str) -> Tuple[str, str]:
-    # 패턴 1: YYYY년 X월 X일 HH:MM ~ YYYY년 X월 X일 HH:MM (시간 포함)
-    m = re.search(r"(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일\s*\d{1,2}:\d{2}\s*[~\-–—]\s*(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일\s*\d{1,2}:\d{2}", text)
-    if m:
-        s = f"{m.group(1)}-{int(m.group(2)):02d}-{int(m.group(3)):02d}"
-        e = f"{m.group(4)}-{int(m.group(5)):02d}-{int(m.group(6)):02d}"
-        return s, e
-    
-    # 패턴 2: YYYY년 X월 X일 ~ YYYY년 X월 X일 (시간 없음)
-    m = re.search(r"(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일\s*[~\-–—]\s*(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일", text)
-    if m:
-        s = f"{m.group(1)}-{int(m.group(2)):02d}-{int(m.group(3)):02d}"
-        e = f"{m.group(4)}-{int(m.group(5)):02d}-{int(m.group(6)):02d}"
-        return s, e
-    
-    # 패턴 3: X월 X일 ~ X월 X일
-    m = re.search(r"(\d{1,2})월\s*(\d{1,2})일\s*[~\-–—]\s*(\d{1,2})월\s*(\d{1,2})일", text)
-    if m:
-        y = datetime.now().year
-        s = f"{y}-{int(m.group(1)):02d}-{int(m.group(2)):02d}"
-        e = f"{y}-{int(m.group(3)):02d}-{int(m.group(4)):02d}"
-        return s, e
+    """
+    YYYY년 X월 X일 HH:MM ~ ... > YYYY년 X월 X일 ~ ... > X월 X일 ~ X월 X일 > 업데이트 이후 ~ YYYY년 X월 X일 (date_extract)
+    마지막 형식(명조)은 종료일만 반환, 시작일은 버전 업데이트 공지에서 찾음 (parse_ww)
+    """
+    c = first(text, "range_ymd_time", "range_ymd", "range_md_tight", "until_ymd")
+    if not c:
+        return "", ""
+    if c.kind == "until":
+        return "", ymd(c["y2"], c["m2"], c["d2"])
+    year = datetime.now().year
+    return ymd(c.fields.get("y", year), c["m"], c["d"]), ymd(c.fields.get("y2", year), c["m2"], c["d2"])
+
+def load_board_soup(board_url: str, driver) -> BeautifulSoup:
+    """SPA 게시판 목록 페이지 렌더링"""
+    print(f"Loading SPA page with Selenium: {board_url}")
+    driver.get(board_url)
     
-    # 패턴 4: 업데이트 이후 ~ YYYY년 X월 X일 (명조 특화)
-    m = re.search(r"업데이트\s*이후.*?(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일", text)
-    if m:
-        # 종료일은 추출 가능
-        e = f"{m.group(1)}-{int(m.group(2)):02d}-{int(m.group(3)):02d}"
-        # 시작일은 버전 업데이트 공지에서 찾아야 함 (parse_ww에서 처리)
-        return "", e
+    # SPA 로딩 대기: 게시글 제목이 로드되고 목록 렌더링이 멈출 때까지
+    if wait_until_ready(driver, "a[class*='title']", timeout=20, label="lounge board"):
+        print("SPA content loaded successfully")
+    else:
+        print("SPA loading timeout, proceeding anyway")
     
-    return "", ""
+    return parse(driver.page_source, BOARD_LINKS)
 
 
-def fetch_board_posts(board_url: str, max_items: int = 20) -> List[Dict]:
-    """게시판 게시글 수집 (Selenium 사용, 최적화된 버전)"""
-    driver = None
-    try:
-        # 하나의 드라이버 인스턴스로 모든 작업 수행
-        driver = get_selenium_driver()
-        
-        # Selenium으로 JavaScript 렌더링된 페이지 가져오기 (SPA 대응)
-        print(f"Loading SPA page with Selenium: {board_url}")
-        driver.get(board_url)
-        
-        # SPA 로딩 대기 (더 긴 시간)
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        from selenium.webdriver.common.by import By
-        
-        try:
-            wait = WebDriverWait(driver, 20)
-            # 게시글 제목이 로드될 때까지 대기
-            wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "a[class*='title']")))
-            print("SPA content loaded successfully")
-        except Exception as e:
-            print(f"SPA loading timeout, proceeding anyway: {e}")
-        
-        # 추가 안전 대기
-        time.sleep(5)
-        
-        html = driver.page_source
-        soup = BeautifulSoup(html, "html.parser")
-    except Exception as e:
-        print(f"Selenium failed for {board_url}, falling back to requests: {e}")
-        # Fallback to requests
-        soup = get(board_url)
-    
+def extract_board_posts(soup: BeautifulSoup, board_url: str, max_items: int) -> List[Dict]:
+    """게시판 목록 HTML에서 게시글 제목/URL 추출"""
     posts: List[Dict] = []
     
     # 네이버 게임 라운지 게시글 제목 선택자 사용 (SPA 대응)
@@ -219,106 +121,111 @@ def fetch_board_posts(board_url: str, max_items: int = 20) -> List[Dict]:
             break
     
     print(f"Collected {len(posts)} posts")
+    return posts
+
+
+def fetch_post_body(driver, p: Dict) -> str:
+    """게시글 상세 페이지 본문 수집 (imap_with_drivers 워커에서 호출)"""
+    try:
+        print(f"  -> Getting body for post: {p['url']}")
+        ps = get_with_selenium(p["url"], wait_time=8, driver=driver)  # 대기 시간 단축
+        # 본문 영역만 (메뉴/댓글 제외, 못 찾으면 페이지 전체)
+        body_text, _ = soup_text(ps, "lounge")
+        
+        # 특수모집 관련 키워드가 있는지 확인
+        if "recruit_hint" in for_game("lounge").classify(body=body_text):
+            print(f"    *** Found recruit keywords in body! ***")
+    except Exception as e:
+        print(f"Failed to get body for {p['url']}: {e}")
+        body_text = ""
+    return body_text
+
+
+def fetch_board_posts(board_url: str, max_items: int = 20, state=None) -> Iterator[Dict]:
+    """
+    게시판 게시글 수집 (JSON API 우선, 실패 시 공용 드라이버 풀의 Chrome으로 렌더링하고 본문은 LOUNGE_BODY_WORKERS개 워커로 병렬 수집)
+    목록은 호출 즉시 가져오고, 게시글은 본문이 준비되는 대로 입력 순서대로 하나씩 내보냄
+    state(scrape_state.SourceState)가 있으면 이미 본 게시글 이전의 새 글만 본문 수집하고, 끝까지 소비된 뒤 기록
+    """
+    workers = int(os.getenv("LOUNGE_BODY_WORKERS", "1"))
+    stream = lounge_api.stream_key(board_url)
+    key = lambda p: lounge_api.feed_id_from_url(p["url"])
     
-    # 본문 수집 (같은 드라이버 인스턴스 재사용)
-    if driver:
-        for i, p in enumerate(posts):
-            try:
-                print(f"  -> Getting body for post {i+1}/{len(posts)}: {p['url']}")
-                ps = get_with_selenium(p["url"], wait_time=8, driver=driver)  # 대기 시간 단축
-                body_text = ps.get_text("\n", strip=True)
-                p["body"] = body_text
-                
-                # 특수모집 관련 키워드가 있는지 확인
-                if any(keyword in body_text for keyword in ['특수모집', '합류', '모집에 합류']):
-                    print(f"    *** Found recruit keywords in body! ***")
-                    
-            except Exception as e:
-                print(f"Failed to get body for {p['url']}: {e}")
-                p["body"] = ""
-    else:
-        # Selenium이 실패한 경우 requests로 본문 수집 시도
-        for i, p in enumerate(posts):
-            try:
-                print(f"  -> Getting body for post {i+1}/{len(posts)} (requests): {p['url']}")
-                ps = get(p["url"])
-                body_text = ps.get_text("\n", strip=True)
-                p["body"] = body_text
-            except Exception as e:
-                print(f"Failed to get body for {p['url']}: {e}")
-                p["body"] = ""
-    
-    # 드라이버 정리
-    if driver:
+    # 1순위: JSON API (Chrome 없이 HTTP 몇 번으로 목록/본문 수집)
+    if lounge_api.api_enabled():
         try:
-            driver.quit()
-        except:
-            pass
+            return lounge_api.fetch_board_posts(board_url, max_items, workers=max(workers, 4), state=state)
+        except Exception as e:
+            print(f"Lounge API failed for {board_url}, falling back to Selenium: {e}")
     
-    return posts
+    # 2순위: Selenium 렌더링
+    try:
+        with get_pool().lease() as driver:
+            soup = load_board_soup(board_url, driver)
+        posts = extract_board_posts(soup, board_url, max_items)
+        if state:
+            posts = state.take_new(stream, posts, key=key)
+        return committed(_selenium_bodies(posts, workers), state, stream, key)
+    except Exception as e:
+        print(f"Selenium failed for {board_url}, falling back to requests: {e}")
+    
+    # Selenium이 실패한 경우 requests로 목록/본문 수집 시도
+    posts = extract_board_posts(get(board_url, BOARD_LINKS), board_url, max_items)
+    if state:
+        posts = state.take_new(stream, posts, key=key)
+    return committed(_requests_bodies(posts), state, stream, key)
 
 
-def parse_nikke(board_update_url: str, board_broadcast_url: str, limit: int = 20) -> List[Dict]:
-    out: List[Dict] = []
-    # 업데이트 소식 사전 안내 - 모집
-    update_posts = fetch_board_posts(board_update_url, limit)
+def _selenium_bodies(posts: List[Dict], workers: int) -> Iterator[Dict]:
+    """본문 수집 (입력 순서 유지), 드라이버 워커가 모두 죽으면 남은 글은 requests로"""
+    started = time.time()
+    done = 0
     try:
-        print(f"Nikke update board posts: {len(update_posts)}")
-        for i, p in enumerate(update_posts[:3]):
-            print(f"  {i+1}. {p['title'][:60]}")
-    except Exception:
-        pass  # 인코딩 오류 무시
-    
-    for i, p in enumerate(update_posts):
+        for p, body in zip(posts, imap_with_drivers(fetch_post_body, posts, workers)):
+            done += 1
+            yield {**p, "body": body or ""}
+    except Exception as e:
+        print(f"Selenium failed after {done}/{len(posts)} bodies, falling back to requests: {e}")
+        yield from _requests_bodies(posts[done:])
+        return
+    print(f"Fetched {len(posts)} bodies with {workers} worker(s) in {time.time() - started:.1f}s")
+
+
+def _requests_bodies(posts: List[Dict]) -> Iterator[Dict]:
+    for i, p in enumerate(posts):
+        try:
+            print(f"  -> Getting body for post {i+1}/{len(posts)} (requests): {p['url']}")
+            body, _ = soup_text(get(p["url"]), "lounge", "lounge (requests)")
+        except Exception as e:
+            print(f"Failed to get body for {p['url']}: {e}")
+            body = ""
+        yield {**p, "body": body}
+
+
+def parse_nikke(board_update_url: str, board_broadcast_url: str, limit: int = 20, state=None) -> Iterator[Dict]:
+    """게시판 게시글을 받는 대로 파싱해 업데이트를 하나씩 내보냄"""
+    nikke = for_game("nikke")
+    # 업데이트 소식 사전 안내 - 모집
+    count = 0
+    for i, p in enumerate(fetch_board_posts(board_update_url, limit, state)):
+        count += 1
         try:
-            print(f"Parsing post {i+1}/{len(update_posts)}: {p['title'][:50]}...")
+            print(f"Parsing post {i+1}: {p['title'][:50]}...")
         except:
-            print(f"Parsing post {i+1}/{len(update_posts)}: [encoding error in title]")
+            print(f"Parsing post {i+1}: [encoding error in title]")
             
-        # 특수모집 합류 감지 로직 개선
-        title_lower = p["title"].lower()
-        body_lower = p.get("body", "").lower()
-        
-        # 다양한 패턴으로 특수모집 합류 감지 (더 유연한 조건)
+        # 특수모집 합류 감지 (조건은 post_classifier.RULES["nikke"]["recruit"], 제목/본문 한 번씩만 훑음)
         body = p.get("body", "")
         title = p["title"]
+        tags = nikke.classify(title=title, body=body)
         
-        is_recruit_post = (
-            # 조건 1: 업데이트 소식 사전 안내 + 모집 관련 키워드
-            ("업데이트 소식 사전 안내" in title and ("모집에 합류" in body or "특수 모집" in body or ("모집" in body and "합류" in body))) or
-            # 조건 2: 제목에 특수모집 + 합류
-            ("특수모집" in title and "합류" in title) or
-            # 조건 3: 본문에 특수모집 + 합류 (띄어쓰기 고려)
-            (("특수모집" in body or "특수 모집" in body) and "합류" in body) or
-            # 조건 4: 캐릭터 특수모집
-            ("캐릭터 특수모집" in title) or
-            ("캐릭터 특수모집" in body) or
-            # 조건 5: SSR + 합류 (니케 특화)
-            ("SSR" in body and "합류" in body and "업데이트 소식 사전 안내" in title)
-        )
-        
-        # 각 조건 확인
-        cond1 = "업데이트 소식 사전 안내" in title and ("모집에 합류" in body or "특수 모집" in body or ("모집" in body and "합류" in body))
-        cond2 = "특수모집" in title and "합류" in title
-        cond3 = ("특수모집" in body or "특수 모집" in body) and "합류" in body
-        cond4 = "캐릭터 특수모집" in title
-        cond5 = "캐릭터 특수모집" in body
-        cond6 = "SSR" in body and "합류" in body and "업데이트 소식 사전 안내" in title
-        
-        if any([cond1, cond2, cond3, cond4, cond5, cond6]):
-            print(f"  Recruit conditions: cond1={cond1}, cond2={cond2}, cond3={cond3}, cond4={cond4}, cond5={cond5}, cond6={cond6}")
+        if "recruit" in tags:
+            print(f"  Recruit conditions: {', '.join(tags.tags['recruit'])}")
             print(f"  URL: {p['url']}")
-            print(f"  Body length: {len(p.get('body', ''))}")
-            if "특수모집" in p.get("body", ""):
-                print(f"  Body contains '특수모집'")
-            if "특수 모집" in p.get("body", ""):
-                print(f"  Body contains '특수 모집'")
-            if "합류" in p.get("body", ""):
-                print(f"  Body contains '합류'")
-            if "SSR" in p.get("body", ""):
-                print(f"  Body contains 'SSR'")
-        
-        if is_recruit_post:
+            for keyword in ("특수모집", "특수 모집", "합류", "SSR"):
+                if tags.has("body", keyword):
+                    print(f"  Body contains '{keyword}'")
+            
             try:
                 print(f"Found recruit post: {p['title']}")
             except:
@@ -387,7 +294,7 @@ def parse_nikke(board_update_url: str, board_broadcast_url: str, limit: int = 20
                             "description": description,
                             "url": p["url"],
                         }
-                        out.append(result)
+                        yield result
                         try:
                             print(f"    *** Added recruit update for {char_name}")
                         except:
@@ -400,19 +307,14 @@ def parse_nikke(board_update_url: str, board_broadcast_url: str, limit: int = 20
                 import traceback
                 traceback.print_exc()
     
-    # 특별 방송 안내 (패턴 완화)
-    broadcast_posts = fetch_board_posts(board_broadcast_url, limit)
-    try:
-        print(f"Nikke broadcast board posts: {len(broadcast_posts)}")
-        for i, p in enumerate(broadcast_posts[:3]):
-            print(f"  {i+1}. {p['title'][:60]}")
-    except Exception:
-        pass  # 인코딩 오류 무시
+    print(f"Nikke update board posts: {count}")
     
-    for p in broadcast_posts:
+    # 특별 방송 안내 (패턴 완화)
+    count = 0
+    for p in fetch_board_posts(board_broadcast_url, limit, state):
+        count += 1
         # "방송" + "사전" + "안내" 키워드로 탐지
-        if ("방송" in p["title"] and "사전" in p["title"] and "안내" in p["title"]) or \
-           ("방송" in p["title"] and "안내" in p["title"]):
+        if "broadcast" in nikke.classify(title=p["title"]):
             try:
                 print(f"Found broadcast post: {p['title']}")
             except Exception:
@@ -420,38 +322,59 @@ def parse_nikke(board_update_url: str, board_broadcast_url: str, limit: int = 20
             body = p.get("body", "")
             dt_iso, _ = kor_dt(body)
             if dt_iso:
-                out.append({
+                yield {
                     "game_id": "nikke",
                     "version": "",
                     "update_date": dt_iso,
                     "description": "특별 방송",
                     "url": p["url"],
-                })
+                }
             else:
                 try:
                     print(f"  No date found in body (length: {len(body)})")
                 except Exception:
                     pass
-    return out
+    print(f"Nikke broadcast board posts: {count}")
 
 
-def parse_ww(board_tuning_url: str, board_broadcast_url: str, limit: int = 20) -> List[Dict]:
-    out: List[Dict] = []
-    posts_tuning = fetch_board_posts(board_tuning_url, limit)
-    try:
-        print(f"WW tuning board posts: {len(posts_tuning)}")
-        for i, p in enumerate(posts_tuning[:3]):
-            print(f"  {i+1}. {p['title'][:60]}")
-    except Exception:
-        pass  # 인코딩 오류 무시
-    
-    posts_notice = {p["title"]: p for p in posts_tuning}
-    for p in posts_tuning:
+def notice_update_date(notice_body: str) -> str:
+    """"X.X 버전 업데이트 점검 사전 공지" 본문에서 점검 종료일 (YYYY-MM-DD)"""
+    # 점검 시간 패턴: YYYY년 X월 X일 HH:MM ~ YYYY년 X월 X일 HH:MM
+    time_pattern = re.search(
+        r"(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일\s*\d{1,2}:\d{2}\s*[~\-–—]\s*(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일\s*\d{1,2}:\d{2}",
+        notice_body
+    )
+    if not time_pattern:
+        return ""
+    # 종료 시간의 날짜 사용 (연도, 월, 일)
+    end_year = time_pattern.group(4)
+    end_month = int(time_pattern.group(5))
+    end_day = int(time_pattern.group(6))
+    return f"{end_year}-{end_month:02d}-{end_day:02d}"
+
+
+def parse_ww(board_tuning_url: str, board_broadcast_url: str, limit: int = 20, state=None) -> Iterator[Dict]:
+    """게시판 게시글을 받는 대로 파싱해 업데이트를 하나씩 내보냄"""
+    ww = for_game("ww")
+    # 업데이트 점검 사전 공지 → 버전별 업데이트일 캐싱 (이전 실행에서 본 공지도 state에 유지)
+    version_dates: Dict[str, str] = state.context_for("ww_version_dates") if state else {}
+
+    def learn_notice(p: Dict):
+        """공지면 버전별 업데이트일 캐싱 (post_stream.lookahead가 본 처리보다 앞서 호출, 제목 태그는 본 처리에서 재사용)"""
+        tags = ww.classify(title=p["title"])
+        if "notice" in tags:
+            ver_match = re.search(r"(\d+\.\d+)", p["title"])
+            notice_date = notice_update_date(p.get("body", ""))
+            if ver_match and notice_date:
+                version_dates[ver_match.group(1)] = notice_date
+        return tags
+
+    count = 0
+    posts_tuning = fetch_board_posts(board_tuning_url, limit, state)
+    for p, tags in lookahead(posts_tuning, learn_notice, lookahead_window(limit)):
+        count += 1
         # "캐릭터 이벤트 튜닝"만 필터링 (무기 이벤트 튜닝 제외)
-        if "캐릭터" in p["title"] and "이벤트" in p["title"] and "튜닝" in p["title"]:
-            # 제목에 "무기" 키워드가 있으면 제외 (본문의 "무기"는 무시)
-            if "무기" in p["title"] and "캐릭터" not in p["title"]:
-                continue
+        if "tuning" in tags:
             try:
                 print(f"Found tuning post: {p['title']}")
             except Exception:
@@ -473,26 +396,16 @@ def parse_ww(board_tuning_url: str, board_broadcast_url: str, limit: int = 20) -
             
             # 시작일이 없고 "X.X 버전 업데이트 이후"가 있는 경우
             if not start and end and "업데이트 이후" in body and ver:
-                # "X.X 버전 업데이트 점검 사전 공지" 게시글에서 점검 종료 시간 찾기
-                for t, post in posts_notice.items():
-                    if "업데이트 점검 사전 공지" in t and ver in t:
-                        notice_body = post.get("body", "")
-                        # 점검 시간 패턴: YYYY년 X월 X일 HH:MM ~ YYYY년 X월 X일 HH:MM
-                        time_pattern = re.search(
-                            r"(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일\s*\d{1,2}:\d{2}\s*[~\-–—]\s*(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일\s*\d{1,2}:\d{2}",
-                            notice_body
-                        )
-                        if time_pattern:
-                            # 종료 시간의 날짜 사용 (연도, 월, 일)
-                            end_year = time_pattern.group(4)
-                            end_month = int(time_pattern.group(5))
-                            end_day = int(time_pattern.group(6))
-                            start = f"{end_year}-{end_month:02d}-{end_day:02d}"
-                            try:
-                                print(f"  Found version {ver} update date from notice: {start}")
-                            except Exception:
-                                pass
-                        break
+                # "X.X 버전 업데이트 점검 사전 공지" 게시글의 점검 종료일
+                start = version_dates.get(ver, "")
+                if start:
+                    try:
+                        print(f"  Found version {ver} update date from notice: {start}")
+                    except Exception:
+                        pass
+                elif state:
+                    # 공지를 아직 못 봄: 본 것으로 기록하지 않아 다음 실행에서 다시 파싱
+                    state.retry(p["url"])
                     
             if start and end:
                 # 한글 날짜 표시
@@ -515,30 +428,26 @@ def parse_ww(board_tuning_url: str, board_broadcast_url: str, limit: int = 20) -
                 else:
                     desc_parts.append("[이벤트] 캐릭터 이벤트 튜닝")
                 
-                out.append({
+                yield {
                     "game_id": "ww",
                     "version": ver,
                     "update_date": start,
                     "end_date": end,
                     "description": "\n".join(desc_parts),
                     "url": p["url"],
-                })
+                }
             else:
                 try:
                     print(f"  No date range found (start={start}, end={end})")
                 except Exception:
                     pass
 
+    print(f"WW tuning board posts: {count}")
+
     # 프리뷰 특별 방송 (패턴 완화)
-    broadcast_posts = fetch_board_posts(board_broadcast_url, limit)
-    try:
-        print(f"WW broadcast board posts: {len(broadcast_posts)}")
-        for i, p in enumerate(broadcast_posts[:3]):
-            print(f"  {i+1}. {p['title'][:60]}")
-    except Exception:
-        pass  # 인코딩 오류 무시
-    
-    for p in broadcast_posts:
+    count = 0
+    for p in fetch_board_posts(board_broadcast_url, limit, state):
+        count += 1
         # 제목과 본문 모두에서 키워드 검색 (패턴 완화)
         title = p["title"]
         body = p.get("body", "")
@@ -546,22 +455,9 @@ def parse_ww(board_tuning_url: str, board_broadcast_url: str, limit: int = 20) -
         # 이모지 제거 (유니코드 이모지 범위)
         title_clean = re.sub(r'[\U0001F300-\U0001F9FF\u2600-\u26FF\u2700-\u27BF]', '', title)
         
-        # "프리뷰 특별 방송" 공지만 감지 (더 엄격한 조건)
-        # 제목에 "프리뷰" + "방송" 또는 "특별 방송"이 있어야 함
-        is_broadcast = (
-            ("프리뷰" in title_clean and "방송" in title_clean) or
-            ("특별 방송" in title_clean)
-        )
-        
-        # 카페, 콜라보, 이모티콘, 애니메이션, 컷신 등 제외
-        exclude_keywords = ["카페", "콜라보", "이모티콘", "애니메이션", "컷신", "스케치", "오프라인 상영회"]
-        if any(kw in title_clean for kw in exclude_keywords):
-            is_broadcast = False
-        
-        if is_broadcast:
-            # "시작됩니다"가 포함된 제목은 과거 공지이므로 스킵
-            if "시작됩니다" in title_clean:
-                continue
+        # "프리뷰 특별 방송" 공지만 감지: 제목에 "프리뷰" + "방송" 또는 "특별 방송"
+        # 카페, 콜라보, 이모티콘 등과 "시작됩니다"(지난 방송) 제목은 제외 (post_classifier.RULES["ww"]["broadcast"])
+        if "broadcast" in ww.classify(title=title_clean):
             try:
                 print(f"Found broadcast post: {title}")
             except Exception:
@@ -579,13 +475,13 @@ def parse_ww(board_tuning_url: str, board_broadcast_url: str, limit: int = 20) -
                 
                 desc = f"{ver}버전 프리뷰 특별 방송" if ver else "프리뷰 특별 방송"
                 
-                out.append({
+                yield {
                     "game_id": "ww",
                     "version": ver,
                     "update_date": dt_iso,
                     "description": desc,
                     "url": p["url"],
-                })
+                }
                 try:
                     print(f"  *** Added broadcast: {desc} on {dt_iso}")
                 except Exception:
@@ -595,51 +491,48 @@ def parse_ww(board_tuning_url: str, board_broadcast_url: str, limit: int = 20) -
                     print(f"  No date found in title or body (body length: {len(body)})")
                 except Exception:
                     pass
-    return out
+    print(f"WW broadcast board posts: {count}")
 
 
 def merge(updates: List[Dict]) -> None:
-    path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data", "updates.json"))
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            existing = json.load(f)
-    except Exception:
-        existing = []
-    def key(u: Dict) -> str:
-        return f"{u.get('game_id')}|{u.get('version','')}|{u.get('update_date')}|{u.get('description','')[:40]}"
-    seen = {key(u) for u in existing}
-    merged = existing[:]
-    add = 0
-    for u in updates:
-        if key(u) in seen:
-            continue
-        merged.append(u)
-        add += 1
-    if add:
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(merged, f, ensure_ascii=False, indent=2)
-    print(f"Lounge merged: +{add}")
+    stats = merge_into_store(updates, label="lounge")
+    print(f"Lounge merged: +{stats['added']} ~{stats['updated']}")
 
 
-def main():
+def collect() -> SourceBatch:
+    """니케/명조 게시판 수집 (병합 전 결과, 드라이버 풀 종료는 호출 측에서)"""
     # Naver Game Lounge boards
     nikke_update = os.getenv("NIKKE_UPDATE_BOARD", "https://game.naver.com/lounge/nikke/board/48")
     nikke_broadcast = os.getenv("NIKKE_BROADCAST_BOARD", "https://game.naver.com/lounge/nikke/board/11")
     ww_tuning = os.getenv("WW_TUNING_BOARD", "https://game.naver.com/lounge/WutheringWaves/board/28")
     ww_broadcast = os.getenv("WW_BROADCAST_BOARD", "https://game.naver.com/lounge/WutheringWaves/board/1")
     limit = int(os.getenv("LOUNGE_LIMIT", "20"))
+    # 증분 수집: 게시판별로 이미 본 게시글 이후의 새 글만 수집 (SCRAPE_FULL=1 이면 전체)
+    state = SourceState("lounge")
 
     updates: List[Dict] = []
     try:
-        updates += parse_nikke(nikke_update, nikke_broadcast, limit)
+        updates += parse_nikke(nikke_update, nikke_broadcast, limit, state)
     except Exception as e:
         print("Nikke parse failed:", e)
     try:
-        updates += parse_ww(ww_tuning, ww_broadcast, limit)
+        updates += parse_ww(ww_tuning, ww_broadcast, limit, state)
     except Exception as e:
         print("WW parse failed:", e)
+    return SourceBatch("lounge", updates, state)
+
+
+def main():
+    try:
+        batch = collect()
+    finally:
+        # 4개 게시판이 같은 Chrome을 공유하므로 실행 종료 시 한 번만 종료
+        get_pool().close()
+        print_ready_summary()
+        print_body_summary()
 
-    merge(updates)
+    merge(batch.updates)
+    batch.state.save()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+소스별 증분 스크래핑 상태 (data/state/<source>.json)
+- streams: 게시판/작성자별 최근에 본 게시글 ID (최신순) + 목록 API ETag
+- context: 게시글 간 참조 정보 캐시 (예: 버전 -> 업데이트일), 이전 실행에서 본 공지도 계속 활용
+SCRAPE_FULL=1 이면 상태를 무시하고 전체 수집 (상태는 갱신)
+"""
+
+import json
+import os
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+
+STATE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data", "state"))
+MAX_SEEN = 200
+
+
+def full_scan() -> bool:
+    return os.getenv("SCRAPE_FULL", "0") == "1"
+
+
+class SourceState:
+    def __init__(self, source: str, path: Optional[str] = None):
+        self.source = source
+        self.path = path or os.path.join(STATE_DIR, f"{source}.json")
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception:
+            data = {}
+        self.streams: Dict[str, Dict] = data.get("streams", {})
+        self.context: Dict[str, Dict] = data.get("context", {})
+        self._loaded = self._snapshot()
+        # 이번 실행에서 내보낸 게시글 URL -> (stream, ID), 다시 파싱할 (stream, ID)
+        self._urls: Dict[str, Tuple[str, str]] = {}
+        self._retry: Set[Tuple[str, str]] = set()
+
+    def _snapshot(self) -> str:
+        return json.dumps({"streams": self.streams, "context": self.context}, ensure_ascii=False, sort_keys=True)
+
+    def _stream(self, stream: str) -> Dict:
+        return self.streams.setdefault(stream, {"seen": [], "etag": ""})
+
+    def etag(self, stream: str) -> str:
+        """목록 API 조건부 요청용 ETag (전체 수집 모드에서는 빈 값)"""
+        if full_scan():
+            return ""
+        return self._stream(stream).get("etag", "")
+
+    def set_etag(self, stream: str, etag: Optional[str]) -> None:
+        if etag:
+            self._stream(stream)["etag"] = etag
+
+    def seen_ids(self, stream: str) -> Set[str]:
+        """이미 본 게시글 ID (전체 수집 모드에서는 빈 집합)"""
+        if full_scan():
+            return set()
+        return set(self._stream(stream)["seen"])
+
+    def take_new(self, stream: str, items: Iterable, key: Callable) -> List:
+        """
+        목록에서 아직 본 적 없는 게시글만 반환 (목록 순서 유지)
+        이미 본 글에서 멈추지 않고 건너뜀: 상단 고정 공지는 더 오래된 글이라 최신 글보다 앞에 나오므로
+        """
+        seen = set(self._stream(stream)["seen"])
+        fresh: List = []
+        skipped = 0
+        for item in items:
+            if str(key(item)) in seen:
+                skipped += 1
+                continue
+            fresh.append(item)
+        print(f"[state] {self.source}:{stream} 새 게시글 {len(fresh)}개" + (f" (이미 본 게시글 {skipped}개 제외)" if skipped else ""))
+        return fresh
+
+    def mark_seen(self, stream: str, keys: Iterable) -> None:
+        """본문까지 수집한 게시글 ID 기록 (최신 MAX_SEEN개 유지, 저장은 save() 호출 시)"""
+        s = self._stream(stream)
+        new_keys = [str(k) for k in keys]
+        fresh = set(new_keys)
+        s["seen"] = (new_keys + [k for k in s["seen"] if k not in fresh])[:MAX_SEEN]
+
+    def commit(self, stream: str, keys: List, ok: List[bool], etag: str = "") -> None:
+        """
+        take_new로 받은 게시글(최신순)의 수집 결과 기록
+        본문 수집에 실패한 글(retry로 표시한 글 포함)이 있으면 그보다 최신 글은 기록하지 않아, 다음 실행에서 실패한 글까지 다시 스캔
+        ETag도 모두 성공했을 때만 갱신
+        """
+        ok = [good and (stream, str(k)) not in self._retry for k, good in zip(keys, ok)]
+        failed = [i for i, good in enumerate(ok) if not good]
+        start = failed[-1] + 1 if failed else 0
+        self.mark_seen(stream, keys[start:])
+        if not failed:
+            self.set_etag(stream, etag)
+
+    def track(self, stream: str, key, url: str) -> None:
+        """수집한 게시글의 URL -> (stream, ID) (파서가 URL만으로 retry 할 수 있도록)"""
+        self._urls[url] = (stream, str(key))
+
+    def retry(self, url: str) -> None:
+        """
+        게시글 간 참조(버전 -> 업데이트일 등)를 못 찾은 게시글: 본 것으로 기록하지 않아 다음 실행에서 다시 파싱
+        commit 전이면 실패로 처리하고, 이미 commit됐으면 그 글과 더 최신 글을 기록에서 되돌림 (ETag도 비움)
+        """
+        found = self._urls.get(url)
+        if not found:
+            return
+        stream, key = found
+        self._retry.add(found)
+        s = self._stream(stream)
+        if key in s["seen"]:
+            s["seen"] = s["seen"][s["seen"].index(key) + 1:]
+            s["etag"] = ""
+
+    def context_for(self, name: str) -> Dict:
+        """게시글 간 참조 캐시 (dict를 직접 갱신하면 save() 시 함께 저장)"""
+        return self.context.setdefault(name, {})
+
+    def save(self) -> None:
+        """변경이 있을 때만 저장 (변경 없는 실행이 커밋을 만들지 않도록)"""
+        if self._snapshot() == self._loaded:
+            print(f"[state] {self.source}: 변경 없음")
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        data = {
+            "source": self.source,
+            "updated_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "streams": self.streams,
+            "context": self.context,
+        }
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        self._loaded = self._snapshot()
+        print(f"[state] {self.source}: 저장 ({self.path})")
@@ -5,12 +5,14 @@ Nitter 인스턴스를 사용하여 API 키 없이 트윗 수집
 """
 import sys
 import io
-import json
-import re
 from datetime import datetime
 import feedparser
 from typing import List, Dict, Tuple
 
+from date_extract import first, ymd
+from post_classifier import PostClassifier, keyword_rules
+from update_store import SourceBatch, merge_into_store
+
 # Windows 콘솔 인코딩 문제 해결
 if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
@@ -28,7 +30,7 @@ ACCOUNTS = {
     "zzz": "ZZZ_KO",  # 젠레스 존 제로 한국 공식
 }
 
-# 키워드 감지
+# 키워드 감지 (post_classifier로 트윗당 한 번만 훑음)
 KEYWORDS = {
     "star_rail": ["워프", "이벤트 워프", "픽업", "확률 UP", "출시"],
     "zzz": ["채널", "기간 한정", "픽업", "확률 UP", "출시"],
@@ -64,36 +66,17 @@ def fetch_tweets(account: str, instance: str) -> List[Dict]:
         return []
 
 def extract_date_from_tweet(text: str) -> Tuple[str, str]:
-    """트윗에서 날짜 범위 추출"""
-    # 패턴 1: MM/DD ~ MM/DD
-    m = re.search(r"(\d{1,2})/(\d{1,2})\s*[~\-–—]\s*(\d{1,2})/(\d{1,2})", text)
-    if m:
-        year = datetime.now().year
-        start = f"{year}-{int(m.group(1)):02d}-{int(m.group(2)):02d}"
-        end = f"{year}-{int(m.group(3)):02d}-{int(m.group(4)):02d}"
-        return start, end
-    
-    # 패턴 2: YYYY/MM/DD ~ YYYY/MM/DD
-    m = re.search(r"(\d{4})/(\d{1,2})/(\d{1,2})\s*[~\-–—]\s*(\d{4})/(\d{1,2})/(\d{1,2})", text)
-    if m:
-        start = f"{m.group(1)}-{int(m.group(2)):02d}-{int(m.group(3)):02d}"
-        end = f"{m.group(4)}-{int(m.group(5)):02d}-{int(m.group(6)):02d}"
-        return start, end
-    
-    # 패턴 3: X월 X일 ~ X월 X일
-    m = re.search(r"(\d{1,2})\s*월\s*(\d{1,2})\s*일\s*[~\-–—]\s*(\d{1,2})\s*월\s*(\d{1,2})\s*일", text)
-    if m:
-        year = datetime.now().year
-        start = f"{year}-{int(m.group(1)):02d}-{int(m.group(2)):02d}"
-        end = f"{year}-{int(m.group(3)):02d}-{int(m.group(4)):02d}"
-        return start, end
-    
-    return "", ""
+    """트윗에서 날짜 범위 추출: MM/DD ~ MM/DD > YYYY/MM/DD ~ YYYY/MM/DD > X월 X일 ~ X월 X일 (date_extract)"""
+    c = first(text, "range_slash_md", "range_ymd_slash", "range_md")
+    if not c:
+        return "", ""
+    year = datetime.now().year
+    return ymd(c.fields.get("y", year), c["m"], c["d"]), ymd(c.fields.get("y2", year), c["m2"], c["d2"])
 
 def parse_tweets(game_id: str, tweets: List[Dict]) -> List[Dict]:
     """트윗에서 업데이트 정보 파싱"""
     updates = []
-    keywords = KEYWORDS.get(game_id, [])
+    classifier = PostClassifier(keyword_rules("text", KEYWORDS.get(game_id, [])))
     
     for tweet in tweets:
         title = tweet["title"]
@@ -101,7 +84,7 @@ def parse_tweets(game_id: str, tweets: List[Dict]) -> List[Dict]:
         full_text = f"{title}\n{desc}"
         
         # 키워드 매칭
-        if not any(kw in full_text for kw in keywords):
+        if "match" not in classifier.classify(text=full_text):
             continue
         
         print(f"\n🔍 키워드 감지: {title[:60]}")
@@ -133,11 +116,8 @@ def parse_tweets(game_id: str, tweets: List[Dict]) -> List[Dict]:
     
     return updates
 
-def main():
-    print("=" * 60)
-    print("X(트위터) RSS 피드 스크래퍼")
-    print("=" * 60)
-    
+def collect() -> SourceBatch:
+    """계정별 트윗 수집 + 파싱 (병합 전 결과)"""
     all_updates = []
     
     # 각 게임별로 스크래핑
@@ -159,42 +139,33 @@ def main():
         updates = parse_tweets(game_id, tweets)
         all_updates.extend(updates)
         print(f"  📊 총 {len(updates)}개 업데이트 감지")
+    return SourceBatch("twitter", all_updates)
+
+
+def main():
+    print("=" * 60)
+    print("X(트위터) RSS 피드 스크래퍼")
+    print("=" * 60)
+    
+    all_updates = collect().updates
     
     # 기존 데이터와 병합
     print("\n" + "=" * 60)
     print("기존 데이터와 병합")
     print("=" * 60)
     
-    try:
-        with open('data/updates.json', 'r', encoding='utf-8') as f:
-            existing_data = json.load(f)
-    except FileNotFoundError:
-        existing_data = []
-    
-    print(f"기존 업데이트 수: {len(existing_data)}")
     print(f"새로운 업데이트 수: {len(all_updates)}")
     
-    # 중복 제거
-    def key(u):
-        return f"{u.get('game_id')}|{u.get('update_date')}|{u.get('description','')[:40]}"
-    
-    existing_keys = {key(u) for u in existing_data}
-    added = 0
+    # game_id|version|update_date|description 키로 upsert (update_store)
+    added: List[Dict] = []
+    stats = merge_into_store(all_updates, added, label="twitter")
+    for update in added:
+        print(f"  ✅ 추가: {update['game_id']} - {update['description'][:50]}")
     
-    for update in all_updates:
-        if key(update) not in existing_keys:
-            existing_data.append(update)
-            added += 1
-            print(f"  ✅ 추가: {update['game_id']} - {update['description'][:50]}")
-    
-    if added > 0:
-        with open('data/updates.json', 'w', encoding='utf-8') as f:
-            json.dump(existing_data, f, ensure_ascii=False, indent=2)
-        print(f"\n✅ {added}개 새 업데이트 추가 완료!")
+    if stats["added"] or stats["updated"]:
+        print(f"\n✅ {stats['added']}개 새 업데이트 추가, {stats['updated']}개 갱신 완료!")
     else:
         print(f"\n✅ 새로운 업데이트 없음")
-    
-    print(f"최종 업데이트 수: {len(existing_data)}")
 
 if __name__ == "__main__":
     main()
@@ -18,7 +18,7 @@ def test_fixed_crawling():
     
     try:
         print("니케 게시판 크롤링 테스트...")
-        posts = fetch_board_posts(nikke_url, max_items=5)  # 5개만 테스트
+        posts = list(fetch_board_posts(nikke_url, max_items=5))  # 5개만 테스트
         
         print(f"\n=== 결과: {len(posts)}개 게시글 수집 ===")
         for i, post in enumerate(posts):
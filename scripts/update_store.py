@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+"""
+업데이트 저장소 (SQLite, 기본 .cache/updates.db)
+- game_id|version|update_date|description 키로 upsert (인덱스 조회라 기존 이력 크기와 무관)
+- 소스(game_id 접두사) + 월 단위 범위 삭제 (scrape_comingsoon의 기간 교체)
+- 병합(apply_to_store / merge_into_store)은 DB만 갱신하므로 비용이 변경분 크기에 비례
+  바뀐 키는 pending 테이블에 남겨 두고, data/updates.json과 shard 내보내기는 별도 단계 (export_pending)
+  run_all / compact_updates / quick_add_update / export_updates.py가 실행 끝에 한 번만 내보냄
+- 내보내기는 merge_engine 정규 순서로 기록하고 내용이 같으면 쓰지 않음
+  (필드 순서만 다른 항목은 같은 항목으로 보아 갱신으로 집계하지 않음)
+
+DB는 로컬 캐시이며 data/updates.json이 원본. DB에 기록된 JSON 해시와 현재 파일이 다르면
+(다른 워크플로/수동 편집/새 체크아웃) 열 때 JSON에서 다시 적재하고, 아직 내보내지 않은 변경(pending)을 그 위에 다시 반영
+
+여러 스크래퍼를 동시에 실행해도 되도록 병합과 내보내기는 updates.json 잠금 안에서 하고,
+내보내기는 적재 시점 해시와 비교하는 compare-and-swap (잠금을 쓰지 않는 수동 편집 등과 충돌하면 다시 적재해 재시도)
+
+만료 항목은 archive_expired로 data/archive/에 옮기고, 보관된 키(툼스톤)는 upsert에서 건너뜀 (archive_store)
+"""
+
+import json
+import os
+import re
+import sqlite3
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from archive_store import archive_dir, archive_items, is_expired, load_tombstones
+from atomic_io import ConflictError, atomic_write, compare_and_swap, dumps_json, file_lock, read_bytes
+from export_shards import export_shards
+from merge_engine import canonical_fields, canonical_updates, new_stats, record_stats, update_key
+
+
+UPDATES_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data", "updates.json"))
+DB_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".cache", "updates.db"))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS updates (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    key TEXT NOT NULL UNIQUE,
+    game_id TEXT NOT NULL,
+    month INTEGER,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_updates_month_game ON updates (month, game_id);
+CREATE TABLE IF NOT EXISTS meta (
+    name TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS pending (
+    key TEXT PRIMARY KEY,
+    data TEXT
+);
+"""
+
+_ISO_MONTH = re.compile(r"^\d{4}-(\d{1,2})")
+
+
+def update_month(u: Dict) -> Optional[int]:
+    """YYYY-MM-DD... 형식 update_date의 월 (그 외 형식은 None)"""
+    m = _ISO_MONTH.match(str(u.get("update_date") or ""))
+    return int(m.group(1)) if m else None
+
+
+class UpdateStore:
+    def __init__(self, db_path: str = DB_PATH, json_path: str = UPDATES_PATH):
+        self.db_path = db_path
+        self.json_path = json_path
+        self.loaded_digest = ""
+        self.archive_dir = archive_dir(json_path)
+        self.tombstones = load_tombstones(self.archive_dir)
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self.conn = sqlite3.connect(db_path)
+        self.conn.executescript(_SCHEMA)
+        self.sync_from_json()
+
+    def __enter__(self) -> "UpdateStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def _meta(self, name: str) -> str:
+        row = self.conn.execute("SELECT value FROM meta WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else ""
+
+    def _set_meta(self, name: str, value: str) -> None:
+        self.conn.execute("INSERT OR REPLACE INTO meta (name, value) VALUES (?, ?)", (name, value))
+
+    def sync_from_json(self, force: bool = False) -> bool:
+        """updates.json이 마지막 적재/내보내기 이후 바뀌었으면 DB를 다시 적재. 적재했으면 True"""
+        raw, digest = read_bytes(self.json_path)
+        self.loaded_digest = digest
+        if not force and digest and digest == self._meta("json_sha1"):
+            return False
+        try:
+            existing = json.loads(raw.decode("utf-8")) if raw is not None else []
+        except Exception:
+            existing = []
+        with self.conn:
+            self.conn.execute("DELETE FROM updates")
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO updates (key, game_id, month, data) VALUES (?, ?, ?, ?)",
+                ((update_key(u), str(u.get("game_id", "")), update_month(u),
+                  json.dumps(canonical_fields(u), ensure_ascii=False))
+                 for u in existing),
+            )
+            self._set_meta("json_sha1", digest)
+        count = self.count()
+        dropped = len(existing) - count
+        print(f"[update_store] updates.json에서 {count}개 적재" + (f" (중복 키 {dropped}개 제외)" if dropped else ""))
+        replayed = self._replay_pending()
+        if replayed:
+            print(f"[update_store] 내보내지 않은 변경 {replayed}개 다시 반영")
+        return True
+
+    def _replay_pending(self) -> int:
+        """다시 적재한 DB에 pending(아직 내보내지 않은 추가/갱신/삭제)을 반영"""
+        rows = self.conn.execute("SELECT key, data FROM pending").fetchall()
+        with self.conn:
+            for key, data in rows:
+                if data is None:
+                    self.conn.execute("DELETE FROM updates WHERE key = ?", (key,))
+                    continue
+                u = json.loads(data)
+                self.conn.execute(
+                    "INSERT INTO updates (key, game_id, month, data) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT(key) DO UPDATE SET data = excluded.data",
+                    (key, str(u.get("game_id", "")), update_month(u), data),
+                )
+        return len(rows)
+
+    def _mark_pending(self, rows: Iterable[Tuple[str, Optional[str]]]) -> None:
+        """(키, 항목 JSON - 삭제면 None)을 내보내기 대기로 기록 (트랜잭션 안에서 호출)"""
+        self.conn.executemany("INSERT OR REPLACE INTO pending (key, data) VALUES (?, ?)", rows)
+
+    def pending_count(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM pending").fetchone()[0]
+
+    def count(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM updates").fetchone()[0]
+
+    def upsert(self, updates: Iterable[Dict], added: Optional[List[Dict]] = None) -> Dict[str, int]:
+        """
+        키가 없으면 추가, 있으면 내용이 달라졌을 때만 갱신 (기존 순서 유지). merge_engine.new_stats() 형식 건수 반환
+        이미 보관된 키(툼스톤)는 추가하지 않음 (archived로 집계)
+        added 리스트를 주면 새로 추가된 항목을 담아줌 (로그용)
+        """
+        stats = new_stats()
+        with self.conn:
+            for u in updates:
+                key = update_key(u)
+                if key in self.tombstones:
+                    stats["archived"] += 1
+                    continue
+                data = json.dumps(canonical_fields(u), ensure_ascii=False)
+                row = self.conn.execute("SELECT id, data FROM updates WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    self.conn.execute(
+                        "INSERT INTO updates (key, game_id, month, data) VALUES (?, ?, ?, ?)",
+                        (key, str(u.get("game_id", "")), update_month(u), data),
+                    )
+                    self._mark_pending([(key, data)])
+                    stats["added"] += 1
+                    if added is not None:
+                        added.append(u)
+                elif row[1] != data:
+                    self.conn.execute("UPDATE updates SET data = ? WHERE id = ?", (data, row[0]))
+                    self._mark_pending([(key, data)])
+                    stats["updated"] += 1
+                else:
+                    stats["unchanged"] += 1
+        return stats
+
+    def _range_where(self, prefixes: Sequence[str]) -> Tuple[str, List[str]]:
+        like = " OR ".join("game_id LIKE ? ESCAPE '\\'" for _ in prefixes)
+        patterns = [p.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%" for p in prefixes]
+        return like, patterns
+
+    def range_rows(self, prefixes: Sequence[str], months: Sequence[int],
+                   undated: Optional[Callable[[Dict], bool]] = None) -> List[Tuple[int, str]]:
+        """
+        game_id가 prefixes 중 하나로 시작하고 update_date의 월이 months에 있는 항목의 (id, key)
+        월을 알 수 없는 형식(연도만, TBA 등)은 undated(entry)가 True인 경우만 포함
+        """
+        if not prefixes:
+            return []
+        like, patterns = self._range_where(prefixes)
+        rows: List[Tuple[int, str]] = []
+        if months:
+            marks = ",".join("?" for _ in months)
+            rows += self.conn.execute(
+                f"SELECT id, key FROM updates WHERE month IN ({marks}) AND ({like})", [*months, *patterns]).fetchall()
+        if undated:
+            for row_id, key, data in self.conn.execute(
+                    f"SELECT id, key, data FROM updates WHERE month IS NULL AND ({like})", patterns):
+                if undated(json.loads(data)):
+                    rows.append((row_id, key))
+        return rows
+
+    def delete_range(self, prefixes: Sequence[str], months: Sequence[int],
+                     undated: Optional[Callable[[Dict], bool]] = None) -> int:
+        """range_rows 구간 삭제, 삭제 건수 반환"""
+        rows = self.range_rows(prefixes, months, undated)
+        with self.conn:
+            self.conn.executemany("DELETE FROM updates WHERE id = ?", [(row_id,) for row_id, _ in rows])
+            self._mark_pending((key, None) for _, key in rows)
+        return len(rows)
+
+    def replace_window(self, prefixes: Sequence[str], months: Sequence[int], updates: List[Dict],
+                       undated: Optional[Callable[[Dict], bool]] = None) -> Dict[str, int]:
+        """
+        소스별 교체 구간 (scrape_comingsoon의 기간 교체)
+        구간(range_rows)의 기존 항목 중 updates에 같은 키가 없는 것만 삭제하고 나머지는 upsert
+        다시 수집된 항목은 위치와 내용이 그대로라 변경 없음으로 집계
+        """
+        window = self.range_rows(prefixes, months, undated)
+        stats = self.upsert(updates)
+        incoming = {update_key(u) for u in updates}
+        stale = [(row_id, key) for row_id, key in window if key not in incoming]
+        with self.conn:
+            self.conn.executemany("DELETE FROM updates WHERE id = ?", [(row_id,) for row_id, _ in stale])
+            self._mark_pending((key, None) for _, key in stale)
+        stats["removed"] = len(stale)
+        return stats
+
+    def archive_expired(self, cutoff: str) -> Dict[str, int]:
+        """
+        마지막 날짜가 cutoff(YYYY-MM-DD)보다 이전인 항목을 연도별 보관 파일로 옮기고 삭제
+        보관 파일/툼스톤을 먼저 기록하므로 내보내기 전에 중단돼도 항목을 잃지 않음 (다음 실행에서 다시 정리)
+        """
+        expired: List[Tuple[int, str, Dict]] = []
+        for row_id, key, data in self.conn.execute("SELECT id, key, data FROM updates ORDER BY id"):
+            u = json.loads(data)
+            if is_expired(u, cutoff):
+                expired.append((row_id, key, u))
+        stats = new_stats()
+        if not expired:
+            return stats
+        counts = archive_items((u for _, _, u in expired), self.archive_dir)
+        with self.conn:
+            self.conn.executemany("DELETE FROM updates WHERE id = ?", [(row_id,) for row_id, _, _ in expired])
+            self._mark_pending((key, None) for _, key, _ in expired)
+        self.tombstones = load_tombstones(self.archive_dir)
+        stats["removed"] = len(expired)
+        yearly = ", ".join(f"{year}: +{n}" for year, n in counts.items()) or "모두 보관돼 있음"
+        print(f"[update_store] 만료 {len(expired)}개 보관 (~{cutoff}, {yearly})")
+        return stats
+
+    def all(self) -> List[Dict]:
+        """정규 순서(merge_engine.canonical_updates)의 전체 항목"""
+        return canonical_updates(json.loads(data) for (data,) in self.conn.execute("SELECT data FROM updates"))
+
+    def export_json(self, path: Optional[str] = None) -> int:
+        """
+        전체 항목을 updates.json 형식으로 내보내고 항목 수 반환 (임시 파일 + rename)
+        기존 파일과 내용이 같으면 쓰지 않음 (mtime/커밋/배포 캐시 유지)
+        json_path로 내보낼 때는 적재 이후 파일이 바뀌었으면 ConflictError (덮어쓰지 않음), 성공하면 pending 비움
+        """
+        path = path or self.json_path
+        items = self.all()
+        data = dumps_json(items)
+        if os.path.abspath(path) != os.path.abspath(self.json_path):
+            atomic_write(path, data)
+            return len(items)
+        raw, digest = read_bytes(path)
+        if raw != data:
+            digest = compare_and_swap(path, self.loaded_digest, data)
+        self.loaded_digest = digest
+        with self.conn:
+            self._set_meta("json_sha1", digest)
+            self.conn.execute("DELETE FROM pending")
+        return len(items)
+
+
+class SourceBatch:
+    """
+    한 소스의 수집 결과 (run_all은 여러 소스의 결과를 모아 updates.json에 한 번에 반영)
+    replace(store, updates)가 있으면 그 방식으로 반영 (예: comingsoon의 교체 구간), 없으면 upsert
+    state(scrape_state.SourceState)는 반영에 성공한 뒤에만 저장
+    """
+
+    def __init__(self, label: str, updates: List[Dict], state=None,
+                 replace: Optional[Callable[[UpdateStore, List[Dict]], Dict[str, int]]] = None):
+        self.label = label
+        self.updates = updates
+        self.state = state
+        self.replace = replace
+
+    def apply(self, store: UpdateStore, added: Optional[List[Dict]] = None) -> Dict[str, int]:
+        if self.replace:
+            return self.replace(store, self.updates)
+        return store.upsert(self.updates, added)
+
+
+def open_store() -> UpdateStore:
+    """UPDATE_DB 환경 변수로 DB 경로 변경 가능"""
+    return UpdateStore(os.getenv("UPDATE_DB", DB_PATH), UPDATES_PATH)
+
+
+def apply_to_store(apply: Callable[[UpdateStore], Dict[str, int]], label: str = "") -> Dict[str, int]:
+    """
+    updates.json 잠금 안에서 apply(store)를 DB에만 반영 (건수는 merge_engine.record_stats로 기록)
+    updates.json / shard는 바꾸지 않음: 실행 끝에 export_pending()으로 한 번만 내보냄
+    """
+    with file_lock(UPDATES_PATH), open_store() as store:
+        stats = apply(store)
+    record_stats(stats, label)
+    return stats
+
+
+def merge_into_store(updates: List[Dict], added: Optional[List[Dict]] = None, label: str = "") -> Dict[str, int]:
+    """upsert (스크래퍼 공용, 내보내기는 export_pending)"""
+    def apply(store: UpdateStore) -> Dict[str, int]:
+        if added is not None:
+            added.clear()
+        return store.upsert(updates, added)
+
+    return apply_to_store(apply, label)
+
+
+def export_pending(force: bool = False, retries: int = 3) -> Optional[int]:
+    """
+    아직 내보내지 않은 변경이 있으면(force면 항상) updates.json + 프론트엔드 shard를 내보내고 항목 수 반환, 없으면 None
+    내보내기가 충돌하면 최신 updates.json을 다시 적재(pending 재반영)해 재시도
+    """
+    for attempt in range(1, retries + 1):
+        with file_lock(UPDATES_PATH), open_store() as store:
+            pending = store.pending_count()
+            if not (pending or force):
+                print("[update_store] 내보낼 변경 없음")
+                return None
+            try:
+                count = store.export_json()
+                export_shards(store.all())
+                print(f"[update_store] updates.json 내보내기: {count}개 (변경 {pending}개)")
+                return count
+            except ConflictError as e:
+                if attempt == retries:
+                    raise
+                print(f"[update_store] {e}, 다시 적재 후 재시도 {attempt}/{retries - 1}")
+    return None
@@ -0,0 +1,9 @@
+import os
+import sys
+
+# scripts/ 모듈은 패키지가 아니라 스크립트 디렉터리 기준으로 import
+SCRIPTS = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "scripts"))
+if SCRIPTS not in sys.path:
+    sys.path.insert(0, SCRIPTS)
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
@@ -0,0 +1,52 @@
+"""
+archive_store: 연도만/연월만 있는 날짜도 그 기간이 끝나고 보존 기간이 지나면 만료
+"""
+
+import json
+import os
+from datetime import date
+
+import pytest
+
+from archive_store import archive_items, cutoff_date, is_expired, last_date
+
+
+def cutoff(today):
+    return cutoff_date(3, today)
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("2025년", "2025-12-31"),
+    ("2025", "2025-12-31"),
+    ("2025년 8월", "2025-08-31"),
+    ("2024-02", "2024-02-29"),
+    ("2025.12", "2025-12-31"),
+    ("2025-08-03", "2025-08-03"),
+    ("출시 예정", None),
+    ("2025년 4분기", None),
+])
+def test_last_date(value, expected):
+    assert last_date({"update_date": value}) == expected
+
+
+def test_year_only_expires_after_year_ends():
+    u = {"game_id": "steam_1", "update_date": "2025년"}
+    assert not is_expired(u, cutoff(date(2025, 12, 31)))
+    assert not is_expired(u, cutoff(date(2026, 3, 31)))
+    assert is_expired(u, cutoff(date(2026, 4, 1)))
+
+
+def test_year_month_expires_after_month_ends():
+    u = {"game_id": "steam_2", "update_date": "2025년 8월"}
+    assert not is_expired(u, cutoff(date(2025, 8, 31)))
+    assert not is_expired(u, cutoff(date(2025, 11, 30)))
+    assert is_expired(u, cutoff(date(2025, 12, 1)))
+    # end_date가 있으면 end_date 기준
+    assert not is_expired(dict(u, end_date="2025-12-20"), cutoff(date(2025, 12, 1)))
+
+
+def test_partial_dates_archived_by_year(tmp_path):
+    items = [{"game_id": "steam_1", "update_date": "2024년"}, {"game_id": "steam_2", "update_date": "2025년 1월"}]
+    assert archive_items(items, str(tmp_path)) == {"2024": 1, "2025": 1}
+    with open(os.path.join(tmp_path, "2024.json"), encoding="utf-8") as f:
+        assert json.load(f) == items[:1]
@@ -0,0 +1,58 @@
+"""
+content_root: 사이트별 저장된 상세 페이지에서 본문 선택자가 본문 영역만 잡는지
+선택자가 틀리면 페이지 전체로 대체되므로 사용한 선택자와 메뉴/댓글 제외 여부를 함께 확인
+"""
+
+import os
+
+import pytest
+from bs4 import BeautifulSoup
+
+import content_root
+from conftest import FIXTURES
+
+
+PAGES = {
+    "lounge": ("[레드 후드]가 특수 모집에 합류합니다", ["자유게시판", "댓글 128", "쥬얼 모아둔", "인기글", "이용약관"]),
+    "hoyolab": ("2025/01/21 11:59", ["로그인", "엘렌 뽑으러", "추천 게시글"]),
+}
+
+
+def page(site):
+    with open(os.path.join(FIXTURES, "content", f"{site}.html"), encoding="utf-8") as f:
+        return BeautifulSoup(f.read(), "html.parser")
+
+
+@pytest.fixture(autouse=True)
+def clean_stats(monkeypatch):
+    monkeypatch.delenv("CONTENT_ROOT", raising=False)
+    monkeypatch.delenv("CONTENT_STATS", raising=False)
+    monkeypatch.setattr(content_root, "_stats", {})
+
+
+@pytest.mark.parametrize("site", sorted(PAGES))
+def test_selector_finds_article_only(site):
+    text, selector = content_root.soup_text(page(site), site)
+    assert selector == content_root.CONTENT_ROOTS[site][0]
+    body, outside = PAGES[site]
+    assert body in text
+    for word in outside:
+        assert word not in text
+
+
+@pytest.mark.parametrize("site", sorted(PAGES))
+def test_full_page_only_with_stats(site, monkeypatch):
+    content_root.soup_text(page(site), site)
+    assert content_root.body_stats()[site]["measured"] == 0
+
+    monkeypatch.setenv("CONTENT_STATS", "1")
+    text, _ = content_root.soup_text(page(site), site)
+    s = content_root.body_stats()[site]
+    assert s["measured"] == 1 and s["full"] > len(text)
+
+
+def test_falls_back_to_full_page(monkeypatch):
+    monkeypatch.setenv("CONTENT_ROOT", "0")
+    text, selector = content_root.soup_text(page("lounge"), "lounge")
+    assert selector == "" and "댓글 128" in text
+    assert content_root.body_stats()["lounge"]["fallback"] == 1
@@ -0,0 +1,61 @@
+"""
+driver_pool: 워커가 한 번 임대한 채로 여러 페이지를 열어도 DRIVER_MAX_PAGE_LOADS마다 드라이버를 재활용하는지
+(Chrome 대신 가짜 드라이버)
+"""
+
+import pytest
+
+import driver_pool
+from driver_pool import DriverPool, imap_with_drivers, map_with_drivers
+
+
+class FakeDriver:
+    def __init__(self):
+        self.window_handles = ["main"]
+        self.switch_to = self
+        self.quit_called = False
+
+    def window(self, handle):
+        pass
+
+    def get(self, url):
+        pass
+
+    def delete_all_cookies(self):
+        pass
+
+    def quit(self):
+        self.quit_called = True
+
+
+@pytest.fixture
+def drivers(monkeypatch):
+    created = []
+
+    def create_driver(user_agent, debug_port):
+        created.append(FakeDriver())
+        return created[-1]
+
+    monkeypatch.setattr(driver_pool, "create_driver", create_driver)
+    return created
+
+
+def load(driver, url):
+    driver.get(url)
+    return driver.slot
+
+
+@pytest.mark.parametrize("run", [
+    lambda fn, items, pool: map_with_drivers(fn, items, workers=1, pool=pool),
+    lambda fn, items, pool: list(imap_with_drivers(fn, items, workers=1, pool=pool)),
+])
+def test_worker_recycles_driver_mid_run(drivers, run):
+    pool = DriverPool(size=1, max_page_loads=3)
+    slots = run(load, [f"https://example.com/{i}" for i in range(7)], pool)
+    # 3회마다 새 드라이버: 3 + 3 + 1
+    assert len(drivers) == 3 and pool.launches == 3
+    assert [slots.count(s) for s in dict.fromkeys(slots)] == [3, 3, 1]
+    assert drivers[0].quit_called and drivers[1].quit_called
+    # 마지막 드라이버는 재활용 한도 전이라 풀에 반납
+    assert not drivers[2].quit_called and pool._idle.qsize() == 1
+    pool.close()
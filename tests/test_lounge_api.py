@@ -0,0 +1,59 @@
+"""
+네이버 게임 라운지 API 파서 (tests/fixtures/lounge 의 목록/상세 응답을 http_client fixture 재생 모드로 사용)
+"""
+
+import os
+import shutil
+
+import pytest
+
+import http_client
+import lounge_api
+from conftest import FIXTURES
+
+
+BOARD_URL = "https://game.naver.com/lounge/nikke/board/48"
+
+
+@pytest.fixture(autouse=True)
+def replay(monkeypatch):
+    monkeypatch.setenv("HTTP_FIXTURE_DIR", os.path.join(FIXTURES, "lounge"))
+    monkeypatch.setenv("HTTP_FIXTURE_MODE", "replay")
+
+
+def test_fetch_board_posts_replays_list_and_detail():
+    posts = list(lounge_api.fetch_board_posts(BOARD_URL, max_items=20, workers=2))
+
+    assert [p["title"] for p in posts] == ["[업데이트] 업데이트 소식 사전 안내", "[안내] 특별 방송 사전 안내"]
+    assert [p["url"] for p in posts] == [
+        "https://game.naver.com/lounge/nikke/board/detail/4612093",
+        "https://game.naver.com/lounge/nikke/board/detail/4598110",
+    ]
+    # 목록에 본문(SmartEditor JSON)이 있는 글은 그대로, 없는 글은 상세 API에서
+    assert posts[0]["body"] == "\n".join([
+        "지휘관님, 업데이트 소식을 사전 안내드립니다.",
+        "■ 특수 모집",
+        "SSR 니케 [레드 후드] 특수 모집에 합류합니다.",
+        "기간: 2025년 9월 25일 점검 후 ~ 2025년 10월 16일 04:59",
+    ])
+    assert posts[1]["body"] == "지휘관님, 특별 방송 일정을 안내드립니다.\n일시: 9월 20일 20:00 (KST)"
+
+
+def test_fetch_board_posts_missing_detail_leaves_body_empty(monkeypatch, tmp_path):
+    """상세 요청이 실패하면 본문은 비워 두고 다음 실행에서 다시 시도"""
+    list_fixture = os.path.basename(http_client.fixture_path(
+        lounge_api.API_BASE.format(lounge_id="nikke") + "/feed",
+        {"boardId": "48", "buffFilteringYN": "N", "limit": 20, "offset": 0, "order": "NEW"},
+    ))
+    shutil.copy(os.path.join(FIXTURES, "lounge", list_fixture), tmp_path / list_fixture)
+    monkeypatch.setenv("HTTP_FIXTURE_DIR", str(tmp_path))
+
+    posts = list(lounge_api.fetch_board_posts(BOARD_URL, max_items=20, workers=1))
+
+    assert posts[0]["body"]
+    assert posts[1]["body"] == ""
+
+
+def test_contents_to_text_accepts_html():
+    assert lounge_api.contents_to_text("<p>점검 안내</p><p> 9월 25일 </p>") == "점검 안내\n9월 25일"
+    assert lounge_api.contents_to_text(None) == ""
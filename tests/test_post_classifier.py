@@ -0,0 +1,58 @@
+"""
+post_classifier.KeywordScanner: Aho-Corasick(pyahocorasick)과 정규식 대체 구현이 같은 키워드 집합을 반환하는지
+기준은 단순 포함 검사 {kw for kw in keywords if kw in text}
+"""
+
+import random
+
+import pytest
+
+import post_classifier
+from post_classifier import RULES, KeywordScanner, PostClassifier
+
+
+def scanner(keywords, backend, monkeypatch):
+    if backend == "regex":
+        monkeypatch.setattr(post_classifier, "ahocorasick", None)
+    else:
+        monkeypatch.setattr(post_classifier, "ahocorasick", pytest.importorskip("ahocorasick"))
+    return KeywordScanner(keywords)
+
+
+def expected(keywords, text):
+    return {kw for kw in keywords if kw in text}
+
+
+@pytest.mark.parametrize("backend", ["regex", "ahocorasick"])
+def test_overlapping_keywords(backend, monkeypatch):
+    # 접두사/접미사/중간 포함, 끝에 걸쳐 겹치는 키워드
+    keywords = ["특수모집", "모집", "특수", "모집에 합류", "합류", "AB", "BC", "ABCD", "CDE", "B"]
+    s = scanner(keywords, backend, monkeypatch)
+    for text in ["특수모집에 합류합니다", "ABCDE", "xxABCxx", "BCD", "특수 모집", "", "없음"]:
+        assert s.find(text) == expected(keywords, text), text
+
+
+@pytest.mark.parametrize("backend", ["regex", "ahocorasick"])
+def test_random_texts_match_reference(backend, monkeypatch):
+    rng = random.Random(7)
+    for _ in range(200):
+        keywords = {"".join(rng.choice("abc") for _ in range(rng.randint(1, 4))) for _ in range(rng.randint(1, 8))}
+        text = "".join(rng.choice("abcd") for _ in range(rng.randint(0, 40)))
+        assert scanner(keywords, backend, monkeypatch).find(text) == expected(keywords, text), (keywords, text)
+
+
+def test_backends_classify_the_same(monkeypatch):
+    ahocorasick = pytest.importorskip("ahocorasick")
+    posts = [
+        {"title": "업데이트 소식 사전 안내", "body": "SSR 니케 [레드 후드] 특수 모집에 합류합니다."},
+        {"title": "1.5 버전 「엘렌」 기간 한정 채널 (상)", "body": "1.5 버전 업데이트 후 ~ 2025/3/4 14:59"},
+        {"title": "특별 방송 예고", "body": "방송은 9월 20일 20:00(KST)"},
+    ]
+    results = {}
+    for name, module in (("regex", None), ("ahocorasick", ahocorasick)):
+        monkeypatch.setattr(post_classifier, "ahocorasick", module)
+        results[name] = [
+            {game: PostClassifier(rules).classify(flags=("ver",), **p).tags for game, rules in RULES.items()}
+            for p in posts
+        ]
+    assert results["regex"] == results["ahocorasick"]
@@ -0,0 +1,49 @@
+"""
+scrape_state.SourceState.take_new: 상단 고정 공지를 이미 봤어도 그 뒤의 새 게시글을 수집하는지
+ww_board_28.html (명조 공지 게시판 저장본)은 고정 공지 3개(6764321, 6718433, 6708711)가 최신 글보다 앞에 나옴
+"""
+
+import os
+
+from bs4 import BeautifulSoup
+
+import lounge_api
+from scrape_lounge import extract_board_posts
+from scrape_state import SourceState
+
+
+BOARD_URL = "https://game.naver.com/lounge/WutheringWaves/board/28"
+SNAPSHOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "ww_board_28.html")
+
+
+def key(p):
+    return lounge_api.feed_id_from_url(p["url"])
+
+
+def board_posts():
+    with open(SNAPSHOT, encoding="utf-8") as f:
+        return extract_board_posts(BeautifulSoup(f.read(), "html.parser"), BOARD_URL, 30)
+
+
+def run(state, posts):
+    fresh = state.take_new("board", posts, key=key)
+    state.commit("board", [key(p) for p in fresh], [True] * len(fresh))
+    return [key(p) for p in fresh]
+
+
+def test_pinned_posts_do_not_stop_incremental_scan(tmp_path, monkeypatch):
+    monkeypatch.delenv("SCRAPE_FULL", raising=False)
+    posts = board_posts()
+    assert [key(p) for p in posts[:4]] == ["6764321", "6718433", "6708711", "6768016"]
+
+    # 첫 실행: 최신 글 4개가 올라오기 전 목록 (고정 공지는 그대로 맨 위)
+    newest = {"6768016", "6767999", "6768000", "6767962"}
+    state = SourceState("lounge", str(tmp_path / "lounge.json"))
+    first = run(state, [p for p in posts if key(p) not in newest])
+    assert len(first) == len(posts) - len(newest)
+    state.save()
+
+    # 두 번째 실행: 고정 공지를 이미 봤어도 그 뒤의 새 글 4개를 수집
+    state = SourceState("lounge", str(tmp_path / "lounge.json"))
+    assert run(state, posts) == ["6768016", "6767999", "6768000", "6767962"]
+    assert run(state, posts) == []
@@ -0,0 +1,57 @@
+"""
+update_store: 병합은 DB만 갱신하고 updates.json은 export_pending에서 한 번만 내보내는지,
+내보내기 전에 updates.json이 바뀌어 다시 적재해도 아직 내보내지 않은 변경을 잃지 않는지
+"""
+
+import json
+import os
+
+import pytest
+
+import update_store
+from atomic_io import atomic_write, dumps_json
+
+
+def item(n, **extra):
+    return {"game_id": "nikke", "version": "", "update_date": f"2099-01-{n:02d}", "description": f"이벤트 {n}", **extra}
+
+
+@pytest.fixture
+def paths(tmp_path, monkeypatch):
+    json_path = str(tmp_path / "data" / "updates.json")
+    os.makedirs(os.path.dirname(json_path))
+    atomic_write(json_path, dumps_json([item(1), item(2)]))
+    monkeypatch.setattr(update_store, "UPDATES_PATH", json_path)
+    monkeypatch.setenv("UPDATE_DB", str(tmp_path / "updates.db"))
+    monkeypatch.setattr(update_store, "export_shards", lambda updates: None)
+    monkeypatch.delenv("MERGE_STATS_PATH", raising=False)
+    return json_path
+
+
+def read(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_merge_updates_db_only_until_export(paths):
+    stats = update_store.merge_into_store([item(2, url="https://example.com/2"), item(3)])
+    assert (stats["added"], stats["updated"]) == (1, 1)
+    assert read(paths) == [item(1), item(2)]
+
+    assert update_store.export_pending() == 3
+    assert [u["description"] for u in read(paths)] == ["이벤트 1", "이벤트 2", "이벤트 3"]
+    assert read(paths)[1]["url"] == "https://example.com/2"
+    # 더 내보낼 변경 없음
+    assert update_store.export_pending() is None
+
+
+def test_pending_survives_reload(paths):
+    update_store.merge_into_store([item(3)])
+    update_store.apply_to_store(lambda store: {**store.upsert([]), "removed": store.delete_range(["nikke"], [1])})
+    # 내보내기 전에 다른 곳에서 updates.json이 바뀜 -> 다시 적재 후 pending(추가 1, 삭제 3) 재반영
+    atomic_write(paths, dumps_json([item(1), item(2), item(4)]))
+    assert update_store.export_pending() == 1
+    assert read(paths) == [item(4)]
+    update_store.merge_into_store([item(5)])
+    assert update_store.export_pending() == 2
+    assert read(paths) == [item(4), item(5)]